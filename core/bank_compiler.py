@@ -0,0 +1,74 @@
+"""
+Compilador del banco de preguntas para Bingo Educativo
+Valida el árbol cartones/ y genera el snapshot del banco sin abrir la app.
+
+Uso:
+    python -m core.bank_compiler [--cartones DIR] [--salida ARCHIVO]
+"""
+
+from typing import Any, Dict, List, Optional
+import argparse
+import os
+import sys
+
+from .question_bank import (
+    QuestionBank, CARTONES_DIR, SNAPSHOT_PATH, ETAPAS_COMPILACION
+)
+from utils.constants import GameConfig
+
+
+def categorias_desconocidas(base_dir: str) -> List[str]:
+    """Carpetas de cartones/ que no figuran en GameConfig.CATEGORIES"""
+    if not os.path.isdir(base_dir):
+        return []
+    return [nombre for nombre in sorted(os.listdir(base_dir))
+            if os.path.isdir(os.path.join(base_dir, nombre))
+            and nombre not in GameConfig.CATEGORIES]
+
+
+def imprimir_informe(banco: QuestionBank, informe: Dict[str, Any], desconocidas: List[str]) -> None:
+    """Muestra problemas, conteos y tiempos por etapa"""
+    for ruta, error in informe['errores']:
+        print(f"[ERROR] {ruta}: {error}")
+    for categoria in desconocidas:
+        print(f"[ERROR] La categoría '{categoria}' no está en GameConfig.CATEGORIES")
+
+    print("\nPreguntas por categoría:")
+    for categoria, total in sorted(banco.conteos().items()):
+        print(f"  {categoria:<20} {total:>6}")
+    print(f"  {'TOTAL':<20} {banco.total_preguntas():>6}")
+    print(f"\nDescartadas: {len(informe['invalidas'])}  "
+          f"Duplicadas: {len(informe['duplicados'])}  "
+          f"Archivos con error: {len(informe['errores'])}")
+
+    print("\nTiempos:")
+    total = 0.0
+    for etapa in ETAPAS_COMPILACION:
+        segundos = informe['tiempos'][etapa]
+        total += segundos
+        print(f"  {etapa:<12} {segundos * 1000:>9.1f} ms")
+    print(f"  {'total':<12} {total * 1000:>9.1f} ms")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Valida y compila el banco de preguntas")
+    parser.add_argument('--cartones', default=CARTONES_DIR, help="Directorio con las categorías")
+    parser.add_argument('--salida', default=SNAPSHOT_PATH, help="Ruta del snapshot a generar")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.cartones):
+        print(f"[ERROR] No existe el directorio {args.cartones}")
+        return 2
+
+    banco = QuestionBank(args.cartones, args.salida)
+    informe: Dict[str, Any] = {}
+    banco.compilar(informe)
+    desconocidas = categorias_desconocidas(args.cartones)
+    imprimir_informe(banco, informe, desconocidas)
+
+    # El snapshot se escribe igualmente; el código de salida indica si hubo problemas
+    return 1 if informe['invalidas'] or informe['errores'] or desconocidas else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
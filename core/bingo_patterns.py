@@ -0,0 +1,159 @@
+"""
+Patrones de victoria para Bingo Educativo
+Cada patrón se compila a una máscara de bits sobre las casillas del cartón
+(casilla i -> bit i); comprobar un patrón es un AND y una comparación
+"""
+
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+
+class PatronBingo(NamedTuple):
+    """Patrón de victoria compilado"""
+    nombre: str
+    mascara: int
+
+
+# Patrones predefinidos que entiende compilar_patrones
+PATRONES_PREDEFINIDOS = ('lleno', 'fila', 'columna', 'diagonal')
+
+
+def mascara_casillas(casillas: Iterable[int]) -> int:
+    """Máscara con los bits de las casillas dadas"""
+    mascara = 0
+    for casilla in casillas:
+        mascara |= 1 << casilla
+    return mascara
+
+
+def patron_lleno(filas: int, columnas: int) -> PatronBingo:
+    return PatronBingo('lleno', (1 << (filas * columnas)) - 1)
+
+
+def patrones_filas(filas: int, columnas: int) -> List[PatronBingo]:
+    return [PatronBingo(f'fila_{fila + 1}', mascara_casillas(fila * columnas + c for c in range(columnas)))
+            for fila in range(filas)]
+
+
+def patrones_columnas(filas: int, columnas: int) -> List[PatronBingo]:
+    return [PatronBingo(f'columna_{columna + 1}', mascara_casillas(f * columnas + columna for f in range(filas)))
+            for columna in range(columnas)]
+
+
+def patrones_diagonales(filas: int, columnas: int) -> List[PatronBingo]:
+    """Las dos diagonales; solo existen en cartones cuadrados"""
+    if filas != columnas:
+        return []
+    return [PatronBingo('diagonal_principal', mascara_casillas(i * columnas + i for i in range(filas))),
+            PatronBingo('diagonal_secundaria', mascara_casillas(i * columnas + columnas - 1 - i for i in range(filas)))]
+
+
+def patron_personalizado(nombre: str, forma: Sequence[str]) -> PatronBingo:
+    """
+    Patrón a partir de un dibujo, una cadena por fila: 'X' marca una casilla
+    del patrón y cualquier otro carácter una casilla libre.
+
+    Ejemplo: patron_personalizado('esquinas', ['X...X', '.....', '.....', '.....', 'X...X'])
+    """
+    columnas = len(forma[0]) if forma else 0
+    if any(len(fila) != columnas for fila in forma):
+        raise ValueError(f"El patrón '{nombre}' tiene filas de distinto largo")
+    mascara = mascara_casillas(f * columnas + c for f, fila in enumerate(forma)
+                               for c, marca in enumerate(fila) if marca in 'Xx')
+    if not mascara:
+        raise ValueError(f"El patrón '{nombre}' no marca ninguna casilla")
+    return PatronBingo(nombre, mascara)
+
+
+def compilar_patrones(filas: int, columnas: int, nombres: Iterable[str] = ('lleno',),
+                      personalizados: Iterable[PatronBingo] = ()) -> Tuple[PatronBingo, ...]:
+    """
+    Compila los patrones predefinidos pedidos más los personalizados.
+
+    Raises:
+        ValueError: Si un nombre no es un patrón predefinido o un patrón no cabe en el cartón
+    """
+    constructores = {
+        'lleno': lambda: [patron_lleno(filas, columnas)],
+        'fila': lambda: patrones_filas(filas, columnas),
+        'columna': lambda: patrones_columnas(filas, columnas),
+        'diagonal': lambda: patrones_diagonales(filas, columnas),
+    }
+    patrones: List[PatronBingo] = []
+    for nombre in nombres:
+        if nombre not in constructores:
+            raise ValueError(f"Patrón desconocido: {nombre} (disponibles: {', '.join(PATRONES_PREDEFINIDOS)})")
+        patrones.extend(constructores[nombre]())
+    casillas = filas * columnas
+    for patron in personalizados:
+        if patron.mascara >> casillas:
+            raise ValueError(f"El patrón '{patron.nombre}' no cabe en un cartón de {filas}x{columnas}")
+        patrones.append(patron)
+    return tuple(patrones)
+
+
+class MarcadorBingo:
+    """
+    Casillas marcadas de un cartón como entero y patrón ganador.
+
+    Al marcar solo se comprueban los patrones que incluyen esa casilla, así
+    que saber si hay bingo es leer `ganador`, sin recorrer el cartón.
+    """
+    __slots__ = ('patrones', 'marcadas', 'ganador', '_por_casilla')
+
+    def __init__(self, patrones: Sequence[PatronBingo]):
+        self.patrones = tuple(patrones)
+        self.marcadas = 0
+        self.ganador: Optional[PatronBingo] = None
+        self._por_casilla = _patrones_por_casilla(self.patrones)
+
+    def marcar(self, casilla: int) -> Optional[PatronBingo]:
+        """Marca una casilla; devuelve el patrón ganador si lo hay"""
+        self.marcadas |= 1 << casilla
+        if self.ganador is None:
+            marcadas = self.marcadas
+            for patron in self._por_casilla.get(casilla, ()):
+                if marcadas & patron.mascara == patron.mascara:
+                    self.ganador = patron
+                    break
+        return self.ganador
+
+    def desmarcar(self, casilla: int) -> None:
+        bit = 1 << casilla
+        if not self.marcadas & bit:
+            return
+        self.marcadas &= ~bit
+        if self.ganador is not None and self.ganador.mascara & bit:
+            # Puede que otro patrón siga completo
+            self.ganador = next((patron for patron in self.patrones
+                                 if self.marcadas & patron.mascara == patron.mascara), None)
+
+    def reiniciar(self) -> None:
+        self.marcadas = 0
+        self.ganador = None
+
+    def marcada(self, casilla: int) -> bool:
+        return bool(self.marcadas >> casilla & 1)
+
+    def cantidad(self) -> int:
+        """Número de casillas marcadas"""
+        return bin(self.marcadas).count('1')
+
+
+# Los cartones de una partida comparten patrones: el mapa casilla -> patrones
+# se calcula una vez por conjunto de patrones
+_cache_por_casilla: Dict[Tuple[PatronBingo, ...], Dict[int, Tuple[PatronBingo, ...]]] = {}
+
+
+def _patrones_por_casilla(patrones: Tuple[PatronBingo, ...]) -> Dict[int, Tuple[PatronBingo, ...]]:
+    por_casilla = _cache_por_casilla.get(patrones)
+    if por_casilla is None:
+        listas: Dict[int, List[PatronBingo]] = {}
+        for patron in patrones:
+            mascara, casilla = patron.mascara, 0
+            while mascara:
+                if mascara & 1:
+                    listas.setdefault(casilla, []).append(patron)
+                mascara >>= 1
+                casilla += 1
+        por_casilla = _cache_por_casilla[patrones] = {casilla: tuple(lista) for casilla, lista in listas.items()}
+    return por_casilla
@@ -0,0 +1,160 @@
+"""
+Análisis de conjuntos de cartones para Bingo Educativo
+Construye la matriz de incidencia cartones x preguntas con NumPy y calcula
+solapamientos, cobertura por pregunta y rondas esperadas hasta el primer
+bingo, sin recorrer pares de cartones en Python
+"""
+
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .question_record import CartonJuego
+
+
+# Filas de la matriz de solapamiento que se calculan a la vez
+FILAS_POR_BLOQUE = 1024
+
+# Partidas simuladas para estimar las rondas hasta el primer bingo
+SIMULACIONES_BINGO = 200
+
+
+def _requerir_numpy() -> None:
+    if np is None:
+        raise ImportError("El análisis de cartones necesita NumPy (pip install numpy)")
+
+
+def matriz_incidencia(cartones: Iterable[Any]) -> Tuple[Any, Any]:
+    """
+    Matriz booleana cartones x preguntas (True si el cartón tiene la pregunta).
+    Acepta CartonJuego o secuencias de ids, como los que generan main.py y
+    generate_multiplayer_game.
+
+    Returns:
+        (matriz, ids de pregunta de cada columna)
+    """
+    _requerir_numpy()
+    listas = [carton.preguntas if isinstance(carton, CartonJuego) else tuple(carton) for carton in cartones]
+    largos = np.fromiter((len(preguntas) for preguntas in listas), dtype=np.intp, count=len(listas))
+    todas = np.fromiter((pregunta_id for preguntas in listas for pregunta_id in preguntas),
+                        dtype=np.int64, count=int(largos.sum()))
+    columnas_ids, columnas = np.unique(todas, return_inverse=True)
+    matriz = np.zeros((len(listas), len(columnas_ids)), dtype=bool)
+    matriz[np.repeat(np.arange(len(listas)), largos), columnas] = True
+    return matriz, columnas_ids
+
+
+def matriz_solapamiento(matriz: Any) -> Any:
+    """
+    Preguntas compartidas por cada par de cartones (un solo producto de
+    matrices). Es n x n: para miles de cartones usar distribucion_solapamientos.
+    """
+    _requerir_numpy()
+    incidencia = matriz.astype(np.float32)
+    return (incidencia @ incidencia.T).astype(np.int32)
+
+
+def distribucion_solapamientos(matriz: Any, filas_por_bloque: int = FILAS_POR_BLOQUE) -> Any:
+    """
+    Cuántos pares de cartones comparten 0, 1, 2... preguntas. Calcula el
+    producto por bloques de filas para no guardar la matriz n x n completa.
+    """
+    _requerir_numpy()
+    cartones = matriz.shape[0]
+    conteos = np.zeros(int(matriz.sum(axis=1).max(initial=0)) + 1, dtype=np.int64)
+    # Una pregunta que está en un solo cartón no aporta a ningún par: con
+    # pools grandes esto quita la mayoría de las columnas del producto
+    incidencia = matriz[:, cobertura_preguntas(matriz) > 1].astype(np.float32)
+    for inicio in range(0, cartones, filas_por_bloque):
+        fin = min(inicio + filas_por_bloque, cartones)
+        # Solo pares (i, j) con j > i: columnas desde `inicio` y triángulo superior del bloque
+        bloque = (incidencia[inicio:fin] @ incidencia[inicio:].T).astype(np.int64)
+        superior = np.triu(np.ones(bloque.shape, dtype=bool), k=1)
+        conteos += np.bincount(bloque[superior], minlength=len(conteos))[:len(conteos)]
+    return conteos
+
+
+def cobertura_preguntas(matriz: Any) -> Any:
+    """Número de cartones que tienen cada pregunta (por columna)"""
+    _requerir_numpy()
+    return matriz.sum(axis=0)
+
+
+def rondas_primer_bingo(matriz: Any, simulaciones: int = SIMULACIONES_BINGO,
+                        semilla: Optional[int] = None) -> Any:
+    """
+    Ronda del primer bingo en `simulaciones` partidas simuladas. Cada partida
+    saca las preguntas de los cartones en orden aleatorio (como
+    preguntas_de_cartones) y supone respuestas correctas: un cartón canta
+    bingo en la ronda en que sale la última de sus preguntas.
+    """
+    _requerir_numpy()
+    rng = np.random.default_rng(semilla)
+    cartones, preguntas = matriz.shape
+    if cartones == 0 or preguntas == 0:
+        return np.zeros(0, dtype=np.int64)
+    largos = matriz.sum(axis=1)
+    # Índices de columna de cada cartón, rellenando con su primera pregunta si es más corto
+    _, columnas = np.nonzero(matriz)
+    finales = np.cumsum(largos)
+    indices = np.minimum(np.arange(largos.max())[None, :], largos[:, None] - 1) + (finales - largos)[:, None]
+    por_carton = columnas[indices]
+
+    rondas = np.empty(simulaciones, dtype=np.int64)
+    # Lotes de simulaciones para acotar la memoria (simulaciones x cartones x casillas)
+    lote = max(1, min(simulaciones, 2 ** 24 // max(1, por_carton.size)))
+    for inicio in range(0, simulaciones, lote):
+        fin = min(inicio + lote, simulaciones)
+        # Ronda (desde 1) en que sale cada pregunta: una permutación aleatoria por simulación
+        ronda = rng.permuted(np.tile(np.arange(1, preguntas + 1, dtype=np.int32), (fin - inicio, 1)), axis=1)
+        rondas[inicio:fin] = ronda[:, por_carton].max(axis=2).min(axis=1)
+    return rondas
+
+
+def informe_balance(cartones: Iterable[Any], simulaciones: int = SIMULACIONES_BINGO,
+                    semilla: Optional[int] = None) -> Dict[str, Any]:
+    """Resumen del conjunto de cartones para revisarlo antes de una partida"""
+    matriz, ids = matriz_incidencia(cartones)
+    distribucion = distribucion_solapamientos(matriz)
+    pares = int(distribucion.sum())
+    cobertura = cobertura_preguntas(matriz)
+    rondas = rondas_primer_bingo(matriz, simulaciones, semilla)
+    usados = np.nonzero(distribucion)[0]
+    return {
+        'cartones': int(matriz.shape[0]),
+        'preguntas': int(matriz.shape[1]),
+        'distribucion_solapamientos': distribucion.tolist(),
+        'solapamiento_medio': float((distribucion * np.arange(len(distribucion))).sum() / pares) if pares else 0.0,
+        'solapamiento_maximo': int(usados[-1]) if len(usados) else 0,
+        'cobertura': {
+            'minima': int(cobertura.min()) if len(cobertura) else 0,
+            'media': float(cobertura.mean()) if len(cobertura) else 0.0,
+            'maxima': int(cobertura.max(initial=0)),
+            'mas_repetidas': ids[np.argsort(-cobertura, kind='stable')[:5]].tolist()
+        },
+        'rondas_primer_bingo': {
+            'media': float(rondas.mean()) if len(rondas) else 0.0,
+            'p10': float(np.percentile(rondas, 10)) if len(rondas) else 0.0,
+            'p90': float(np.percentile(rondas, 90)) if len(rondas) else 0.0
+        }
+    }
+
+
+def imprimir_balance(informe: Dict[str, Any]) -> None:
+    """Muestra el informe de balance en consola"""
+    print(f"[BALANCE] {informe['cartones']} cartones, {informe['preguntas']} preguntas distintas")
+    print("[BALANCE] Pares de cartones por preguntas compartidas:")
+    for compartidas, pares in enumerate(informe['distribucion_solapamientos']):
+        if pares:
+            print(f"  {compartidas:>3} {pares:>12}")
+    print(f"[BALANCE] Solapamiento medio {informe['solapamiento_medio']:.2f}, "
+          f"máximo {informe['solapamiento_maximo']}")
+    cobertura = informe['cobertura']
+    print(f"[BALANCE] Cartones por pregunta: mín {cobertura['minima']}, "
+          f"media {cobertura['media']:.1f}, máx {cobertura['maxima']}")
+    rondas = informe['rondas_primer_bingo']
+    print(f"[BALANCE] Rondas hasta el primer bingo: media {rondas['media']:.1f} "
+          f"(p10 {rondas['p10']:.0f}, p90 {rondas['p90']:.0f})")
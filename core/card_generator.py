@@ -0,0 +1,161 @@
+"""
+Generador de cartones para Bingo Educativo
+Elige las preguntas de cada cartón por muestreo sin reemplazo sobre ids
+enteros del banco, en O(k) por cartón
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import random
+
+from .question_record import CartonJuego
+
+
+# Preguntas por cartón (2 filas x 4 columnas)
+PREGUNTAS_POR_CARTON = 8
+
+# Máximo de preguntas compartidas entre dos cartones de una sala
+SOLAPAMIENTO_MAXIMO = PREGUNTAS_POR_CARTON // 2
+
+# Reintentos por cartón antes de dar por imposible el conjunto
+INTENTOS_POR_CARTON = 20
+
+
+class CardGenerator:
+    """
+    Motor de generación de cartones reutilizable.
+
+    Trabaja sobre una secuencia de ids de RegistroPregunta; no copia ni
+    compara preguntas. Falla al construirse si el pool no alcanza para
+    llenar un cartón, en lugar de quedarse buscando preguntas que no existen.
+    """
+
+    def __init__(self, ids: Iterable[int], preguntas_por_carton: int = PREGUNTAS_POR_CARTON,
+                 rng: Optional[random.Random] = None):
+        if preguntas_por_carton <= 0:
+            raise ValueError("Un cartón necesita al menos una pregunta")
+        # dict.fromkeys conserva el orden y descarta ids repetidos
+        self.ids: Sequence[int] = tuple(dict.fromkeys(ids))
+        self.preguntas_por_carton = preguntas_por_carton
+        self.rng = rng or random.Random()
+        if len(self.ids) < preguntas_por_carton:
+            raise ValueError(f"Se necesitan al menos {preguntas_por_carton} preguntas para un cartón "
+                             f"y solo hay {len(self.ids)}")
+
+    def _nuevo_id(self, usados: set) -> str:
+        while True:
+            carton_id = f"carton_{self.rng.randint(100000, 999999)}"
+            if carton_id not in usados:
+                usados.add(carton_id)
+                return carton_id
+
+    def generar(self) -> CartonJuego:
+        """Genera un cartón"""
+        return self.generar_lote(1)[0]
+
+    def generar_lote(self, cantidad: int) -> List[CartonJuego]:
+        """
+        Genera `cantidad` cartones de una vez, con ids de cartón distintos.
+        Cada cartón es una muestra independiente sin reemplazo del pool.
+        """
+        if cantidad < 0:
+            raise ValueError("La cantidad de cartones no puede ser negativa")
+        usados: set = set()
+        return [CartonJuego(self._nuevo_id(usados), self.rng.sample(self.ids, self.preguntas_por_carton))
+                for _ in range(cantidad)]
+
+    def generar_conjunto(self, cantidad: int, max_solapamiento: int = SOLAPAMIENTO_MAXIMO,
+                         intentos: int = INTENTOS_POR_CARTON) -> List[CartonJuego]:
+        """
+        Genera `cantidad` cartones en los que dos cartones cualesquiera
+        comparten como mucho `max_solapamiento` preguntas.
+
+        Cada cartón se arma pregunta a pregunta con un índice invertido
+        (pregunta -> cartones que la tienen) y un contador de solapamiento con
+        cada cartón ya generado, así que nunca se comparan todos los pares.
+
+        Raises:
+            ValueError: Si con este pool no se logra cumplir la restricción
+        """
+        if cantidad < 0:
+            raise ValueError("La cantidad de cartones no puede ser negativa")
+        if max_solapamiento < 0:
+            raise ValueError("El solapamiento máximo no puede ser negativo")
+        if max_solapamiento >= self.preguntas_por_carton:
+            return self.generar_lote(cantidad)
+
+        indice: Dict[int, List[int]] = {}
+        cartones: List[CartonJuego] = []
+        usados: set = set()
+        for numero in range(cantidad):
+            for _ in range(intentos):
+                preguntas = self._armar_carton(indice, max_solapamiento)
+                if preguntas is not None:
+                    break
+            else:
+                raise ValueError(f"No se pudieron generar {cantidad} cartones con solapamiento máximo "
+                                 f"{max_solapamiento} a partir de {len(self.ids)} preguntas "
+                                 f"(se lograron {numero})")
+            for pregunta_id in preguntas:
+                indice.setdefault(pregunta_id, []).append(numero)
+            cartones.append(CartonJuego(self._nuevo_id(usados), preguntas))
+        return cartones
+
+    def _armar_carton(self, indice: Dict[int, List[int]], max_solapamiento: int) -> Optional[List[int]]:
+        """Intenta llenar un cartón respetando el solapamiento; None si no lo consigue"""
+        elegidas: List[int] = []
+        # Preguntas compartidas con cada cartón existente (solo los que tocamos)
+        solapamiento: Dict[int, int] = {}
+        for pregunta_id in self._orden_aleatorio():
+            cartones = indice.get(pregunta_id, ())
+            if any(solapamiento.get(carton, 0) >= max_solapamiento for carton in cartones):
+                continue
+            for carton in cartones:
+                solapamiento[carton] = solapamiento.get(carton, 0) + 1
+            elegidas.append(pregunta_id)
+            if len(elegidas) == self.preguntas_por_carton:
+                return elegidas
+        return None
+
+    def _orden_aleatorio(self) -> Iterator[int]:
+        """
+        Recorre el pool en orden aleatorio con un Fisher-Yates perezoso: cada
+        paso es O(1) y solo se guardan las posiciones intercambiadas.
+        """
+        total = len(self.ids)
+        intercambios: Dict[int, int] = {}
+        for i in range(total):
+            j = self.rng.randrange(i, total)
+            elegida = intercambios.get(j, j)
+            intercambios[j] = intercambios.get(i, i)
+            yield self.ids[elegida]
+
+
+def preguntas_de_cartones(cartones: Iterable[CartonJuego], rng: Optional[random.Random] = None) -> List[int]:
+    """Ids de todas las preguntas que aparecen en los cartones, sin repetir y barajados"""
+    ids = list(dict.fromkeys(pregunta_id for carton in cartones for pregunta_id in carton.preguntas))
+    (rng or random).shuffle(ids)
+    return ids
+
+
+def generar_partida(ids: Sequence[int], version_banco: str, semilla: int,
+                    jugadores: int) -> Tuple[List[CartonJuego], List[int]]:
+    """
+    Cartones de todos los asientos y orden global de preguntas de una partida.
+
+    Es una función pura de (ids, versión del banco, semilla, jugadores): el
+    anfitrión solo envía esos datos (los ids como la lista de categorías de
+    las que salen) y el asiento de cada cliente, y cada uno reconstruye lo
+    mismo con su copia local del banco.
+
+    Returns:
+        (cartón de cada asiento, ids de preguntas en orden de salida)
+    """
+    rng = random.Random(f"{version_banco}:{semilla}:{jugadores}")
+    generador = CardGenerator(ids, rng=rng)
+    try:
+        cartones = generador.generar_conjunto(jugadores)
+    except ValueError as e:
+        print(f"[WARNING] {e}; se generan cartones independientes")
+        cartones = generador.generar_lote(jugadores)
+    return cartones, preguntas_de_cartones(cartones, rng)
+
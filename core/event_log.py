@@ -0,0 +1,298 @@
+"""
+Registro binario de partidas de Bingo Educativo
+Guarda los eventos del motor de rondas (reparto, sorteo, respuestas, tiempo
+agotado, fin) en un formato compacto: una etiqueta de un byte y campos
+varint. reproducir() rehace el estado de la partida en cualquier ronda sin
+esperar los tiempos de juego, para revisar reclamos en torneos de clase o
+como corpus de pruebas de rendimiento.
+
+Formato:
+    cabecera   b'BGLE' + versión (1 byte)
+    evento     etiqueta (1 byte) + ms desde el evento anterior (varint) + campos
+    reparto    semilla, hay_jugador, cartones (id, preguntas), pool
+    sorteo     pregunta_id
+    respuesta  cartón, pregunta_id, correcta, opción + 1 (0 = IA), ms desde el sorteo
+    tiempo     (sin campos)
+    fin        ganador (cadena, vacía si se agotó el pool)
+
+Uso:
+    python -m core.event_log PARTIDA.bgl [--ronda N]
+"""
+
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+import argparse
+import struct
+import sys
+
+from .question_record import CartonJuego
+from .round_engine import (
+    EVENTO_FIN, EVENTO_PREGUNTA, EVENTO_REPARTO, EVENTO_RESPUESTA, EVENTO_RESPUESTAS_IA,
+    EVENTO_SIN_CARTON, EVENTO_TIEMPO_AGOTADO, RoundEngine
+)
+
+
+MAGIA = b'BGLE'
+VERSION_REGISTRO = 1
+CABECERA = struct.Struct('<4sB')
+
+# Etiquetas de evento
+REPARTO = 1
+SORTEO = 2
+RESPUESTA = 3
+TIEMPO = 4
+FIN = 5
+
+NOMBRES_EVENTO = {REPARTO: 'reparto', SORTEO: 'sorteo', RESPUESTA: 'respuesta', TIEMPO: 'tiempo', FIN: 'fin'}
+
+
+class EventoRegistrado(NamedTuple):
+    """Evento leído de un registro"""
+    tipo: int
+    momento: int  # ms de juego desde el inicio del registro
+    datos: Dict[str, Any]
+
+
+class RegistroInvalido(ValueError):
+    """El registro está truncado o no es un registro de partida"""
+
+
+# --- Codificación ---
+
+def escribir_varint(buffer: bytearray, valor: int) -> None:
+    """Entero sin signo en base 128 (LEB128)"""
+    if valor < 0:
+        raise ValueError(f"Los varint no admiten negativos: {valor}")
+    while valor >= 0x80:
+        buffer.append((valor & 0x7F) | 0x80)
+        valor >>= 7
+    buffer.append(valor)
+
+
+def leer_varint(datos: bytes, posicion: int) -> Tuple[int, int]:
+    """Lee un varint; devuelve (valor, posición siguiente)"""
+    valor = desplazamiento = 0
+    while True:
+        if posicion >= len(datos):
+            raise RegistroInvalido("Registro truncado")
+        byte = datos[posicion]
+        posicion += 1
+        valor |= (byte & 0x7F) << desplazamiento
+        if byte < 0x80:
+            return valor, posicion
+        desplazamiento += 7
+
+
+def escribir_cadena(buffer: bytearray, texto: str) -> None:
+    codificado = texto.encode('utf-8')
+    escribir_varint(buffer, len(codificado))
+    buffer += codificado
+
+
+def leer_cadena(datos: bytes, posicion: int) -> Tuple[str, int]:
+    largo, posicion = leer_varint(datos, posicion)
+    if posicion + largo > len(datos):
+        raise RegistroInvalido("Registro truncado")
+    return datos[posicion:posicion + largo].decode('utf-8'), posicion + largo
+
+
+# --- Escritura ---
+
+class EventLog:
+    """
+    Registro binario de una partida. Se conecta a un RoundEngine como oyente
+    y empieza de cero en cada reparto.
+    """
+
+    def __init__(self):
+        self.datos = bytearray()
+        self._ultimo = 0
+        self._sorteo = 0
+        self._motor: Optional[RoundEngine] = None
+
+    def conectar(self, motor: RoundEngine) -> None:
+        self._motor = motor
+        motor.suscribir(self.on_evento)
+
+    def desconectar(self) -> None:
+        if self._motor is not None:
+            self._motor.desuscribir(self.on_evento)
+            self._motor = None
+
+    def _evento(self, etiqueta: int) -> int:
+        """Escribe la cabecera del evento; devuelve el momento actual en ms"""
+        momento = int(round(self._motor.ahora * 1000)) if self._motor is not None else self._ultimo
+        self.datos.append(etiqueta)
+        escribir_varint(self.datos, max(0, momento - self._ultimo))
+        self._ultimo = max(self._ultimo, momento)
+        return momento
+
+    def on_evento(self, tipo: str, datos: Dict[str, Any]) -> None:
+        if tipo == EVENTO_REPARTO:
+            self.datos = bytearray(CABECERA.pack(MAGIA, VERSION_REGISTRO))
+            self._ultimo = self._sorteo = int(round(self._motor.ahora * 1000)) if self._motor is not None else 0
+            self._evento(REPARTO)
+            escribir_varint(self.datos, datos['semilla'])
+            escribir_varint(self.datos, int(datos['hay_jugador']))
+            escribir_varint(self.datos, len(datos['cartones']))
+            for carton in datos['cartones']:
+                escribir_cadena(self.datos, carton.id)
+                escribir_varint(self.datos, len(carton.preguntas))
+                for pregunta_id in carton.preguntas:
+                    escribir_varint(self.datos, pregunta_id)
+            escribir_varint(self.datos, len(datos['preguntas']))
+            for pregunta_id in datos['preguntas']:
+                escribir_varint(self.datos, pregunta_id)
+        elif not self.datos:
+            # Sin reparto no hay partida que registrar
+            return
+        elif tipo in (EVENTO_PREGUNTA, EVENTO_SIN_CARTON):
+            self._sorteo = self._evento(SORTEO)
+            escribir_varint(self.datos, datos['pregunta_id'])
+        elif tipo == EVENTO_RESPUESTA:
+            self._respuesta(datos['carton'], datos['pregunta_id'], datos['correcta'], datos.get('opcion'))
+        elif tipo == EVENTO_RESPUESTAS_IA:
+            # Primero los fallos: aplicadas una a una dejan el pool como la ronda en lote
+            for correcta, carton in sorted(zip(datos['correctas'], datos['cartones'])):
+                self._respuesta(carton, datos['pregunta_id'], correcta, None)
+        elif tipo == EVENTO_TIEMPO_AGOTADO:
+            self._evento(TIEMPO)
+        elif tipo == EVENTO_FIN:
+            self._evento(FIN)
+            escribir_cadena(self.datos, datos['ganador'] or '')
+
+    def _respuesta(self, carton: int, pregunta_id: int, correcta: bool, opcion: Optional[int]) -> None:
+        momento = self._evento(RESPUESTA)
+        escribir_varint(self.datos, carton)
+        escribir_varint(self.datos, pregunta_id)
+        escribir_varint(self.datos, int(correcta))
+        escribir_varint(self.datos, 0 if opcion is None else opcion + 1)
+        escribir_varint(self.datos, max(0, momento - self._sorteo))
+
+    def guardar(self, ruta: str) -> None:
+        with open(ruta, 'wb') as f:
+            f.write(self.datos)
+
+
+# --- Lectura y reproducción ---
+
+def leer_eventos(datos: bytes) -> Iterator[EventoRegistrado]:
+    """
+    Recorre los eventos de un registro.
+
+    Raises:
+        RegistroInvalido: Si la cabecera no corresponde o el registro está truncado
+    """
+    if len(datos) < CABECERA.size:
+        raise RegistroInvalido("Registro vacío")
+    magia, version = CABECERA.unpack_from(datos, 0)
+    if magia != MAGIA or version != VERSION_REGISTRO:
+        raise RegistroInvalido(f"No es un registro de partida compatible ({magia!r}, versión {version})")
+    posicion = CABECERA.size
+    momento = 0
+    while posicion < len(datos):
+        etiqueta = datos[posicion]
+        delta, posicion = leer_varint(datos, posicion + 1)
+        momento += delta
+        campos: Dict[str, Any] = {}
+        if etiqueta == REPARTO:
+            campos['semilla'], posicion = leer_varint(datos, posicion)
+            hay_jugador, posicion = leer_varint(datos, posicion)
+            campos['hay_jugador'] = bool(hay_jugador)
+            cantidad, posicion = leer_varint(datos, posicion)
+            cartones: List[Tuple[str, List[int]]] = []
+            for _ in range(cantidad):
+                carton_id, posicion = leer_cadena(datos, posicion)
+                largo, posicion = leer_varint(datos, posicion)
+                preguntas = []
+                for _ in range(largo):
+                    pregunta_id, posicion = leer_varint(datos, posicion)
+                    preguntas.append(pregunta_id)
+                cartones.append((carton_id, preguntas))
+            campos['cartones'] = cartones
+            largo, posicion = leer_varint(datos, posicion)
+            pool = []
+            for _ in range(largo):
+                pregunta_id, posicion = leer_varint(datos, posicion)
+                pool.append(pregunta_id)
+            campos['preguntas'] = pool
+        elif etiqueta == SORTEO:
+            campos['pregunta_id'], posicion = leer_varint(datos, posicion)
+        elif etiqueta == RESPUESTA:
+            campos['carton'], posicion = leer_varint(datos, posicion)
+            campos['pregunta_id'], posicion = leer_varint(datos, posicion)
+            correcta, posicion = leer_varint(datos, posicion)
+            campos['correcta'] = bool(correcta)
+            opcion, posicion = leer_varint(datos, posicion)
+            campos['opcion'] = opcion - 1 if opcion else None
+            campos['latencia'], posicion = leer_varint(datos, posicion)
+        elif etiqueta == FIN:
+            ganador, posicion = leer_cadena(datos, posicion)
+            campos['ganador'] = ganador or None
+        elif etiqueta != TIEMPO:
+            raise RegistroInvalido(f"Evento desconocido {etiqueta} en la posición {posicion - 1}")
+        yield EventoRegistrado(etiqueta, momento, campos)
+
+
+def reproducir(datos: bytes, ronda: Optional[int] = None) -> RoundEngine:
+    """
+    Rehace la partida aplicando los eventos registrados a un RoundEngine,
+    sin reloj ni azar. Con `ronda` se detiene al terminar esa ronda (antes
+    del siguiente sorteo); sin ella reproduce la partida completa.
+
+    El motor devuelto tiene los cartones, el pool, la ronda, la pregunta
+    actual y el ganador de ese momento; `ahora` son los segundos de juego.
+    """
+    motor = RoundEngine()
+    for evento in leer_eventos(datos):
+        campos = evento.datos
+        if evento.tipo == SORTEO:
+            if ronda is not None and motor.ronda >= ronda:
+                break
+            motor.ronda += 1
+            motor.pregunta_actual = campos['pregunta_id']
+        elif evento.tipo == REPARTO:
+            cartones = [CartonJuego(carton_id, preguntas) for carton_id, preguntas in campos['cartones']]
+            if campos['hay_jugador']:
+                motor.repartir(cartones[0], cartones[1:], campos['preguntas'], campos['semilla'])
+            else:
+                motor.repartir(None, cartones, campos['preguntas'], campos['semilla'])
+        elif evento.tipo == RESPUESTA:
+            motor.aplicar_respuesta(campos['carton'], campos['pregunta_id'], campos['correcta'])
+        elif evento.tipo == TIEMPO:
+            motor.aplicar_tiempo_agotado(motor.pregunta_actual)
+        elif evento.tipo == FIN:
+            motor.en_curso = False
+            motor.ganador = campos['ganador']
+        motor.ahora = evento.momento / 1000
+    return motor
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Muestra y reproduce un registro de partida")
+    parser.add_argument('registro', help="Archivo .bgl")
+    parser.add_argument('--ronda', type=int, default=None, help="Ronda en la que detener la reproducción")
+    parser.add_argument('--eventos', action='store_true', help="Listar todos los eventos")
+    args = parser.parse_args(argv)
+
+    try:
+        with open(args.registro, 'rb') as f:
+            datos = f.read()
+        if args.eventos:
+            for evento in leer_eventos(datos):
+                print(f"{evento.momento / 1000:>9.3f} s  {NOMBRES_EVENTO[evento.tipo]:<10} {evento.datos}")
+        motor = reproducir(datos, args.ronda)
+    except (OSError, RegistroInvalido) as e:
+        print(f"[ERROR] {e}")
+        return 2
+
+    print(f"Ronda {motor.ronda} ({motor.ahora:.1f} s de juego), semilla {motor.semilla}")
+    print(f"Pregunta actual: {motor.pregunta_actual}  Preguntas en el pool: {len(motor.pool)}")
+    for nombre, aciertos, desaciertos in motor.estadisticas():
+        print(f"  {nombre:<10} aciertos {aciertos:>3}  desaciertos {desaciertos:>3}")
+    if not motor.en_curso:
+        print(f"Ganador: {motor.ganador or 'ninguno (pool agotado)'}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -12,6 +12,9 @@ from dataclasses import dataclass, field
 from enum import Enum
 
 from .state_manager import state_manager, GameStatus, Player, GameState
+from .question_bank import question_bank
+from .question_pool import QuestionPool
+from .bingo_patterns import MarcadorBingo, compilar_patrones
 
 
 class QuestionDifficulty(Enum):
@@ -44,6 +47,10 @@ class Question:
         }
 
 
+# Patrones de victoria del cartón 3x3: 3 en línea (filas, columnas y diagonales)
+CARD_PATTERNS = compilar_patrones(3, 3, ('fila', 'columna', 'diagonal'))
+
+
 @dataclass
 class BingoCard:
     """Modelo de cartón de bingo"""
@@ -51,41 +58,19 @@ class BingoCard:
     questions: List[Question]
     player_id: str
     marked_questions: List[int] = field(default_factory=list)
+    marker: MarcadorBingo = field(default_factory=lambda: MarcadorBingo(CARD_PATTERNS), repr=False, compare=False)
     
     def mark_question(self, question_index: int) -> bool:
         """Marca una pregunta como respondida"""
-        if 0 <= question_index < len(self.questions) and question_index not in self.marked_questions:
+        if 0 <= question_index < len(self.questions) and not self.marker.marcada(question_index):
             self.marked_questions.append(question_index)
+            self.marker.marcar(question_index)
             return True
         return False
     
     def check_bingo(self) -> bool:
-        """Verifica si hay bingo (3 en línea)"""
-        if len(self.marked_questions) < 3:
-            return False
-        
-        # Verificar líneas horizontales
-        for row in range(3):
-            row_questions = [row * 3 + col for col in range(3)]
-            if all(q in self.marked_questions for q in row_questions):
-                return True
-        
-        # Verificar líneas verticales
-        for col in range(3):
-            col_questions = [row * 3 + col for row in range(3)]
-            if all(q in self.marked_questions for q in col_questions):
-                return True
-        
-        # Verificar diagonales
-        diagonal1 = [0, 4, 8]  # Diagonal principal
-        diagonal2 = [2, 4, 6]  # Diagonal secundaria
-        
-        if all(q in self.marked_questions for q in diagonal1):
-            return True
-        if all(q in self.marked_questions for q in diagonal2):
-            return True
-        
-        return False
+        """Verifica si hay bingo (3 en línea); el marcador lo actualiza al marcar"""
+        return self.marker.ganador is not None
     
     def get_completion_percentage(self) -> float:
         """Obtiene el porcentaje de completado del cartón"""
@@ -101,12 +86,16 @@ class GameManager:
     def __init__(self):
         self.state_manager = state_manager
         self.questions_database: Dict[str, List[Question]] = {}
+        self.game_categories: List[str] = []
         self.current_game_cards: Dict[str, BingoCard] = {}
+        # Pool de sorteo (ids) de las categorías de la partida
+        self.question_pool: QuestionPool[str] = QuestionPool()
+        self.pool_questions: Dict[str, Question] = {}
         self.game_timer: Optional[datetime] = None
         self.question_timer: Optional[datetime] = None
         self.max_question_time = 30  # segundos
         
-        # Cargar preguntas al inicializar
+        # Leer el manifiesto de preguntas al inicializar
         self._load_questions()
         
         # Suscribirse a cambios de estado
@@ -114,46 +103,42 @@ class GameManager:
         self.state_manager.subscribe('players', self._on_players_change)
     
     def _load_questions(self) -> None:
-        """Carga todas las preguntas desde los archivos JSON"""
-        categories_path = "cartones"
-        
-        if not os.path.exists(categories_path):
-            print(f"Warning: Directorio {categories_path} no encontrado")
+        """Lee el manifiesto del banco; las preguntas se cargan bajo demanda"""
+        if not os.path.exists(question_bank.base_dir):
+            print(f"Warning: Directorio {question_bank.base_dir} no encontrado")
             return
         
-        for category_dir in os.listdir(categories_path):
-            category_path = os.path.join(categories_path, category_dir)
-            if os.path.isdir(category_path):
-                self._load_category_questions(category_dir, category_path)
+        question_bank.cargar()
+        print(f"Banco disponible: {question_bank.total_preguntas()} preguntas "
+              f"en {len(question_bank.categorias())} categorías")
+    
+    def _get_category_questions(self, category: str) -> List[Question]:
+        """Devuelve las preguntas de una categoría, cargándolas la primera vez"""
+        if category not in self.questions_database:
+            self._load_category_questions(category)
+        return self.questions_database.get(category, [])
     
-    def _load_category_questions(self, category: str, category_path: str) -> None:
+    def _load_category_questions(self, category: str) -> None:
         """Carga preguntas de una categoría específica"""
         questions = []
         
-        for filename in os.listdir(category_path):
-            if filename.endswith('.json'):
-                file_path = os.path.join(category_path, filename)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        
-                    if 'preguntas' in data:
-                        for i, q_data in enumerate(data['preguntas']):
-                            question = Question(
-                                id=f"{category}_{filename}_{i}",
-                                text=q_data['pregunta'],
-                                options=q_data['opciones'],
-                                correct_answer=q_data['opciones'].index(q_data['respuesta_correcta']),
-                                category=category,
-                                difficulty=QuestionDifficulty.MEDIUM  # Por defecto
-                            )
-                            questions.append(question)
-                            
-                except Exception as e:
-                    print(f"Error cargando {file_path}: {e}")
-        
+        for q_data in question_bank.preguntas_categoria(category):
+            try:
+                question = Question(
+                    id=q_data['id'],
+                    text=q_data['pregunta'],
+                    options=q_data['opciones'],
+                    correct_answer=q_data['opciones'].index(q_data['respuesta_correcta']),
+                    category=category,
+                    difficulty=QuestionDifficulty.MEDIUM  # Por defecto
+                )
+                questions.append(question)
+            except Exception as e:
+                print(f"Error cargando pregunta {q_data.get('id')}: {e}")
+        
+        # Registrar también las categorías vacías para no volver a consultarlas
+        self.questions_database[category] = questions
         if questions:
-            self.questions_database[category] = questions
             print(f"Cargadas {len(questions)} preguntas de categoría '{category}'")
     
     def start_game(self, config: Dict[str, Any]) -> bool:
@@ -176,6 +161,7 @@ class GameManager:
             
             # Generar cartones
             self._generate_cards(config.get('categories', []))
+            self._build_question_pool()
             
             # Iniciar juego
             self.state_manager.set_game_status(GameStatus.PLAYING)
@@ -219,7 +205,8 @@ class GameManager:
     def _generate_cards(self, categories: List[str]) -> None:
         """Genera cartones para todos los jugadores"""
         if not categories:
-            categories = list(self.questions_database.keys())
+            categories = question_bank.categorias()
+        self.game_categories = list(categories)
         
         for player in self.state_manager.get_state('players'):
             card_questions = self._select_questions_for_card(categories, 9)  # 3x3 cartón
@@ -234,8 +221,7 @@ class GameManager:
         """Selecciona preguntas aleatorias para un cartón"""
         all_questions = []
         for category in categories:
-            if category in self.questions_database:
-                all_questions.extend(self.questions_database[category])
+            all_questions.extend(self._get_category_questions(category))
         
         if len(all_questions) < num_questions:
             # Si no hay suficientes preguntas, repetir algunas
@@ -244,18 +230,22 @@ class GameManager:
         
         return random.sample(all_questions, num_questions)
     
+    def _build_question_pool(self) -> None:
+        """Arma una vez por partida el pool de sorteo con las categorías elegidas"""
+        self.pool_questions = {}
+        for category in self.game_categories:
+            for question in self._get_category_questions(category):
+                self.pool_questions.setdefault(question.id, question)
+        self.question_pool = QuestionPool(self.pool_questions)
+    
     def _setup_next_question(self) -> None:
         """Configura la siguiente pregunta del juego"""
-        # Seleccionar pregunta aleatoria de todas las categorías
-        all_questions = []
-        for questions in self.questions_database.values():
-            all_questions.extend(questions)
-        
-        if not all_questions:
+        # Seleccionar pregunta aleatoria del pool de la partida
+        if not self.question_pool:
             self.state_manager.set_state('error_message', 'No hay preguntas disponibles')
             return
         
-        selected_question = random.choice(all_questions)
+        selected_question = self.pool_questions[self.question_pool.elegir()]
         self.state_manager.set_state('current_question', selected_question.to_dict())
         self.question_timer = datetime.now()
         
@@ -292,8 +282,9 @@ class GameManager:
         is_correct = answer_index == current_question['correct_answer']
         
         if is_correct:
-            # Marcar pregunta como correcta
+            # Marcar pregunta como correcta y sacarla del sorteo
             player_card.mark_question(question_index)
+            self.question_pool.quitar(current_question['id'])
             
             # Actualizar puntaje
             player = next((p for p in self.state_manager.get_state('players') if p.id == player_id), None)
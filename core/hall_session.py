@@ -0,0 +1,167 @@
+"""
+Sesión de bingo de 75 bolas para salones con miles de cartones
+Los cartones se guardan en una matriz NumPy uint8 (cartones x 25) y las
+marcas en una máscara de bits por cartón: cantar un número marca todos los
+cartones que lo tienen de una vez y los ganadores salen de una reducción
+sobre esas máscaras, sin un objeto por cartón
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .bingo_patterns import PatronBingo, compilar_patrones
+
+
+TOTAL_NUMEROS = 75
+LADO = 5
+CASILLAS = LADO * LADO
+NUMEROS_POR_COLUMNA = TOTAL_NUMEROS // LADO
+
+# Patrones que cantan bingo por defecto en un salón
+PATRONES_SALON = ('fila', 'columna', 'diagonal')
+
+
+def _requerir_numpy() -> None:
+    if np is None:
+        raise ImportError("La sesión de salón necesita NumPy (pip install numpy)")
+
+
+def generar_cartones(cantidad: int, semilla: Optional[int] = None) -> Any:
+    """
+    Cartones aleatorios (cantidad x 25, uint8) en el orden de BingoCardModel:
+    por columnas, 5 números de 1-15 (B), 5 de 16-30 (I)...
+    """
+    _requerir_numpy()
+    rng = np.random.default_rng(semilla)
+    # Para cada cartón y columna, los 5 primeros de una permutación de sus 15 números
+    elegidos = np.argsort(rng.random((cantidad, LADO, NUMEROS_POR_COLUMNA)), axis=2)[:, :, :LADO]
+    desplazamiento = (np.arange(LADO) * NUMEROS_POR_COLUMNA + 1)[None, :, None]
+    return (elegidos + desplazamiento).reshape(cantidad, CASILLAS).astype(np.uint8)
+
+
+class HallSession:
+    """
+    Partida de salón: cartones registrados, números cantados y ganadores.
+
+    Las filas de `numeros` siguen el orden por columnas de BingoCardModel;
+    las máscaras van por filas (bit = fila * 5 + columna), como en
+    core.bingo_patterns. Cada cartón se identifica por su número de serie
+    (`series`, por defecto 1..N), el que lleva impreso el cartón en papel.
+    """
+
+    def __init__(self, cartones: Any, series: Optional[Iterable[int]] = None,
+                 patrones: Union[Sequence[str], Sequence[PatronBingo]] = PATRONES_SALON):
+        """
+        Raises:
+            ValueError: Si los cartones no son de 25 números entre 1 y 75 sin repetir,
+                        las series se repiten o un patrón no existe
+        """
+        _requerir_numpy()
+        numeros = np.asarray(cartones)
+        if numeros.ndim != 2 or numeros.shape[1] != CASILLAS:
+            raise ValueError(f"Se esperan cartones de {CASILLAS} números (forma N x {CASILLAS})")
+        if numeros.size and (numeros.min() < 1 or numeros.max() > TOTAL_NUMEROS):
+            raise ValueError(f"Los números de los cartones deben estar entre 1 y {TOTAL_NUMEROS}")
+        numeros = numeros.astype(np.uint8)
+        repetidos = np.nonzero((np.diff(np.sort(numeros, axis=1), axis=1) == 0).any(axis=1))[0]
+        if len(repetidos):
+            raise ValueError(f"{len(repetidos)} cartones tienen números repetidos (p. ej. la fila {repetidos[0]})")
+        self.numeros = numeros
+
+        self.series = np.arange(1, len(numeros) + 1) if series is None else np.asarray(list(series))
+        if len(self.series) != len(numeros):
+            raise ValueError("Se necesita un número de serie por cartón")
+        self._filas: Dict[int, int] = {int(serie): fila for fila, serie in enumerate(self.series.tolist())}
+        if len(self._filas) != len(numeros):
+            raise ValueError("Hay números de serie repetidos")
+
+        if all(isinstance(patron, str) for patron in patrones):
+            self.patrones = compilar_patrones(LADO, LADO, patrones)
+        else:
+            self.patrones = compilar_patrones(LADO, LADO, (), patrones)
+        self._mascaras = np.array([patron.mascara for patron in self.patrones], dtype=np.int32)
+
+        # Número -> (filas, bits) de los cartones que lo tienen, en porciones de un arreglo ordenado
+        indices = np.arange(CASILLAS)
+        bits = np.left_shift(1, (indices % LADO) * LADO + indices // LADO).astype(np.int32)
+        planos = self.numeros.ravel()
+        orden = np.argsort(planos, kind='stable')
+        self._filas_por_numero = (orden // CASILLAS).astype(np.intp)
+        self._bits_por_numero = bits[orden % CASILLAS]
+        self._inicios = np.searchsorted(planos[orden], np.arange(TOTAL_NUMEROS + 2))
+
+        self.marcas = np.zeros(len(numeros), dtype=np.int32)
+        self.llamados: List[int] = []
+        self._llamado = np.zeros(TOTAL_NUMEROS + 1, dtype=bool)
+        # Serie -> patrón con el que ganó, en el orden en que fueron ganando
+        self.ganadores: Dict[int, PatronBingo] = {}
+
+    def __len__(self) -> int:
+        return len(self.numeros)
+
+    def reiniciar(self) -> None:
+        """Nueva partida con los mismos cartones"""
+        self.marcas[:] = 0
+        self.llamados = []
+        self._llamado[:] = False
+        self.ganadores = {}
+
+    def cantar(self, numero: int) -> List[int]:
+        """
+        Marca el número en todos los cartones que lo tienen y devuelve las
+        series de los cartones que completaron un patrón con él.
+        """
+        if not 1 <= numero <= TOTAL_NUMEROS:
+            raise ValueError(f"Número fuera de rango: {numero}")
+        if self._llamado[numero]:
+            return []
+        self._llamado[numero] = True
+        self.llamados.append(numero)
+
+        inicio, fin = self._inicios[numero], self._inicios[numero + 1]
+        filas = self._filas_por_numero[inicio:fin]
+        # Un cartón tiene cada número una sola vez: las filas no se repiten
+        self.marcas[filas] |= self._bits_por_numero[inicio:fin]
+
+        # Solo los cartones recién marcados pueden haber completado un patrón
+        marcas = self.marcas[filas][:, None]
+        completos = (marcas & self._mascaras[None, :]) == self._mascaras[None, :]
+        nuevos: List[int] = []
+        for posicion in np.nonzero(completos.any(axis=1))[0].tolist():
+            serie = int(self.series[filas[posicion]])
+            if serie not in self.ganadores:
+                self.ganadores[serie] = self.patrones[int(completos[posicion].argmax())]
+                nuevos.append(serie)
+        return nuevos
+
+    def ganadores_patron(self, patron: Union[str, PatronBingo]) -> List[int]:
+        """
+        Series de los cartones que tienen completo el patrón: uno compilado,
+        el nombre de un patrón de la sesión ('fila_1') o de uno predefinido
+        ('fila' vale cualquier fila, 'lleno' el cartón completo)
+        """
+        if isinstance(patron, PatronBingo):
+            patrones = [patron]
+        else:
+            patrones = [p for p in self.patrones if p.nombre == patron] or compilar_patrones(LADO, LADO, (patron,))
+        mascaras = np.array([p.mascara for p in patrones], dtype=np.int32)
+        completos = (self.marcas[:, None] & mascaras[None, :]) == mascaras[None, :]
+        return self.series[completos.any(axis=1)].tolist()
+
+    def verificar(self, serie: int) -> Optional[PatronBingo]:
+        """
+        Comprueba el bingo que canta el cartón `serie` con los números
+        cantados; devuelve el patrón completo o None.
+
+        Raises:
+            KeyError: Si el cartón no está registrado en la sesión
+        """
+        marcas = int(self.marcas[self._filas[serie]])
+        return next((patron for patron in self.patrones if marcas & patron.mascara == patron.mascara), None)
+
+    def numeros_carton(self, serie: int) -> List[int]:
+        return self.numeros[self._filas[serie]].tolist()
@@ -0,0 +1,121 @@
+"""
+IAs en lote para salas grandes de Bingo Educativo
+Guarda los cartones de todas las IAs en matrices NumPy: en cada ronda las
+IAs que tienen la pregunta responden con un solo vector de aciertos y el
+bingo se busca con una reducción sobre máscaras de bits, sin una llamada
+por IA
+"""
+
+from typing import Any, List, NamedTuple, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .question_record import CartonJuego
+
+
+# Casillas máximas por cartón: las marcas de cada IA se guardan en un int64
+MAX_CASILLAS = 63
+
+
+class RespuestasIA(NamedTuple):
+    """Resultado de una ronda en lote"""
+    cartones: Any      # posición (entre las IAs) de cada IA que respondió
+    casillas: Any      # casilla de la pregunta en cada uno de esos cartones
+    correctas: Any     # vector booleano de aciertos
+    ganador: Optional[int]
+
+
+def _requerir_numpy() -> None:
+    if np is None:
+        raise ImportError("Las IAs en lote necesitan NumPy (pip install numpy)")
+
+
+class MassAI:
+    """
+    Cartones de IA como matrices: ids de pregunta (IAs x casillas), casillas
+    respondidas y máscara de aciertos por IA.
+
+    Las casillas falladas quedan respondidas, como en responder_ia del motor.
+    Los CartonJuego no se tocan en cada ronda: sincronizar() les copia el
+    estado cuando hace falta mostrarlos (fin de partida, estadísticas).
+    """
+
+    def __init__(self, cartones: Sequence[CartonJuego], probabilidades: Sequence[float],
+                 semilla: Optional[int] = None):
+        _requerir_numpy()
+        if len(probabilidades) != len(cartones):
+            raise ValueError("Se necesita una probabilidad por cartón de IA")
+        casillas = {len(carton) for carton in cartones}
+        if len(casillas) > 1:
+            raise ValueError("Todos los cartones de IA deben tener el mismo número de casillas")
+        columnas = casillas.pop() if casillas else 0
+        if columnas > MAX_CASILLAS:
+            raise ValueError(f"Un cartón en lote admite hasta {MAX_CASILLAS} casillas")
+
+        self.cartones = list(cartones)
+        self.rng = np.random.default_rng(semilla)
+        self.probabilidades = np.asarray(probabilidades, dtype=np.float64)
+        self.preguntas = np.array([carton.preguntas for carton in cartones], dtype=np.int64).reshape(-1, columnas)
+        self.respondidas = np.zeros(self.preguntas.shape, dtype=bool)
+        self._sincronizadas = np.zeros(self.preguntas.shape, dtype=bool)
+        self.marcas = np.zeros(len(cartones), dtype=np.int64)
+        patrones = self.cartones[0].marcador.patrones if self.cartones else ()
+        self.patrones = np.array([patron.mascara for patron in patrones], dtype=np.int64)
+
+        # Pregunta -> (filas, columnas) ordenadas por pregunta para buscarlas con searchsorted
+        planas = self.preguntas.ravel()
+        orden = np.argsort(planas, kind='stable')
+        self._ids = planas[orden]
+        self._filas = (orden // max(columnas, 1)).astype(np.intp)
+        self._columnas = (orden % max(columnas, 1)).astype(np.intp)
+
+    def __len__(self) -> int:
+        return len(self.cartones)
+
+    def ubicaciones(self, pregunta_id: int) -> Any:
+        """(filas, columnas) de la pregunta en los cartones de IA"""
+        inicio, fin = np.searchsorted(self._ids, [pregunta_id, pregunta_id + 1])
+        return self._filas[inicio:fin], self._columnas[inicio:fin]
+
+    def pendientes(self, pregunta_id: int) -> Any:
+        """Filas de las IAs que tienen la pregunta sin responder"""
+        filas, columnas = self.ubicaciones(pregunta_id)
+        return filas[~self.respondidas[filas, columnas]]
+
+    def responder(self, pregunta_id: int) -> RespuestasIA:
+        """Todas las IAs con la pregunta pendiente responden a la vez"""
+        filas, columnas = self.ubicaciones(pregunta_id)
+        pendientes = ~self.respondidas[filas, columnas]
+        filas, columnas = filas[pendientes], columnas[pendientes]
+        correctas = self.rng.random(len(filas)) < self.probabilidades[filas]
+
+        self.respondidas[filas, columnas] = True
+        aciertos = filas[correctas]
+        self.marcas[aciertos] |= np.left_shift(np.int64(1), columnas[correctas].astype(np.int64))
+
+        ganador = None
+        if len(aciertos) and len(self.patrones):
+            # Solo las IAs que acertaron pueden haber completado un patrón
+            marcas = self.marcas[aciertos][:, None]
+            completos = ((marcas & self.patrones[None, :]) == self.patrones[None, :]).any(axis=1)
+            ganadores = aciertos[completos]
+            if len(ganadores):
+                # Como si respondieran en orden aleatorio: gana una al azar
+                ganador = int(ganadores[self.rng.integers(len(ganadores))])
+        return RespuestasIA(filas, columnas, correctas, ganador)
+
+    def sincronizar(self) -> None:
+        """Copia a los CartonJuego las respuestas que aún no tienen"""
+        filas, columnas = np.nonzero(self.respondidas & ~self._sincronizadas)
+        correctas = (np.right_shift(self.marcas[filas], columnas.astype(np.int64)) & 1).astype(bool)
+        for fila, casilla, correcta in zip(filas.tolist(), columnas.tolist(), correctas.tolist()):
+            carton = self.cartones[fila]
+            carton.marcar(carton.preguntas[casilla], correcta)
+        self._sincronizadas[filas, columnas] = True
+
+    def aciertos(self) -> List[int]:
+        """Casillas acertadas por IA"""
+        return [bin(marcas).count('1') for marcas in self.marcas.tolist()]
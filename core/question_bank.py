@@ -0,0 +1,609 @@
+"""
+Banco de preguntas compilado para Bingo Educativo
+Compila todos los archivos cartones/<categoria>/*.json(l) en un snapshot binario
+que se reutiliza mientras los archivos fuente no cambien
+"""
+
+from typing import Dict, List, Optional, Any, Tuple, Iterable, Iterator
+import os
+import hashlib
+import mmap
+import pickle
+import struct
+import sys
+import threading
+import bisect
+import time
+import unicodedata
+
+from .question_stream import EXTENSIONES_PREGUNTAS, iterar_preguntas
+from .question_record import RegistroPregunta, TablaPreguntas, serializar_tabla
+
+
+CARTONES_DIR = "cartones"
+SNAPSHOT_PATH = "question_bank.cache"
+SNAPSHOT_VERSION = 6
+
+# Cabecera del snapshot: identificador y longitud del manifiesto
+_MAGIA = b"QBNK"
+_CABECERA = struct.Struct('<4sQ')
+
+# (ruta relativa, mtime en ns, tamaño en bytes) de cada archivo fuente
+FirmaArchivo = Tuple[str, int, int]
+
+# Etapas de la compilación, en orden, para el informe de tiempos
+ETAPAS_COMPILACION = ('parseo', 'validacion', 'indice', 'escritura')
+
+
+class QuestionBank:
+    """
+    Banco de preguntas compartido por todos los cargadores del juego.
+
+    El snapshot empieza con un manifiesto (categoría, archivos, número de
+    preguntas y posición de sus datos) seguido de una tabla por categoría:
+    registros de tamaño fijo con offsets a un bloque de cadenas UTF-8. Al
+    arrancar solo se lee el manifiesto; el resto del archivo se abre con mmap
+    y los textos se decodifican cuando se muestran, de modo que varios
+    procesos comparten las mismas páginas.
+
+    Cada pregunta lleva una huella de su contenido normalizado. Las preguntas
+    repetidas (en otro archivo u otra categoría) se reducen a un id canónico,
+    el de su primera aparición, y las copias no se entregan. Las preguntas que
+    no pasan validar_pregunta() se descartan al compilar.
+
+    Para jugar se usan RegistroPregunta inmutables con ids enteros densos
+    (asignados por orden de categoría en el manifiesto) que todas las
+    partidas comparten sin copiarlos.
+    """
+
+    def __init__(self, base_dir: str = CARTONES_DIR, snapshot_path: str = SNAPSHOT_PATH):
+        self.base_dir = base_dir
+        self.snapshot_path = snapshot_path
+        self._manifiesto: Optional[Dict[str, Dict[str, Any]]] = None
+        self._cargadas: Dict[str, List[Dict[str, Any]]] = {}
+        self._registros: Dict[str, List[RegistroPregunta]] = {}
+        self._mapa: Optional[mmap.mmap] = None
+        self._tablas: Dict[str, TablaPreguntas] = {}
+        # Tablas que no se pudieron guardar en disco
+        self._tablas_memoria: Dict[str, bytes] = {}
+        self._claves: Dict[str, int] = {}
+        # Primer id entero de cada categoría, ordenado para búsqueda binaria
+        self._inicios: List[int] = []
+        self._orden_categorias: List[str] = []
+        self._firma: List[FirmaArchivo] = []
+        # El banco puede precargarse desde el hilo de arranque
+        self._lock = threading.RLock()
+
+    def _calcular_firma(self) -> List[FirmaArchivo]:
+        """Obtiene mtime y tamaño de cada archivo de preguntas sin leerlo"""
+        firma: List[FirmaArchivo] = []
+        if not os.path.isdir(self.base_dir):
+            return firma
+
+        for categoria in sorted(os.listdir(self.base_dir)):
+            categoria_dir = os.path.join(self.base_dir, categoria)
+            if not os.path.isdir(categoria_dir):
+                continue
+            for archivo in sorted(os.listdir(categoria_dir)):
+                if archivo.endswith(EXTENSIONES_PREGUNTAS):
+                    stat = os.stat(os.path.join(categoria_dir, archivo))
+                    firma.append((f"{categoria}/{archivo}", stat.st_mtime_ns, stat.st_size))
+        return firma
+
+    def cargar(self, forzar: bool = False) -> bool:
+        """
+        Asegura que el manifiesto del banco esté en memoria.
+
+        Args:
+            forzar: Vuelve a comprobar los archivos fuente aunque ya esté cargado
+
+        Returns:
+            True si hay al menos una pregunta disponible
+        """
+        with self._lock:
+            if self._manifiesto is not None and not forzar:
+                return self.total_preguntas() > 0
+
+            firma = self._calcular_firma()
+            if self._manifiesto is not None and firma == self._firma:
+                return self.total_preguntas() > 0
+
+            self._cerrar_mapa()
+            manifiesto = self._leer_manifiesto()
+            self._cargadas = {}
+            if manifiesto is None or manifiesto.get('firma') != firma:
+                manifiesto = self._compilar(firma, manifiesto)
+
+            self._manifiesto = manifiesto
+            self._firma = firma
+            self._indexar_ids()
+            return self.total_preguntas() > 0
+
+    def compilar(self, informe: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Recompila el banco completo desde los archivos fuente, sin reutilizar
+        bloques del snapshot anterior.
+
+        Args:
+            informe: Diccionario que se rellena con 'tiempos' (segundos por
+                etapa), 'invalidas' [(id, motivo)], 'errores' [(ruta, error)]
+                y 'duplicados'
+
+        Returns:
+            El manifiesto del snapshot escrito
+        """
+        with self._lock:
+            firma = self._calcular_firma()
+            self._cerrar_mapa()
+            self._cargadas = {}
+            self._manifiesto = self._compilar(firma, None, informe)
+            self._firma = firma
+            self._indexar_ids()
+            return self._manifiesto
+
+    def invalidar(self) -> None:
+        """Descarta el banco en memoria; la próxima consulta revalida el disco"""
+        self._cerrar_mapa()
+        self._manifiesto = None
+        self._cargadas = {}
+        self._firma = []
+        self._indexar_ids()
+
+    def _cerrar_mapa(self) -> None:
+        """
+        Libera el mmap del snapshot (necesario antes de reemplazar el archivo
+        en Windows). Los registros creados con él dejan de ser válidos.
+        """
+        self._tablas = {}
+        self._tablas_memoria = {}
+        self._registros = {}
+        if self._mapa is not None:
+            self._mapa.close()
+            self._mapa = None
+
+    def _indexar_ids(self) -> None:
+        """Asigna a cada categoría su rango de ids enteros según el manifiesto"""
+        self._registros = {}
+        self._claves = {}
+        self._inicios = []
+        self._orden_categorias = []
+        siguiente = 0
+        for categoria, entrada in (self._manifiesto or {}).get('categorias', {}).items():
+            self._inicios.append(siguiente)
+            self._orden_categorias.append(categoria)
+            siguiente += entrada['total']
+
+    # Compilación
+
+    def _parsear_categoria(self, categoria: str, archivos: List[FirmaArchivo],
+                           errores: Optional[List[Tuple[str, str]]] = None) -> List[Dict[str, Any]]:
+        """Lee y normaliza los archivos de preguntas de una categoría"""
+        return list(self._iterar_archivos(categoria, archivos, errores))
+
+    def _iterar_archivos(self, categoria: str, archivos: List[FirmaArchivo],
+                         errores: Optional[List[Tuple[str, str]]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Entrega las preguntas de los archivos indicados a medida que se leen.
+        Un error en un archivo conserva las preguntas leídas antes del fallo
+        y se añade a `errores` si se indica.
+        """
+        for ruta_relativa, _, _ in archivos:
+            archivo = ruta_relativa.split('/', 1)[1]
+            ruta_archivo = os.path.join(self.base_dir, categoria, archivo)
+            try:
+                for i, pregunta in enumerate(iterar_preguntas(ruta_archivo)):
+                    pregunta['categoria'] = categoria
+                    pregunta['id'] = f"{categoria}_{archivo}_{i}"
+                    pregunta['huella'] = huella_pregunta(pregunta)
+                    yield pregunta
+            except Exception as e:
+                print(f"Error procesando {ruta_archivo}: {e}")
+                if errores is not None:
+                    errores.append((ruta_relativa, str(e)))
+
+    def iterar_fuente(self, categoria: str) -> Iterator[Dict[str, Any]]:
+        """
+        Lee las preguntas de una categoría directamente de sus archivos, de una
+        en una, sin pasar por el snapshot. Útil para archivos muy grandes que
+        no conviene materializar completos.
+        """
+        archivos = [entrada for entrada in self._calcular_firma()
+                    if entrada[0].split('/', 1)[0] == categoria]
+        return self._iterar_archivos(categoria, archivos)
+
+    def _compilar(self, firma: List[FirmaArchivo], anterior: Optional[Dict[str, Any]],
+                  informe: Optional[Dict[str, Any]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Reconstruye el snapshot. Las categorías cuyos archivos no cambiaron
+        reutilizan su bloque binario del snapshot anterior (ya validado) sin
+        volver a leer los archivos fuente; el índice de huellas se recalcula
+        siempre.
+        """
+        informe = informe if informe is not None else {}
+        tiempos: Dict[str, float] = {etapa: 0.0 for etapa in ETAPAS_COMPILACION}
+        invalidas: List[Tuple[str, str]] = []
+        errores: List[Tuple[str, str]] = []
+
+        por_categoria: Dict[str, List[FirmaArchivo]] = {}
+        for entrada in firma:
+            por_categoria.setdefault(entrada[0].split('/', 1)[0], []).append(entrada)
+
+        categorias_anteriores = (anterior or {}).get('categorias', {})
+        bloques: Dict[str, Tuple[List[FirmaArchivo], bytes, int, int]] = {}
+        huellas: Dict[str, List[Tuple[str, str]]] = {}
+        recompiladas = 0
+
+        for categoria, archivos in por_categoria.items():
+            inicio = time.perf_counter()
+            previa = categorias_anteriores.get(categoria)
+            bloque = None
+            if previa and previa['archivos'] == archivos:
+                bloque = self._leer_bloque(anterior, previa)
+            if bloque is not None:
+                # Solo hacen falta claves y huellas para el índice global
+                tabla = TablaPreguntas(bloque, 0, previa['registros'], previa['cadenas'])
+                huellas[categoria] = [(tabla.clave(i), tabla.huella(i)) for i in range(len(tabla))]
+                bloques[categoria] = (archivos, bloque, previa['registros'], previa['cadenas'])
+                tiempos['parseo'] += time.perf_counter() - inicio
+            else:
+                preguntas = self._parsear_categoria(categoria, archivos, errores)
+                medio = time.perf_counter()
+                tiempos['parseo'] += medio - inicio
+                preguntas = _filtrar_validas(preguntas, invalidas)
+                tiempos['validacion'] += time.perf_counter() - medio
+                huellas[categoria] = [(p['id'], p['huella']) for p in preguntas]
+                bloque, cadenas = serializar_tabla(preguntas)
+                bloques[categoria] = (archivos, bloque, len(preguntas), cadenas)
+                recompiladas += 1
+
+        inicio = time.perf_counter()
+        duplicados = indexar_huellas(huellas)
+        # Las copias siguen en su tabla (reutilizable), pero se omiten al leer
+        omitidas = {categoria: [i for i, (clave, _) in enumerate(claves) if clave in duplicados]
+                    for categoria, claves in huellas.items()}
+        totales = {categoria: bloques[categoria][2] - len(omitidas[categoria]) for categoria in bloques}
+        version = huella_contenido(huellas, omitidas)
+        tiempos['indice'] = time.perf_counter() - inicio
+
+        for pregunta_id, motivo in invalidas:
+            print(f"[WARNING] Pregunta descartada {pregunta_id}: {motivo}")
+        for duplicado, canonico in duplicados.items():
+            print(f"[BANCO] Pregunta duplicada: {duplicado} es igual a {canonico}")
+
+        inicio = time.perf_counter()
+        manifiesto = self._escribir_snapshot(firma, bloques, omitidas, duplicados, version)
+        tiempos['escritura'] = time.perf_counter() - inicio
+
+        informe.update(tiempos=tiempos, invalidas=invalidas, errores=errores, duplicados=duplicados)
+        print(f"[BANCO] Compiladas {recompiladas} de {len(bloques)} categorías "
+              f"({sum(totales.values())} preguntas, {len(duplicados)} duplicadas)")
+        return manifiesto
+
+    # Snapshot
+
+    def _leer_manifiesto(self) -> Optional[Dict[str, Any]]:
+        """Lee solo la cabecera y el manifiesto del snapshot"""
+        if not os.path.exists(self.snapshot_path):
+            return None
+        try:
+            with open(self.snapshot_path, 'rb') as f:
+                magia, longitud = _CABECERA.unpack(f.read(_CABECERA.size))
+                if magia != _MAGIA:
+                    return None
+                manifiesto = pickle.loads(f.read(longitud))
+            if manifiesto.get('version') != SNAPSHOT_VERSION:
+                return None
+            manifiesto['inicio_datos'] = _CABECERA.size + longitud
+            return manifiesto
+        except Exception as e:
+            print(f"[WARNING] Snapshot del banco ilegible, se recompila: {e}")
+            return None
+
+    def _leer_bloque(self, manifiesto: Dict[str, Any], entrada: Dict[str, Any]) -> Optional[bytes]:
+        """Lee los bytes de la tabla de una categoría del snapshot"""
+        try:
+            with open(self.snapshot_path, 'rb') as f:
+                f.seek(manifiesto['inicio_datos'] + entrada['offset'])
+                bloque = f.read(entrada['longitud'])
+            return bloque if len(bloque) == entrada['longitud'] else None
+        except OSError:
+            return None
+
+    def _escribir_snapshot(self, firma: List[FirmaArchivo],
+                           bloques: Dict[str, Tuple[List[FirmaArchivo], bytes, int, int]],
+                           omitidas: Dict[str, List[int]], duplicados: Dict[str, str],
+                           version: str) -> Dict[str, Any]:
+        """Guarda manifiesto y tablas de forma atómica y devuelve el manifiesto"""
+        # Los offsets son relativos al final del manifiesto
+        categorias: Dict[str, Dict[str, Any]] = {}
+        posicion = 0
+        for categoria, (archivos, bloque, registros, cadenas) in bloques.items():
+            categorias[categoria] = {
+                'archivos': archivos,
+                'total': registros - len(omitidas[categoria]),
+                'registros': registros,
+                'cadenas': cadenas,
+                'omitidas': omitidas[categoria],
+                'offset': posicion,
+                'longitud': len(bloque)
+            }
+            posicion += len(bloque)
+
+        manifiesto: Dict[str, Any] = {
+            'version': SNAPSHOT_VERSION,
+            'firma': firma,
+            'categorias': categorias,
+            'duplicados': duplicados,
+            'version_contenido': version
+        }
+        datos_manifiesto = pickle.dumps(manifiesto, protocol=pickle.HIGHEST_PROTOCOL)
+        manifiesto['inicio_datos'] = _CABECERA.size + len(datos_manifiesto)
+
+        tmp_path = f"{self.snapshot_path}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(_CABECERA.pack(_MAGIA, len(datos_manifiesto)))
+                f.write(datos_manifiesto)
+                for _, bloque, _, _ in bloques.values():
+                    f.write(bloque)
+            os.replace(tmp_path, self.snapshot_path)
+        except OSError as e:
+            print(f"[WARNING] No se pudo guardar el snapshot del banco: {e}")
+            # Sin snapshot en disco, mantener las tablas en memoria
+            self._tablas_memoria = {categoria: bloque for categoria, (_, bloque, _, _) in bloques.items()}
+        return manifiesto
+
+    def _tabla(self, categoria: str, entrada: Dict[str, Any]) -> Optional[TablaPreguntas]:
+        """Tabla de una categoría sobre el snapshot mapeado en memoria"""
+        tabla = self._tablas.get(categoria)
+        if tabla is not None:
+            return tabla
+
+        if categoria in self._tablas_memoria:
+            tabla = TablaPreguntas(self._tablas_memoria[categoria], 0, entrada['registros'], entrada['cadenas'])
+        else:
+            if self._mapa is None:
+                try:
+                    with open(self.snapshot_path, 'rb') as f:
+                        self._mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    return None
+            inicio = self._manifiesto['inicio_datos'] + entrada['offset']
+            if inicio + entrada['longitud'] > len(self._mapa):
+                return None
+            tabla = TablaPreguntas(self._mapa, inicio, entrada['registros'], entrada['cadenas'])
+        self._tablas[categoria] = tabla
+        return tabla
+
+    def _indices_validos(self, categoria: str) -> Tuple[Optional[TablaPreguntas], List[int]]:
+        """Tabla de la categoría y posiciones de sus preguntas no duplicadas"""
+        self.cargar()
+        entrada = (self._manifiesto or {}).get('categorias', {}).get(categoria)
+        if entrada is None:
+            return None, []
+
+        tabla = self._tabla(categoria, entrada)
+        if tabla is None:
+            # El snapshot desapareció o se truncó: volver a los archivos de la categoría
+            preguntas = _filtrar_validas(self._parsear_categoria(categoria, entrada['archivos']), [])
+            preguntas = _sin_duplicados(preguntas, self.duplicados())
+            bloque, cadenas = serializar_tabla(preguntas)
+            tabla = TablaPreguntas(bloque, 0, len(preguntas), cadenas)
+            self._tablas[categoria] = tabla
+            return tabla, list(range(len(tabla)))
+
+        omitidas = set(entrada['omitidas'])
+        return tabla, [i for i in range(len(tabla)) if i not in omitidas]
+
+    # Consultas
+
+    def categorias(self) -> List[str]:
+        """Categorías con al menos un archivo de preguntas (solo lee el manifiesto)"""
+        self.cargar()
+        return list((self._manifiesto or {}).get('categorias', {}))
+
+    def conteos(self) -> Dict[str, int]:
+        """Número de preguntas por categoría según el manifiesto"""
+        self.cargar()
+        return {categoria: entrada['total']
+                for categoria, entrada in (self._manifiesto or {}).get('categorias', {}).items()}
+
+    def total_preguntas(self) -> int:
+        """Número total de preguntas en el banco"""
+        return sum(entrada['total'] for entrada in (self._manifiesto or {}).get('categorias', {}).values())
+
+    def version_contenido(self) -> str:
+        """
+        Huella del contenido del banco (preguntas, claves y orden de los ids).
+        Dos dispositivos con la misma versión asignan los mismos ids.
+        """
+        self.cargar()
+        return (self._manifiesto or {}).get('version_contenido', '')
+
+    def duplicados(self) -> Dict[str, str]:
+        """Id de cada pregunta repetida -> id canónico que la sustituye"""
+        return (self._manifiesto or {}).get('duplicados', {})
+
+    def id_canonico(self, pregunta_id: str) -> str:
+        """Id canónico de una pregunta (el mismo id si no está repetida)"""
+        return self.duplicados().get(pregunta_id, pregunta_id)
+
+    def categorias_cargadas(self) -> List[str]:
+        """Categorías cuyas preguntas ya están en memoria"""
+        return list(set(self._cargadas) | set(self._registros))
+
+    def preguntas_categoria(self, categoria: str) -> List[Dict[str, Any]]:
+        """
+        Preguntas de una categoría como diccionarios (compartidas, no
+        modificar). Decodifica todos sus textos; para jugar es preferible
+        registros_categoria().
+        """
+        with self._lock:
+            preguntas = self._cargadas.get(categoria)
+            if preguntas is None:
+                tabla, indices = self._indices_validos(categoria)
+                preguntas = [tabla.como_dict(i, categoria) for i in indices] if tabla else []
+                self._cargadas[categoria] = preguntas
+            return preguntas
+
+    def registros_categoria(self, categoria: str) -> List[RegistroPregunta]:
+        """
+        Registros inmutables de una categoría. Se crean la primera vez que se
+        piden y no decodifican ningún texto hasta que se accede a él.
+        """
+        with self._lock:
+            registros = self._registros.get(categoria)
+            if registros is not None:
+                return registros
+
+            tabla, indices = self._indices_validos(categoria)
+            if tabla is None or categoria not in self._orden_categorias:
+                return []
+            primer_id = self._inicios[self._orden_categorias.index(categoria)]
+            categoria = sys.intern(categoria)
+            registros = [RegistroPregunta(primer_id + i, categoria, tabla, indice)
+                         for i, indice in enumerate(indices)]
+            self._registros[categoria] = registros
+            return registros
+
+    def registros(self, categorias: Optional[Iterable[str]] = None) -> List[RegistroPregunta]:
+        """Registros de las categorías indicadas; None para todas"""
+        if categorias is None:
+            categorias = self.categorias()
+        registros: List[RegistroPregunta] = []
+        for categoria in categorias:
+            registros.extend(self.registros_categoria(categoria))
+        return registros
+
+    def registro(self, pregunta_id: int) -> RegistroPregunta:
+        """Registro de un id entero (carga su categoría si hace falta)"""
+        self.cargar()
+        posicion = bisect.bisect_right(self._inicios, pregunta_id) - 1
+        if pregunta_id < 0 or posicion < 0:
+            raise KeyError(pregunta_id)
+        registros = self.registros_categoria(self._orden_categorias[posicion])
+        indice = pregunta_id - self._inicios[posicion]
+        if indice >= len(registros):
+            raise KeyError(pregunta_id)
+        return registros[indice]
+
+    def registro_por_clave(self, clave: str) -> RegistroPregunta:
+        """Registro de una clave textual (p. ej. recibida por la red)"""
+        return self.registro(self.ids_por_claves([clave])[0])
+
+    def ids_por_claves(self, claves: Iterable[str]) -> List[int]:
+        """
+        Traduce claves textuales (las que viajan por la red) a ids enteros.
+        Las claves de preguntas duplicadas se resuelven a su id canónico.
+        """
+        self.cargar()
+        ids: List[int] = []
+        for clave in claves:
+            clave = self.id_canonico(clave)
+            if clave not in self._claves:
+                for categoria in self._orden_categorias:
+                    if clave.startswith(f"{categoria}_"):
+                        for registro in self.registros_categoria(categoria):
+                            self._claves[registro.clave] = registro.id
+            ids.append(self._claves[clave])
+        return ids
+
+    def preguntas_base(self, categorias: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Preguntas tal como están en el banco (compartidas, no modificar).
+
+        Args:
+            categorias: Categorías a incluir; None para todas
+        """
+        if categorias is None:
+            categorias = self.categorias()
+        preguntas: List[Dict[str, Any]] = []
+        for categoria in categorias:
+            preguntas.extend(self.preguntas_categoria(categoria))
+        return preguntas
+
+
+def normalizar_texto(texto: Any) -> str:
+    """Minúsculas, sin acentos y con los espacios colapsados"""
+    descompuesto = unicodedata.normalize('NFKD', str(texto).lower())
+    sin_acentos = ''.join(c for c in descompuesto if not unicodedata.combining(c))
+    return ' '.join(sin_acentos.split())
+
+
+def huella_pregunta(pregunta: Dict[str, Any]) -> str:
+    """Huella del contenido: texto normalizado de la pregunta y opciones ordenadas"""
+    opciones = sorted(normalizar_texto(o) for o in pregunta.get('opciones', []) or [])
+    contenido = '\x1f'.join([normalizar_texto(pregunta.get('pregunta', ''))] + opciones)
+    return hashlib.blake2b(contenido.encode('utf-8'), digest_size=12).hexdigest()
+
+
+def validar_pregunta(pregunta: Dict[str, Any]) -> List[str]:
+    """
+    Comprueba que una pregunta se pueda jugar.
+
+    Returns:
+        Lista de problemas encontrados (vacía si la pregunta es válida)
+    """
+    problemas: List[str] = []
+    if not str(pregunta.get('pregunta', '')).strip():
+        problemas.append("texto de la pregunta vacío")
+
+    opciones = pregunta.get('opciones')
+    if not isinstance(opciones, list) or len(opciones) < 2:
+        problemas.append("se necesitan al menos 2 opciones")
+        return problemas
+
+    if any(not str(opcion).strip() for opcion in opciones):
+        problemas.append("hay opciones vacías")
+    if len({normalizar_texto(opcion) for opcion in opciones}) != len(opciones):
+        problemas.append("hay opciones repetidas")
+    if pregunta.get('respuesta_correcta') not in opciones:
+        problemas.append("la respuesta correcta no está entre las opciones")
+    return problemas
+
+
+def _filtrar_validas(preguntas: List[Dict[str, Any]], invalidas: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    validas = []
+    for pregunta in preguntas:
+        problemas = validar_pregunta(pregunta)
+        if problemas:
+            invalidas.append((pregunta['id'], '; '.join(problemas)))
+        else:
+            validas.append(pregunta)
+    return validas
+
+
+def indexar_huellas(categorias: Dict[str, List[Tuple[str, str]]]) -> Dict[str, str]:
+    """
+    Recorre los pares (id, huella) en orden de categoría y archivo y
+    devuelve, para cada pregunta repetida, el id de su primera aparición.
+    """
+    canonicos: Dict[str, str] = {}
+    duplicados: Dict[str, str] = {}
+    for categoria in sorted(categorias):
+        for pregunta_id, huella in categorias[categoria]:
+            canonico = canonicos.setdefault(huella, pregunta_id)
+            if canonico != pregunta_id:
+                duplicados[pregunta_id] = canonico
+    return duplicados
+
+
+def huella_contenido(huellas: Dict[str, List[Tuple[str, str]]], omitidas: Dict[str, List[int]]) -> str:
+    """Huella de las preguntas no duplicadas en el orden en que reciben sus ids"""
+    resumen = hashlib.blake2b(digest_size=8)
+    for categoria, claves in huellas.items():
+        saltar = set(omitidas.get(categoria, ()))
+        for i, (clave, huella) in enumerate(claves):
+            if i not in saltar:
+                resumen.update(f"{categoria}\x1f{clave}\x1f{huella}\n".encode('utf-8'))
+    return resumen.hexdigest()
+
+
+def _sin_duplicados(preguntas: List[Dict[str, Any]], duplicados: Dict[str, str]) -> List[Dict[str, Any]]:
+    if not duplicados:
+        return preguntas
+    return [p for p in preguntas if p['id'] not in duplicados]
+
+
+# Instancia global del banco de preguntas
+question_bank = QuestionBank()
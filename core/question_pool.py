@@ -0,0 +1,86 @@
+"""
+Pool de preguntas para sortear en Bingo Educativo
+Arreglo indexado más un mapa elemento -> posición: sortear, quitar una
+pregunta respondida y devolverla tras un fallo son O(1)
+"""
+
+from typing import Dict, Generic, Hashable, Iterable, Iterator, List, Optional, TypeVar
+import random
+
+
+T = TypeVar('T', bound=Hashable)
+
+
+class QuestionPool(Generic[T]):
+    """
+    Conjunto de preguntas disponibles (normalmente ids enteros del banco).
+
+    Quitar mueve el último elemento al hueco (swap-remove), así que el orden
+    interno no se conserva tras quitar; `siguiente` saca en el orden de
+    creación mientras no se quite nada de en medio.
+    """
+    __slots__ = ('_elementos', '_posiciones', 'rng')
+
+    def __init__(self, elementos: Iterable[T] = (), rng: Optional[random.Random] = None):
+        # Se guardan al revés para que `siguiente` saque desde el final en O(1)
+        self._elementos: List[T] = list(dict.fromkeys(elementos))[::-1]
+        self._posiciones: Dict[T, int] = {elemento: i for i, elemento in enumerate(self._elementos)}
+        self.rng = rng or random
+
+    def __len__(self) -> int:
+        return len(self._elementos)
+
+    def __bool__(self) -> bool:
+        return bool(self._elementos)
+
+    def __contains__(self, elemento: T) -> bool:
+        return elemento in self._posiciones
+
+    def __iter__(self) -> Iterator[T]:
+        return reversed(self._elementos)
+
+    def __repr__(self) -> str:
+        return f"QuestionPool({len(self._elementos)} preguntas)"
+
+    def agregar(self, elemento: T) -> bool:
+        """Devuelve una pregunta al pool (p. ej. tras un fallo); False si ya estaba"""
+        if elemento in self._posiciones:
+            return False
+        self._posiciones[elemento] = len(self._elementos)
+        self._elementos.append(elemento)
+        return True
+
+    def quitar(self, elemento: T) -> bool:
+        """Quita una pregunta (p. ej. respondida bien); False si no estaba"""
+        posicion = self._posiciones.pop(elemento, None)
+        if posicion is None:
+            return False
+        ultimo = self._elementos.pop()
+        if posicion < len(self._elementos):
+            self._elementos[posicion] = ultimo
+            self._posiciones[ultimo] = posicion
+        return True
+
+    def elegir(self) -> T:
+        """Pregunta al azar sin quitarla del pool"""
+        if not self._elementos:
+            raise IndexError("El pool de preguntas está vacío")
+        return self._elementos[self.rng.randrange(len(self._elementos))]
+
+    def sacar(self) -> T:
+        """Pregunta al azar, quitándola del pool"""
+        elemento = self.elegir()
+        self.quitar(elemento)
+        return elemento
+
+    def siguiente(self) -> T:
+        """Saca la siguiente pregunta en orden (para listas ya barajadas)"""
+        if not self._elementos:
+            raise IndexError("El pool de preguntas está vacío")
+        elemento = self._elementos.pop()
+        del self._posiciones[elemento]
+        return elemento
+
+    def limpiar(self) -> None:
+        self._elementos.clear()
+        self._posiciones.clear()
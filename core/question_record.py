@@ -0,0 +1,277 @@
+"""
+Representación compacta de preguntas y cartones para Bingo Educativo
+El banco guarda las preguntas en una tabla de registros fijos con offsets a
+un bloque de cadenas UTF-8 (mapeado en memoria); los registros inmutables
+apuntan a esa tabla y una partida solo guarda ids enteros y un arreglo de
+estado por cartón
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import functools
+import random
+import struct
+
+from .bingo_patterns import MarcadorBingo, PatronBingo, patron_lleno
+
+
+# Estado de una casilla del cartón
+SIN_RESPONDER = 0
+CORRECTA = 1
+INCORRECTA = 2
+
+# Registro de tamaño fijo: primera cadena, número de opciones, índice correcto y huella
+_REGISTRO = struct.Struct('<IHH12s')
+# Inicio y fin de una cadena dentro del bloque UTF-8
+_RANGO = struct.Struct('<II')
+# Cadenas de cada registro, en orden: clave, pregunta y luego las opciones
+_CADENAS_FIJAS = 2
+
+
+def serializar_tabla(preguntas: Sequence[Dict[str, Any]]) -> Tuple[bytes, int]:
+    """
+    Serializa preguntas validadas como tabla de registros fijos, tabla de
+    offsets y bloque de cadenas UTF-8.
+
+    Returns:
+        (bytes de la tabla, número de cadenas)
+    """
+    registros = bytearray()
+    offsets = [0]
+    cadenas = bytearray()
+    for pregunta in preguntas:
+        opciones = pregunta['opciones']
+        registros += _REGISTRO.pack(len(offsets) - 1, len(opciones),
+                                    opciones.index(pregunta['respuesta_correcta']),
+                                    bytes.fromhex(pregunta['huella']))
+        for texto in [pregunta['id'], pregunta['pregunta']] + list(opciones):
+            cadenas += str(texto).encode('utf-8')
+            offsets.append(len(cadenas))
+    tabla_offsets = struct.pack(f'<{len(offsets)}I', *offsets)
+    return bytes(registros) + tabla_offsets + bytes(cadenas), len(offsets) - 1
+
+
+class TablaPreguntas:
+    """
+    Vista de solo lectura sobre una tabla serializada dentro de un buffer
+    (normalmente el snapshot abierto con mmap). No copia nada: cada cadena se
+    decodifica cuando se pide, así que en memoria solo vive lo que se usa.
+    """
+    __slots__ = ('buffer', 'inicio', 'registros', 'cadenas', '_offsets', '_datos')
+
+    def __init__(self, buffer: Any, inicio: int, registros: int, cadenas: int):
+        self.buffer = buffer
+        self.inicio = inicio
+        self.registros = registros
+        self.cadenas = cadenas
+        self._offsets = inicio + registros * _REGISTRO.size
+        self._datos = self._offsets + (cadenas + 1) * 4
+
+    def __len__(self) -> int:
+        return self.registros
+
+    def _registro(self, indice: int) -> Tuple[int, int, int, bytes]:
+        return _REGISTRO.unpack_from(self.buffer, self.inicio + indice * _REGISTRO.size)
+
+    def _cadena(self, numero: int) -> str:
+        inicio, fin = _RANGO.unpack_from(self.buffer, self._offsets + numero * 4)
+        return self.buffer[self._datos + inicio:self._datos + fin].decode('utf-8')
+
+    def clave(self, indice: int) -> str:
+        return self._cadena(self._registro(indice)[0])
+
+    def pregunta(self, indice: int) -> str:
+        return self._cadena(self._registro(indice)[0] + 1)
+
+    def opciones(self, indice: int) -> Tuple[str, ...]:
+        primera, num_opciones, _, _ = self._registro(indice)
+        primera += _CADENAS_FIJAS
+        return tuple(self._cadena(primera + i) for i in range(num_opciones))
+
+    def num_opciones(self, indice: int) -> int:
+        return self._registro(indice)[1]
+
+    def indice_correcto(self, indice: int) -> int:
+        return self._registro(indice)[2]
+
+    def huella(self, indice: int) -> str:
+        return self._registro(indice)[3].hex()
+
+    def como_dict(self, indice: int, categoria: str) -> Dict[str, Any]:
+        """Pregunta completa en el formato de diccionario de los cartones"""
+        opciones = list(self.opciones(indice))
+        return {
+            'pregunta': self.pregunta(indice),
+            'opciones': opciones,
+            'respuesta_correcta': opciones[self.indice_correcto(indice)],
+            'categoria': categoria,
+            'id': self.clave(indice),
+            'huella': self.huella(indice)
+        }
+
+
+class RegistroPregunta:
+    """
+    Pregunta del banco compartida por todas las partidas (no se copia).
+
+    Solo guarda su id entero denso, su categoría (internada) y su posición
+    en la tabla; los textos se decodifican al acceder a ellos. `clave` es el
+    identificador textual estable (categoria_archivo_indice) que se usa en la red.
+    """
+    __slots__ = ('id', 'categoria', '_tabla', '_indice')
+
+    def __init__(self, pregunta_id: int, categoria: str, tabla: TablaPreguntas, indice: int):
+        object.__setattr__(self, 'id', pregunta_id)
+        object.__setattr__(self, 'categoria', categoria)
+        object.__setattr__(self, '_tabla', tabla)
+        object.__setattr__(self, '_indice', indice)
+
+    def __setattr__(self, nombre: str, valor: Any) -> None:
+        raise AttributeError("RegistroPregunta es inmutable")
+
+    def __delattr__(self, nombre: str) -> None:
+        raise AttributeError("RegistroPregunta es inmutable")
+
+    def __eq__(self, otro: Any) -> bool:
+        return isinstance(otro, RegistroPregunta) and otro.id == self.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    def __repr__(self) -> str:
+        return f"RegistroPregunta(id={self.id}, categoria={self.categoria!r})"
+
+    @property
+    def clave(self) -> str:
+        return self._tabla.clave(self._indice)
+
+    @property
+    def pregunta(self) -> str:
+        return self._tabla.pregunta(self._indice)
+
+    @property
+    def opciones(self) -> Tuple[str, ...]:
+        return self._tabla.opciones(self._indice)
+
+    @property
+    def indice_correcto(self) -> int:
+        return self._tabla.indice_correcto(self._indice)
+
+    @property
+    def respuesta_correcta(self) -> str:
+        return self.opciones[self.indice_correcto]
+
+    def orden_opciones(self, semilla: int) -> List[int]:
+        """
+        Orden en que se muestran las opciones en una partida. Se deriva de la
+        semilla de la partida, así que no hace falta guardar copias barajadas.
+        """
+        orden = list(range(self._tabla.num_opciones(self._indice)))
+        random.Random(semilla * 1000003 + self.id).shuffle(orden)
+        return orden
+
+
+@functools.lru_cache(maxsize=None)
+def _patrones_lleno(casillas: int) -> Tuple[PatronBingo, ...]:
+    return (patron_lleno(1, casillas),)
+
+
+class CartonJuego:
+    """
+    Cartón de una partida: ids de sus preguntas, un bytearray con el estado
+    de cada casilla (SIN_RESPONDER, CORRECTA o INCORRECTA) y las casillas
+    correctas como máscara de bits contra los patrones de victoria (por
+    defecto, el cartón lleno).
+    """
+    __slots__ = ('id', 'preguntas', 'estado', 'marcador', '_posiciones')
+
+    def __init__(self, carton_id: str, preguntas: Sequence[int],
+                 patrones: Optional[Sequence[PatronBingo]] = None):
+        self.id = carton_id
+        self.preguntas: Tuple[int, ...] = tuple(preguntas)
+        self.estado = bytearray(len(self.preguntas))
+        self.marcador = MarcadorBingo(patrones if patrones is not None else _patrones_lleno(len(self.preguntas)))
+        self._posiciones = {pregunta_id: i for i, pregunta_id in enumerate(self.preguntas)}
+
+    def __len__(self) -> int:
+        return len(self.preguntas)
+
+    def posicion(self, pregunta_id: int) -> int:
+        """Casilla de la pregunta en el cartón, o -1 si no está"""
+        return self._posiciones.get(pregunta_id, -1)
+
+    def tiene(self, pregunta_id: int) -> bool:
+        return pregunta_id in self._posiciones
+
+    def respondida(self, pregunta_id: int) -> bool:
+        posicion = self.posicion(pregunta_id)
+        return posicion >= 0 and self.estado[posicion] != SIN_RESPONDER
+
+    def marcar(self, pregunta_id: int, correcta: bool) -> bool:
+        """Marca la casilla de una pregunta; devuelve False si no está en el cartón"""
+        posicion = self.posicion(pregunta_id)
+        if posicion < 0:
+            return False
+        if correcta:
+            self.estado[posicion] = CORRECTA
+            self.marcador.marcar(posicion)
+        else:
+            self.estado[posicion] = INCORRECTA
+            self.marcador.desmarcar(posicion)
+        return True
+
+    def reiniciar(self, pregunta_id: int) -> None:
+        """Deja la casilla sin responder para que la pregunta pueda volver a salir"""
+        posicion = self.posicion(pregunta_id)
+        if posicion >= 0:
+            self.estado[posicion] = SIN_RESPONDER
+            self.marcador.desmarcar(posicion)
+
+    def aciertos(self) -> int:
+        return self.marcador.cantidad()
+
+    def desaciertos(self) -> int:
+        return self.estado.count(INCORRECTA)
+
+    def completo(self) -> bool:
+        """True si todas las casillas están respondidas correctamente"""
+        return len(self.estado) > 0 and self.marcador.marcadas == (1 << len(self.estado)) - 1
+
+    def bingo(self) -> Optional[PatronBingo]:
+        """Patrón ganador completado, o None (se actualiza al marcar)"""
+        return self.marcador.ganador
+
+
+class IndicePreguntas:
+    """
+    Índice invertido de una partida: id de pregunta -> [(cartón, casilla)].
+
+    Se construye una vez al repartir los cartones; el cartón 0 es el del
+    jugador y los siguientes los de las IAs. Así saber quién tiene la
+    pregunta sorteada no depende del número de cartones.
+    """
+    __slots__ = ('cartones', '_ubicaciones', '_numeros')
+
+    def __init__(self, cartones: Sequence[CartonJuego] = ()):
+        self.cartones: List[CartonJuego] = list(cartones)
+        self._ubicaciones: Dict[int, List[Tuple[int, int]]] = {}
+        for numero, carton in enumerate(self.cartones):
+            for casilla, pregunta_id in enumerate(carton.preguntas):
+                self._ubicaciones.setdefault(pregunta_id, []).append((numero, casilla))
+        self._numeros = {carton.id: numero for numero, carton in enumerate(self.cartones)}
+
+    def __contains__(self, pregunta_id: int) -> bool:
+        return pregunta_id in self._ubicaciones
+
+    def ubicaciones(self, pregunta_id: int) -> Sequence[Tuple[int, int]]:
+        """(cartón, casilla) de cada aparición de la pregunta, por número de cartón"""
+        return self._ubicaciones.get(pregunta_id, ())
+
+    def pendientes(self, pregunta_id: int, desde: int = 0) -> List[CartonJuego]:
+        """Cartones (a partir del número `desde`) con la pregunta sin responder"""
+        return [self.cartones[numero] for numero, casilla in self._ubicaciones.get(pregunta_id, ())
+                if numero >= desde and self.cartones[numero].estado[casilla] == SIN_RESPONDER]
+
+    def numero(self, carton_id: str) -> int:
+        """Número del cartón en la partida, o -1 si no está"""
+        return self._numeros.get(carton_id, -1)
+
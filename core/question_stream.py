@@ -0,0 +1,128 @@
+"""
+Lectura incremental de archivos de preguntas para Bingo Educativo
+Entrega las preguntas de una en una sin cargar el archivo completo, tanto en
+el formato de cartones ({"categoria": ..., "preguntas": [...]}) como en su
+variante de una pregunta JSON por línea (.jsonl)
+"""
+
+from typing import Any, Dict, Iterator, IO
+import json
+
+
+# Extensiones reconocidas como archivos de preguntas
+EXTENSIONES_PREGUNTAS = ('.json', '.jsonl')
+
+TAMANO_BLOQUE = 64 * 1024
+_ESPACIOS = ' \t\n\r'
+_decoder = json.JSONDecoder()
+
+
+class _LectorIncremental:
+    """
+    Buffer de texto sobre un archivo que decodifica valores JSON sueltos con
+    raw_decode y descarta lo ya consumido, de modo que la memoria usada
+    depende del tamaño de una pregunta y no del archivo.
+    """
+
+    def __init__(self, archivo: IO[str]):
+        self.archivo = archivo
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def _leer_mas(self) -> bool:
+        bloque = self.archivo.read(TAMANO_BLOQUE)
+        if not bloque:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + bloque
+        self.pos = 0
+        return True
+
+    def mirar(self) -> str:
+        """Devuelve el siguiente carácter significativo sin consumirlo"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _ESPACIOS:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._leer_mas():
+                return ''
+
+    def consumir(self, esperado: str) -> None:
+        """Consume el carácter estructural esperado"""
+        actual = self.mirar()
+        if actual != esperado:
+            raise ValueError(f"Se esperaba '{esperado}' y se encontró '{actual or 'EOF'}'")
+        self.pos += 1
+
+    def valor(self) -> Any:
+        """Decodifica el siguiente valor JSON completo"""
+        self.mirar()
+        while True:
+            try:
+                obj, fin = _decoder.raw_decode(self.buf, self.pos)
+                # Un número al final del buffer podría continuar en el siguiente bloque
+                if fin < len(self.buf) or self.eof:
+                    self.pos = fin
+                    return obj
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._leer_mas()
+
+
+def iterar_preguntas_json(archivo: IO[str]) -> Iterator[Dict[str, Any]]:
+    """Recorre la lista "preguntas" de un archivo de cartones pregunta a pregunta"""
+    lector = _LectorIncremental(archivo)
+    lector.consumir('{')
+    if lector.mirar() == '}':
+        return
+
+    while True:
+        clave = lector.valor()
+        lector.consumir(':')
+        if clave == 'preguntas':
+            lector.consumir('[')
+            if lector.mirar() == ']':
+                lector.pos += 1
+            else:
+                while True:
+                    yield lector.valor()
+                    if lector.mirar() == ']':
+                        lector.pos += 1
+                        break
+                    lector.consumir(',')
+        else:
+            # Otras claves ("categoria", metadatos) se leen y se descartan
+            lector.valor()
+
+        if lector.mirar() == '}':
+            return
+        lector.consumir(',')
+
+
+def iterar_preguntas_jsonl(archivo: IO[str]) -> Iterator[Dict[str, Any]]:
+    """
+    Recorre un archivo con una pregunta JSON por línea. Las líneas vacías y
+    las que no son preguntas (p. ej. una cabecera {"categoria": ...}) se omiten.
+    """
+    for numero, linea in enumerate(archivo, 1):
+        linea = linea.strip()
+        if not linea:
+            continue
+        try:
+            pregunta = json.loads(linea)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Línea {numero}: {e}") from e
+        if isinstance(pregunta, dict) and 'pregunta' in pregunta:
+            yield pregunta
+
+
+def iterar_preguntas(ruta: str) -> Iterator[Dict[str, Any]]:
+    """Recorre las preguntas de un archivo .json o .jsonl según su extensión"""
+    with open(ruta, 'r', encoding='utf-8-sig') as f:
+        if ruta.endswith('.jsonl'):
+            yield from iterar_preguntas_jsonl(f)
+        else:
+            yield from iterar_preguntas_json(f)
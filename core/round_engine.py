@@ -0,0 +1,447 @@
+"""
+Motor de rondas de Bingo Educativo
+Reglas de la partida (sorteo, respuestas de IA, temporizador del jugador,
+bingo y pool de preguntas) sin dependencias de Kivy: se maneja con pasos
+explícitos (repartir, sortear, responder, tiempo_agotado) y un reloj propio
+que avanza con tick(dt). La interfaz solo escucha sus eventos
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import heapq
+import itertools
+import math
+import random
+
+from .mass_ai import MassAI
+from .question_bank import QuestionBank, question_bank
+from .question_pool import QuestionPool
+from .question_record import CartonJuego, IndicePreguntas
+
+
+# Tiempos de la partida (segundos)
+TIEMPO_JUGADOR = 15
+RETRASO_INICIO = 1.0
+RETRASO_SIN_CARTON = 1.0
+RETRASO_TRAS_RESPUESTA = 1.0
+RETRASO_TIEMPO_AGOTADO = 1.0
+RETRASO_IA = (1.0, 3.0)
+MARGEN_TRAS_IA = 1.0
+
+# Escala de tiempo de la partida: factor sobre el tiempo real, o None para
+# jugarla entera de una vez (demos entre IAs y pruebas automáticas)
+VELOCIDADES = {
+    "1x": 1.0,
+    "4x": 4.0,
+    "instantanea": None
+}
+
+# Probabilidad de acierto de la IA por dificultad
+PROBABILIDADES_IA = {
+    "Facil": 0.6,
+    "Moderado": 0.75,
+    "Dificil": 0.9
+}
+
+# Eventos que emite el motor: callback(tipo, datos)
+EVENTO_REPARTO = 'reparto'                # semilla, cartones, preguntas, hay_jugador
+EVENTO_PREGUNTA = 'pregunta'              # pregunta_id, ubicaciones, jugador_tiene
+EVENTO_SIN_CARTON = 'sin_carton'          # pregunta_id
+EVENTO_TURNO_JUGADOR = 'turno_jugador'    # pregunta_id, segundos
+EVENTO_RELOJ = 'reloj'                    # segundos (restantes del turno del jugador)
+EVENTO_RESPUESTA = 'respuesta'            # carton, pregunta_id, correcta, opcion (None para la IA)
+EVENTO_RESPUESTAS_IA = 'respuestas_ia'    # cartones, pregunta_id, correctas (IAs en lote)
+EVENTO_TIEMPO_AGOTADO = 'tiempo_agotado'  # pregunta_id
+EVENTO_FIN = 'fin'                        # ganador, patron
+
+Oyente = Callable[[str, Dict[str, Any]], None]
+
+
+class _Tarea:
+    """Acción programada en el reloj del motor"""
+    __slots__ = ('momento', 'orden', 'accion', 'activa')
+
+    def __init__(self, momento: float, orden: int, accion: Callable[[], None]):
+        self.momento = momento
+        self.orden = orden
+        self.accion = accion
+        self.activa = True
+
+    def __lt__(self, otra: '_Tarea') -> bool:
+        return (self.momento, self.orden) < (otra.momento, otra.orden)
+
+    def cancelar(self) -> None:
+        self.activa = False
+
+
+class RoundEngine:
+    """
+    Motor de una partida contra IAs.
+
+    Los cartones se numeran como en IndicePreguntas: si hay jugador, el
+    cartón 0 es el suyo y los siguientes son de las IAs. Los retrasos entre
+    pasos se programan en el reloj del motor; quien lo aloja llama a
+    tick(dt) (Kivy, un servidor) o a ejecutar_hasta_fin() (simulaciones).
+
+    `velocidad` multiplica el tiempo que avanza cada tick, así que acorta a la
+    vez los retrasos de las IAs, las pausas entre rondas y el temporizador
+    del jugador. Con velocidad None la partida se juega completa al
+    iniciarla; si hay jugador, su tiempo para responder se agota al instante.
+
+    Con `ia_en_lote` las IAs responden todas juntas en cada ronda sobre
+    matrices NumPy (MassAI): una sola acción programada y un solo evento
+    EVENTO_RESPUESTAS_IA por ronda, pensado para salas con decenas de IAs.
+    """
+
+    def __init__(self, probabilidad_ia: float = PROBABILIDADES_IA["Moderado"],
+                 tiempo_jugador: float = TIEMPO_JUGADOR, rng: Optional[random.Random] = None,
+                 banco: Optional[QuestionBank] = None, velocidad: Optional[float] = VELOCIDADES["1x"],
+                 ia_en_lote: bool = False):
+        self.probabilidad_ia = probabilidad_ia
+        # Probabilidad propia de cada IA (en orden de cartones de IA); las que
+        # falten usan probabilidad_ia
+        self.probabilidades_ia: Sequence[float] = ()
+        self.tiempo_jugador = tiempo_jugador
+        self.velocidad = velocidad
+        self.ia_en_lote = ia_en_lote
+        self.ia_lote: Optional[MassAI] = None
+        self.rng = rng or random.Random()
+        # Solo hace falta para corregir las respuestas del jugador
+        self.banco = banco or question_bank
+        self.oyentes: List[Oyente] = []
+
+        self.cartones: List[CartonJuego] = []
+        self.hay_jugador = False
+        self.indice = IndicePreguntas()
+        self.pool: QuestionPool[int] = QuestionPool(rng=self.rng)
+        self.preguntas_ya_usadas: List[int] = []
+        self.pregunta_actual: Optional[int] = None
+        self.ronda = 0
+        self.en_curso = False
+        self.ganador: Optional[str] = None
+        # Semilla con la que se generó el reparto (solo informativa, para los registros)
+        self.semilla = 0
+
+        self.ahora = 0.0
+        self._tareas: List[_Tarea] = []
+        self._contador = itertools.count()
+        self._turno: Optional[_Tarea] = None
+        self._fin_turno = 0.0
+        self._reloj_mostrado = -1
+
+    # --- Eventos ---
+
+    def suscribir(self, oyente: Oyente) -> None:
+        self.oyentes.append(oyente)
+
+    def desuscribir(self, oyente: Oyente) -> None:
+        if oyente in self.oyentes:
+            self.oyentes.remove(oyente)
+
+    def _emitir(self, tipo: str, **datos: Any) -> None:
+        for oyente in list(self.oyentes):
+            oyente(tipo, datos)
+
+    # --- Reloj ---
+
+    def programar(self, retraso: float, accion: Callable[[], None]) -> _Tarea:
+        """Programa una acción `retraso` segundos después del momento actual"""
+        tarea = _Tarea(self.ahora + max(0.0, retraso), next(self._contador), accion)
+        heapq.heappush(self._tareas, tarea)
+        return tarea
+
+    def proxima_tarea(self) -> Optional[float]:
+        """Segundos hasta la próxima acción programada, o None si no hay"""
+        while self._tareas and not self._tareas[0].activa:
+            heapq.heappop(self._tareas)
+        return self._tareas[0].momento - self.ahora if self._tareas else None
+
+    @property
+    def instantanea(self) -> bool:
+        return self.velocidad is None
+
+    def tick(self, dt: float) -> None:
+        """Avanza el reloj `dt` segundos reales (escalados por la velocidad) y ejecuta lo que haya vencido"""
+        if self.instantanea:
+            self.ejecutar_hasta_fin()
+            return
+        self._avanzar(dt * self.velocidad)
+
+    def ejecutar_hasta_fin(self, max_pasos: int = 1000000) -> Optional[str]:
+        """Ejecuta la partida saltando de acción en acción; devuelve el ganador"""
+        pasos = 0
+        while self.en_curso and pasos < max_pasos:
+            espera = self.proxima_tarea()
+            if espera is None:
+                break
+            self._avanzar(espera)
+            pasos += 1
+        return self.ganador
+
+    def _avanzar(self, segundos: float) -> None:
+        """Avanza el reloj del motor `segundos` de juego"""
+        limite = self.ahora + segundos
+        while self._tareas and self._tareas[0].momento <= limite:
+            tarea = heapq.heappop(self._tareas)
+            if tarea.activa:
+                self.ahora = max(self.ahora, tarea.momento)
+                tarea.accion()
+        self.ahora = limite
+        self._actualizar_reloj()
+
+    def _actualizar_reloj(self) -> None:
+        if self._turno is None or not self._turno.activa:
+            return
+        segundos = max(0, math.ceil(self._fin_turno - self.ahora))
+        if segundos != self._reloj_mostrado:
+            self._reloj_mostrado = segundos
+            self._emitir(EVENTO_RELOJ, segundos=segundos)
+
+    def _cancelar_turno(self) -> None:
+        if self._turno is not None:
+            self._turno.cancelar()
+            self._turno = None
+            self._emitir(EVENTO_RELOJ, segundos=0)
+
+    def detener(self) -> None:
+        """Detiene la partida sin declarar ganador ni emitir eventos"""
+        self.en_curso = False
+        for tarea in self._tareas:
+            tarea.cancelar()
+        self._tareas.clear()
+        self._turno = None
+
+    # --- Pasos de la partida ---
+
+    def repartir(self, carton_jugador: Optional[CartonJuego], cartones_ia: Sequence[CartonJuego],
+                 preguntas: Sequence[int], semilla: int = 0) -> None:
+        """Asigna cartones y pool de preguntas; la partida queda en curso"""
+        self.detener()
+        self.semilla = semilla
+        self.hay_jugador = carton_jugador is not None
+        self.cartones = ([carton_jugador] if carton_jugador is not None else []) + list(cartones_ia)
+        self.indice = IndicePreguntas(self.cartones)
+        self.ia_lote = None
+        if self.ia_en_lote and cartones_ia:
+            primera_ia = 1 if self.hay_jugador else 0
+            self.ia_lote = MassAI(cartones_ia, [self.probabilidad_de(primera_ia + i) for i in range(len(cartones_ia))],
+                                  semilla=self.rng.getrandbits(63))
+        self.pool = QuestionPool(preguntas, rng=self.rng)
+        self.preguntas_ya_usadas = []
+        self.pregunta_actual = None
+        self.ronda = 0
+        self.ganador = None
+        self.en_curso = True
+        if self.cartones:
+            self._emitir(EVENTO_REPARTO, semilla=semilla, cartones=self.cartones, preguntas=list(self.pool),
+                         hay_jugador=self.hay_jugador)
+
+    def limpiar(self) -> None:
+        """Olvida los cartones y el pool de la última partida"""
+        self.repartir(None, [], [])
+        self.en_curso = False
+
+    @property
+    def carton_jugador(self) -> Optional[CartonJuego]:
+        return self.cartones[0] if self.hay_jugador else None
+
+    @property
+    def cartones_ia(self) -> List[CartonJuego]:
+        return self.cartones[1:] if self.hay_jugador else self.cartones
+
+    def iniciar(self, retraso: float = RETRASO_INICIO) -> None:
+        """Programa la primera ronda; en modo instantáneo juega la partida entera"""
+        self.en_curso = True
+        self.programar(retraso, self.sortear)
+        if self.instantanea:
+            self.ejecutar_hasta_fin()
+
+    def sortear(self) -> Optional[int]:
+        """Una ronda: saca una pregunta y decide quién responde"""
+        if not self.en_curso:
+            return None
+        if not self.pool:
+            self.terminar(None)
+            return None
+
+        pregunta_id = self.pool.elegir()
+        self.ronda += 1
+        self.pregunta_actual = pregunta_id
+        ubicaciones = self.indice.ubicaciones(pregunta_id)
+
+        if not ubicaciones:
+            self._emitir(EVENTO_SIN_CARTON, pregunta_id=pregunta_id)
+            self.programar(RETRASO_SIN_CARTON, self.sortear)
+            return pregunta_id
+
+        jugador_tiene = self.hay_jugador and ubicaciones[0][0] == 0
+        self._emitir(EVENTO_PREGUNTA, pregunta_id=pregunta_id, ubicaciones=ubicaciones,
+                     jugador_tiene=jugador_tiene)
+
+        if jugador_tiene and not self.cartones[0].respondida(pregunta_id):
+            # Las IAs no responden hasta que el jugador conteste o se le acabe el tiempo
+            self._fin_turno = self.ahora + self.tiempo_jugador
+            self._reloj_mostrado = -1
+            self._turno = self.programar(self.tiempo_jugador, self.tiempo_agotado)
+            self._emitir(EVENTO_TURNO_JUGADOR, pregunta_id=pregunta_id, segundos=self.tiempo_jugador)
+            self._actualizar_reloj()
+            return pregunta_id
+
+        # La siguiente ronda llega cuando respondió la última IA
+        primera_ia = 1 if self.hay_jugador else 0
+        ultimo = 0.0
+        if self.ia_lote is not None:
+            if len(self.ia_lote.pendientes(pregunta_id)):
+                ultimo = self.rng.uniform(*RETRASO_IA)
+                self.programar(ultimo, lambda: self.responder_lote(pregunta_id))
+        else:
+            for carton in self.indice.pendientes(pregunta_id, desde=primera_ia):
+                retraso = self.rng.uniform(*RETRASO_IA)
+                ultimo = max(ultimo, retraso)
+                numero = self.indice.numero(carton.id)
+                self.programar(retraso, lambda numero=numero: self.responder_ia(numero, pregunta_id))
+        self.programar((ultimo or RETRASO_TRAS_RESPUESTA) + MARGEN_TRAS_IA, self.sortear)
+        return pregunta_id
+
+    def responder(self, pregunta_id: int, indice_opcion: int) -> Optional[bool]:
+        """
+        Respuesta del jugador con el índice original de la opción elegida.
+        Devuelve si fue correcta, o None si no correspondía responder: solo
+        vale para la pregunta del turno abierto, así que un doble toque o una
+        respuesta que llega tras agotarse el tiempo no cambian nada.
+        """
+        if not self.en_curso or self._turno is None or pregunta_id != self.pregunta_actual:
+            return None
+        self._cancelar_turno()
+
+        correcta = indice_opcion == self.banco.registro(pregunta_id).indice_correcto
+        self.aplicar_respuesta(0, pregunta_id, correcta)
+        self._emitir(EVENTO_RESPUESTA, carton=0, pregunta_id=pregunta_id, correcta=correcta, opcion=indice_opcion)
+        if self.en_curso:
+            self.programar(RETRASO_TRAS_RESPUESTA, self.sortear)
+        return correcta
+
+    def tiempo_agotado(self) -> None:
+        """El jugador no respondió a tiempo: la casilla queda incorrecta"""
+        if not self.en_curso or self._turno is None:
+            return
+        # Si lo llama quien aloja el motor, el vencimiento programado ya no debe correr
+        self._turno.cancelar()
+        self._turno = None
+        pregunta_id = self.pregunta_actual
+        self.aplicar_tiempo_agotado(pregunta_id)
+        self._emitir(EVENTO_RELOJ, segundos=0)
+        self._emitir(EVENTO_TIEMPO_AGOTADO, pregunta_id=pregunta_id)
+        self.programar(RETRASO_TIEMPO_AGOTADO, self.sortear)
+
+    def responder_ia(self, numero: int, pregunta_id: int) -> Optional[bool]:
+        """Respuesta de la IA del cartón `numero`; devuelve si acertó"""
+        if not self.en_curso or not 0 <= numero < len(self.cartones):
+            return None
+        carton = self.cartones[numero]
+        if not carton.tiene(pregunta_id) or carton.respondida(pregunta_id):
+            return None
+
+        correcta = self.rng.random() < self.probabilidad_de(numero)
+        self.aplicar_respuesta(numero, pregunta_id, correcta)
+        self._emitir(EVENTO_RESPUESTA, carton=numero, pregunta_id=pregunta_id, correcta=correcta, opcion=None)
+
+        # El bingo solo puede aparecer con un acierto
+        if correcta and carton.bingo() is not None:
+            self.terminar(self.nombre_carton(numero))
+        return correcta
+
+    def aplicar_respuesta(self, numero: int, pregunta_id: int, correcta: bool) -> None:
+        """
+        Marca una respuesta ya decidida y actualiza el pool. Lo usan los pasos
+        de la partida y la reproducción de registros (core.event_log).
+        """
+        carton = self.cartones[numero]
+        carton.marcar(pregunta_id, correcta)
+        if correcta:
+            self.pool.quitar(pregunta_id)
+            if numero == 0 and self.hay_jugador:
+                self.preguntas_ya_usadas.append(pregunta_id)
+        elif numero == 0 and self.hay_jugador:
+            # La pregunta vuelve al pool y la casilla puede volver a responderse
+            self.pool.agregar(pregunta_id)
+            carton.reiniciar(pregunta_id)
+        else:
+            self.pool.agregar(pregunta_id)
+            self._descartar_si_agotada(pregunta_id)
+
+    def aplicar_tiempo_agotado(self, pregunta_id: Optional[int]) -> None:
+        """La casilla del jugador queda incorrecta por tiempo"""
+        if self.hay_jugador and pregunta_id is not None:
+            carton = self.cartones[0]
+            if carton.tiene(pregunta_id) and not carton.respondida(pregunta_id):
+                carton.marcar(pregunta_id, False)
+                self._descartar_si_agotada(pregunta_id)
+
+    def responder_lote(self, pregunta_id: int) -> Optional[int]:
+        """Todas las IAs en lote responden la pregunta; devuelve cuántas acertaron"""
+        if not self.en_curso or self.ia_lote is None:
+            return None
+        respuestas = self.ia_lote.responder(pregunta_id)
+        aciertos = int(respuestas.correctas.sum())
+        if aciertos:
+            self.pool.quitar(pregunta_id)
+        elif len(respuestas.correctas):
+            self.pool.agregar(pregunta_id)
+            self._descartar_si_agotada(pregunta_id)
+        primera_ia = 1 if self.hay_jugador else 0
+        self._emitir(EVENTO_RESPUESTAS_IA, cartones=(respuestas.cartones + primera_ia).tolist(),
+                     pregunta_id=pregunta_id, correctas=respuestas.correctas.tolist())
+        if respuestas.ganador is not None:
+            self.terminar(self.nombre_carton(primera_ia + respuestas.ganador))
+        return aciertos
+
+    def probabilidad_de(self, numero: int) -> float:
+        """Probabilidad de acierto de la IA del cartón `numero`"""
+        ia = numero - 1 if self.hay_jugador else numero
+        return self.probabilidades_ia[ia] if 0 <= ia < len(self.probabilidades_ia) else self.probabilidad_ia
+
+    def _descartar_si_agotada(self, pregunta_id: int) -> None:
+        """
+        Una casilla fallada por la IA o por tiempo queda marcada como
+        incorrecta; si ningún cartón puede ya responder la pregunta, sale del
+        pool para que la partida no la sortee sin fin.
+        """
+        if self.ia_lote is None:
+            agotada = not self.indice.pendientes(pregunta_id)
+        else:
+            # Los cartones de IA en lote se sincronizan al final: se consulta MassAI
+            jugador = self.carton_jugador
+            agotada = not len(self.ia_lote.pendientes(pregunta_id)) and not (
+                jugador is not None and jugador.tiene(pregunta_id) and not jugador.respondida(pregunta_id))
+        if agotada:
+            self.pool.quitar(pregunta_id)
+
+    def cantar_bingo(self) -> bool:
+        """El jugador canta bingo; termina la partida si su cartón lo tiene"""
+        if not self.en_curso or not self.hay_jugador or self.cartones[0].bingo() is None:
+            return False
+        self.terminar("player")
+        return True
+
+    def nombre_carton(self, numero: int) -> str:
+        """Identificador de ganador del cartón: 'player' o 'IA_<n>' (desde 1)"""
+        if self.hay_jugador:
+            return "player" if numero == 0 else f"IA_{numero}"
+        return f"IA_{numero + 1}"
+
+    def terminar(self, ganador: Optional[str]) -> None:
+        if not self.en_curso:
+            return
+        self.detener()
+        if self.ia_lote is not None:
+            self.ia_lote.sincronizar()
+        self.ganador = ganador
+        # Los ganadores externos (p. ej. 'Jugador_2' en multijugador) no tienen cartón aquí
+        patron = next((carton.bingo() for numero, carton in enumerate(self.cartones)
+                       if self.nombre_carton(numero) == ganador), None)
+        self._emitir(EVENTO_FIN, ganador=ganador, patron=patron)
+
+    def estadisticas(self) -> List[Tuple[str, int, int]]:
+        """(ganador/nombre, aciertos, desaciertos) de cada cartón"""
+        return [(self.nombre_carton(numero), carton.aciertos(), carton.desaciertos())
+                for numero, carton in enumerate(self.cartones)]
@@ -0,0 +1,204 @@
+"""
+Simulación de partidas de Bingo Educativo
+Juega partidas solo entre IAs con el motor de rondas, repartidas entre
+procesos, para ajustar dificultades, tamaño de cartón y número de IAs.
+Cada partida usa una semilla derivada de (semilla, número de partida): el
+resultado es el mismo con cualquier número de procesos.
+
+Uso:
+    python -m core.simulation [--partidas N] [--ias Facil,Moderado,Dificil]
+                              [--preguntas-por-carton 8] [--semilla S] [--procesos P] [--en-lote]
+"""
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+import argparse
+import random
+import sys
+
+from .card_generator import PREGUNTAS_POR_CARTON, CardGenerator, preguntas_de_cartones
+from .question_bank import question_bank
+from .round_engine import PROBABILIDADES_IA, RoundEngine
+
+
+# Partidas por tarea de un proceso; fijo para que el reparto no cambie los resultados
+PARTIDAS_POR_LOTE = 2000
+
+
+class Escenario(NamedTuple):
+    """Reglas a simular: dificultad de cada IA, tamaño de cartón y de pool"""
+    dificultades: Tuple[str, ...]
+    preguntas_por_carton: int = PREGUNTAS_POR_CARTON
+    preguntas: int = 0  # 0 = todas las del banco
+    en_lote: bool = False  # IAs en lote (MassAI) para salas grandes
+
+
+def simular_partida(escenario: Escenario, preguntas: int, semilla: Any) -> Tuple[Optional[int], int, float]:
+    """
+    Una partida entre IAs con las reglas de la app.
+
+    Returns:
+        (IA ganadora desde 0 o None si se agotó el pool, rondas, segundos de juego)
+    """
+    rng = random.Random(semilla)
+    cartones = CardGenerator(range(preguntas), escenario.preguntas_por_carton, rng=rng) \
+        .generar_lote(len(escenario.dificultades))
+    motor = RoundEngine(rng=rng, ia_en_lote=escenario.en_lote)
+    motor.probabilidades_ia = [PROBABILIDADES_IA[dificultad] for dificultad in escenario.dificultades]
+    motor.repartir(None, cartones, preguntas_de_cartones(cartones, rng))
+    motor.iniciar()
+    ganador = motor.ejecutar_hasta_fin()
+    return (int(ganador.split('_', 1)[1]) - 1 if ganador else None), motor.ronda, motor.ahora
+
+
+def _simular_lote(tarea: Tuple[Escenario, int, Any, int, int]) -> Dict[str, Any]:
+    escenario, preguntas, semilla, inicio, fin = tarea
+    rondas: Counter = Counter()
+    victorias: Counter = Counter()
+    agotadas = 0
+    segundos = 0.0
+    for partida in range(inicio, fin):
+        ganador, ronda, tiempo = simular_partida(escenario, preguntas, f"{semilla}:{partida}")
+        segundos += tiempo
+        if ganador is None:
+            agotadas += 1
+        else:
+            rondas[ronda] += 1
+            victorias[ganador] += 1
+    return {'partidas': fin - inicio, 'rondas': rondas, 'victorias': victorias,
+            'agotadas': agotadas, 'segundos': segundos}
+
+
+def _lotes(escenario: Escenario, preguntas: int, partidas: int, semilla: Any) -> List[Tuple[Escenario, int, Any, int, int]]:
+    return [(escenario, preguntas, semilla, inicio, min(inicio + PARTIDAS_POR_LOTE, partidas))
+            for inicio in range(0, partidas, PARTIDAS_POR_LOTE)]
+
+
+def _ejecutar(tareas: Sequence[Any], procesos: Optional[int]) -> Iterator[Dict[str, Any]]:
+    if procesos == 1 or len(tareas) <= 1:
+        yield from map(_simular_lote, tareas)
+        return
+    try:
+        ejecutor = ProcessPoolExecutor(max_workers=procesos)
+    except (OSError, NotImplementedError, ImportError) as e:
+        print(f"[WARNING] Sin procesos de trabajo ({e}); se simula en serie")
+        yield from map(_simular_lote, tareas)
+        return
+    with ejecutor:
+        yield from ejecutor.map(_simular_lote, tareas)
+
+
+def simular(escenario: Escenario, partidas: int, semilla: Any = 0,
+            procesos: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Simula `partidas` partidas del escenario y resume los resultados.
+
+    Args:
+        procesos: Procesos de trabajo; None usa todos los núcleos y 1 simula en serie
+
+    Raises:
+        ValueError: Si una dificultad no existe o el pool no alcanza para un cartón
+    """
+    for dificultad in escenario.dificultades:
+        if dificultad not in PROBABILIDADES_IA:
+            raise ValueError(f"Dificultad desconocida: {dificultad} (disponibles: {', '.join(PROBABILIDADES_IA)})")
+    if not escenario.dificultades:
+        raise ValueError("Se necesita al menos una IA")
+    preguntas = escenario.preguntas or sum(question_bank.conteos().values())
+    if preguntas < escenario.preguntas_por_carton:
+        raise ValueError(f"Se necesitan al menos {escenario.preguntas_por_carton} preguntas "
+                         f"para un cartón y solo hay {preguntas}")
+
+    rondas: Counter = Counter()
+    victorias: Counter = Counter()
+    agotadas = 0
+    segundos = 0.0
+    for lote in _ejecutar(_lotes(escenario, preguntas, partidas, semilla), procesos):
+        rondas.update(lote['rondas'])
+        victorias.update(lote['victorias'])
+        agotadas += lote['agotadas']
+        segundos += lote['segundos']
+    return resumir(escenario, preguntas, partidas, rondas, victorias, agotadas, segundos)
+
+
+def _percentil(histograma: Dict[int, int], fraccion: float) -> int:
+    total = sum(histograma.values())
+    acumulado = 0
+    for valor in sorted(histograma):
+        acumulado += histograma[valor]
+        if acumulado >= fraccion * total:
+            return valor
+    return 0
+
+
+def resumir(escenario: Escenario, preguntas: int, partidas: int, rondas: Dict[int, int],
+            victorias: Dict[int, int], agotadas: int, segundos: float) -> Dict[str, Any]:
+    """Resumen de una simulación a partir de sus conteos"""
+    bingos = partidas - agotadas
+    asientos = Counter(escenario.dificultades)
+    por_dificultad: Counter = Counter()
+    for ia, ganadas in victorias.items():
+        por_dificultad[escenario.dificultades[ia]] += ganadas
+    return {
+        'escenario': escenario._asdict(),
+        'preguntas': preguntas,
+        'partidas': partidas,
+        'bingos': bingos,
+        'agotadas': agotadas,
+        'tasa_agotadas': agotadas / partidas if partidas else 0.0,
+        'rondas_bingo': {
+            'histograma': dict(sorted(rondas.items())),
+            'media': sum(r * n for r, n in rondas.items()) / bingos if bingos else 0.0,
+            'p10': _percentil(rondas, 0.1),
+            'p50': _percentil(rondas, 0.5),
+            'p90': _percentil(rondas, 0.9)
+        },
+        # Victorias por IA de cada dificultad, sobre el total de partidas
+        'tasa_victoria': {dificultad: por_dificultad[dificultad] / (partidas * asientos[dificultad])
+                          for dificultad in asientos} if partidas else {},
+        'segundos_medios': segundos / partidas if partidas else 0.0
+    }
+
+
+def imprimir_simulacion(resumen: Dict[str, Any]) -> None:
+    """Muestra el resumen de una simulación en consola"""
+    escenario = resumen['escenario']
+    ias = ', '.join(f"{n}x {dificultad}" for dificultad, n in Counter(escenario['dificultades']).items())
+    print(f"[SIM] {resumen['partidas']} partidas, IAs: {ias}, "
+          f"{escenario['preguntas_por_carton']} preguntas por cartón, pool de {resumen['preguntas']}")
+    print(f"[SIM] Con bingo: {resumen['bingos']}  Pool agotado: {resumen['agotadas']} "
+          f"({resumen['tasa_agotadas']:.1%})")
+    rondas = resumen['rondas_bingo']
+    print(f"[SIM] Rondas hasta el bingo: media {rondas['media']:.1f} "
+          f"(p10 {rondas['p10']}, p50 {rondas['p50']}, p90 {rondas['p90']})")
+    print("[SIM] Victorias por IA de cada dificultad:")
+    for dificultad, tasa in resumen['tasa_victoria'].items():
+        print(f"  {dificultad:<10} {tasa:>7.1%}")
+    print(f"[SIM] Duración media de una partida: {resumen['segundos_medios']:.0f} s de juego")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Simula partidas entre IAs")
+    parser.add_argument('--partidas', type=int, default=10000, help="Número de partidas")
+    parser.add_argument('--ias', default='Moderado', help="Dificultad de cada IA, separadas por comas")
+    parser.add_argument('--preguntas-por-carton', type=int, default=PREGUNTAS_POR_CARTON)
+    parser.add_argument('--preguntas', type=int, default=0, help="Tamaño del pool (0 = banco completo)")
+    parser.add_argument('--semilla', default='0', help="Semilla para reproducir resultados")
+    parser.add_argument('--en-lote', action='store_true', help="Responder con todas las IAs en lote (NumPy)")
+    parser.add_argument('--procesos', type=int, default=None, help="Procesos de trabajo (por defecto, todos los núcleos)")
+    args = parser.parse_args(argv)
+
+    escenario = Escenario(tuple(d.strip() for d in args.ias.split(',') if d.strip()),
+                          args.preguntas_por_carton, args.preguntas, args.en_lote)
+    try:
+        resumen = simular(escenario, args.partidas, args.semilla, args.procesos)
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        return 2
+    imprimir_simulacion(resumen)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -23,6 +23,7 @@ import random
 # from dotenv import load_dotenv  # Eliminado para modo offline
 import socket
 import threading
+from functools import partial
 from kivy.network.urlrequest import UrlRequest
 from kivymd.uix.textfield import MDTextField
 from kivymd.uix.scrollview import MDScrollView
@@ -38,6 +39,22 @@ from utils.screen_utils import ScreenUtils, ImageConfig
 # Importar utilidades de multijugador
 from utils.multiplayer_utils import ConnectionManager, MultiplayerUtils
 
+# Banco de preguntas compilado
+from core.question_bank import question_bank
+from core.question_record import CartonJuego, IndicePreguntas, RegistroPregunta
+from core.card_generator import CardGenerator, generar_partida, preguntas_de_cartones
+from core.question_pool import QuestionPool
+from core import mass_ai
+from core.event_log import EventLog
+from core.round_engine import (
+    EVENTO_FIN, EVENTO_PREGUNTA, EVENTO_RELOJ, EVENTO_RESPUESTA, EVENTO_RESPUESTAS_IA, EVENTO_SIN_CARTON,
+    EVENTO_TIEMPO_AGOTADO, EVENTO_TURNO_JUGADOR, PROBABILIDADES_IA, VELOCIDADES, RoundEngine
+)
+
+# Carga de arranque en segundo plano
+from utils.startup_loader import StartupLoader, decodificar_imagen, registrar_textura
+from utils.constants import ImageFiles
+
 # Cargar variables de entorno
 # load_dotenv()  # Eliminado para modo offline
 
@@ -216,17 +233,14 @@ class MultiplayerScreen(MDScreen):
                 print(f"[DEBUG] Datos recibidos del host: {info.keys()}")
                 app = MDApp.get_running_app()
                 if isinstance(app, BingoApp):
-                    if 'carton' in info and 'preguntas_globales' in info:
-                        # Asignar el cartón y la lista global de preguntas al cliente (inicio de partida)
-                        app.cartones_jugador = [info['carton']]
-                        app.preguntas_disponibles = info['preguntas_globales']
-                        app.preguntas_ya_usadas = []
-                        app.game_in_progress = True
-                        print("[DEBUG] Cartón y preguntas globales asignados al cliente.")
-                        app.cambiar_pantalla('game', 'up')
-                        # Iniciar el flujo de preguntas de manera autónoma
-                        if hasattr(app, 'iniciar_juego_automatico'):
-                            app.iniciar_juego_automatico()
+                    if 'semilla' in info and 'asiento' in info:
+                        # El cliente reconstruye su cartón y el orden de preguntas con la semilla del host
+                        if app.preparar_partida_sembrada(info):
+                            print("[DEBUG] Cartón y preguntas globales reconstruidos en el cliente.")
+                            app.cambiar_pantalla('game', 'up')
+                            # Iniciar el flujo de preguntas de manera autónoma
+                            if hasattr(app, 'iniciar_juego_automatico'):
+                                app.iniciar_juego_automatico()
         except Exception as e:
             print(f"[ERROR] Al recibir datos del host: {e}")
 
@@ -302,86 +316,29 @@ class MultiplayerScreen(MDScreen):
             # 1. Generar cartones únicos para cada jugador
             num_jugadores = len(self.connected_players) + 1  # +1 por el host
             print(f"[DEBUG] Generando cartones para {num_jugadores} jugadores...")
-            # Usar la lógica de cargar_juego_data pero adaptada para multijugador
-            import os, json, random
-            all_questions = []
-            base_dir = 'cartones'
-            categorias_encontradas = [d for d in os.listdir(base_dir) if os.path.isdir(os.path.join(base_dir, d))]
-            for categoria in categorias_encontradas:
-                categoria_dir = os.path.join(base_dir, categoria)
-                for archivo in os.listdir(categoria_dir):
-                    if archivo.endswith('.json'):
-                        ruta_archivo = os.path.join(categoria_dir, archivo)
-                        try:
-                            with open(ruta_archivo, 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-                                preguntas = data.get('preguntas', [])
-                                for i, pregunta in enumerate(preguntas):
-                                    pregunta = pregunta.copy()
-                                    pregunta['categoria'] = categoria
-                                    pregunta['id'] = f"{categoria}_{archivo}_{i}"
-                                    pregunta['respondida'] = False
-                                    pregunta['correcta'] = False
-                                    if 'opciones' in pregunta and isinstance(pregunta['opciones'], list):
-                                        respuesta_correcta = pregunta.get('respuesta_correcta')
-                                        opciones = pregunta['opciones'].copy()
-                                        random.shuffle(opciones)
-                                        pregunta['opciones'] = opciones
-                                        if respuesta_correcta in opciones:
-                                            pregunta['respuesta_correcta'] = respuesta_correcta
-                                            pregunta['indice_correcto'] = opciones.index(respuesta_correcta)
-                                    all_questions.append(pregunta)
-                        except Exception as e:
-                            print(f"Error procesando {ruta_archivo}: {e}")
-            if not all_questions:
-                self.mostrar_error("No se encontraron preguntas en los archivos locales. Asegúrate de tener al menos una categoría con preguntas válidas.")
+            # La partida es función de (versión del banco, semilla, jugadores, categorías):
+            # cada cliente reconstruye su cartón y el orden de preguntas localmente
+            partida = {
+                'banco': question_bank.version_contenido(),
+                'semilla': random.getrandbits(32),
+                'jugadores': num_jugadores,
+                'categorias': app.categorias_partida()
+            }
+            if not app.preparar_partida_sembrada(dict(partida, asiento=0)):
+                self.mostrar_error("No hay suficientes preguntas válidas en los archivos locales")
                 return
-            # Crear cartones únicos
-            cartones = []
-            for _ in range(num_jugadores):
-                preguntas_seleccionadas = []
-                categorias_usadas = set()
-                while len(preguntas_seleccionadas) < 8:
-                    pregunta = random.choice(all_questions)
-                    if pregunta not in preguntas_seleccionadas:
-                        preguntas_seleccionadas.append(pregunta)
-                        categorias_usadas.add(pregunta['categoria'])
-                random.shuffle(preguntas_seleccionadas)
-                carton = {
-                    'preguntas': preguntas_seleccionadas,
-                    'categorias': list(categorias_usadas),
-                    'id': f"carton_{random.randint(100000, 999999)}",
-                    'estructura': {
-                        'filas': 2,
-                        'columnas': 4
-                    }
-                }
-                cartones.append(carton)
-            # Generar lista global de preguntas (orden de turnos)
-            preguntas_globales = []
-            for carton in cartones:
-                preguntas_globales.extend(carton['preguntas'])
-            preguntas_globales = list({p['id']: p for p in preguntas_globales}.values())
-            random.shuffle(preguntas_globales)
-            # Asignar cartón y preguntas globales al host
-            app.cartones_jugador = [cartones[0]]
-            app.preguntas_disponibles = preguntas_globales.copy()
-            app.preguntas_ya_usadas = []
-            # Enviar a cada cliente su cartón y la lista global usando la función robusta
+            # Enviar a cada cliente los datos de la partida y su asiento usando la función robusta
             if hasattr(self.manager.get_screen('multiplayer'), 'asignar_cartones_y_enviar_wifi'):
-                self.manager.get_screen('multiplayer').asignar_cartones_y_enviar_wifi(cartones, preguntas_globales)
+                self.manager.get_screen('multiplayer').asignar_cartones_y_enviar_wifi(partida)
             else:
                 # Fallback: método antiguo
                 for idx, (client, addr) in enumerate(self.connected_players, 1):
                     try:
-                        data = {
-                            'carton': cartones[idx],
-                            'preguntas_globales': preguntas_globales
-                        }
+                        data = dict(partida, asiento=idx)
                         client.send(json.dumps(data).encode('utf-8'))
-                        print(f"[DEBUG] Cartón enviado a cliente {addr}")
+                        print(f"[DEBUG] Partida enviada a cliente {addr}")
                     except Exception as e:
-                        print(f"[ERROR] No se pudo enviar cartón a {addr}: {e}")
+                        print(f"[ERROR] No se pudo enviar la partida a {addr}: {e}")
             self.game_started = True
             self.ids.connection_status.text = "Estado: Iniciando juego..."
             app.game_in_progress = True
@@ -486,6 +443,7 @@ class LoginScreen(MDScreen):
         self.name = 'login'
         self.selected_difficulty = "Facil"
         self.selected_num_ais = 1
+        self.selected_speed = "1x"
 
     def update_difficulty(self, difficulty):
         """Actualiza la dificultad seleccionada y desactiva los otros switches."""
@@ -515,6 +473,14 @@ class LoginScreen(MDScreen):
             self.ids.one_ai.active = False
             self.ids.three_ais.active = False
 
+    def update_speed(self, speed):
+        """Actualiza la velocidad de la partida y desactiva los otros switches."""
+        self.selected_speed = speed
+        switches = {"1x": self.ids.speed_1x, "4x": self.ids.speed_4x, "instantanea": self.ids.speed_instant}
+        for valor, switch in switches.items():
+            if valor != speed:
+                switch.active = False
+
     def start_game(self, player_name):
         if player_name:
             app = MDApp.get_running_app()
@@ -522,6 +488,7 @@ class LoginScreen(MDScreen):
                 app.player_name = player_name
                 app.ai_difficulty = self.selected_difficulty
                 app.num_ai_players = self.selected_num_ais
+                app.establecer_velocidad(self.selected_speed)
 
                 # Iniciar la carga de datos y el juego
                 if app.cargar_juego_data():
@@ -582,12 +549,24 @@ class LoadingScreen(MDScreen):
         self.ids = self.ids if hasattr(self, 'ids') else {}
         self.carga_completa = False
         self.animar_loading()
-        self.simular_carga()
         self.frase_actual = ''
         self.cambiar_frase()
+        # El progreso lo publica el cargador de arranque iniciado en build()
+        app = MDApp.get_running_app()
+        loader = getattr(app, 'startup_loader', None)
+        if loader:
+            loader.suscribir(self.actualizar_carga)
+        else:
+            self.actualizar_carga(100, True)
         # Esperar a que la pantalla tenga tamaño válido antes de animar destellos
         Clock.schedule_once(self.iniciar_destellos, 0.1)
 
+    def on_leave(self):
+        app = MDApp.get_running_app()
+        loader = getattr(app, 'startup_loader', None)
+        if loader:
+            loader.desuscribir(self.actualizar_carga)
+
     def animar_destellos(self):
         for i in range(1, 9):
             glow = self.ids.get(f'glow{i}')
@@ -631,7 +610,18 @@ class LoadingScreen(MDScreen):
             anim = Animation(opacity=1, font_size=70, duration=0.7, t='out_back')
             anim.start(self.ids['loading_text'])
 
-    def simular_carga(self):
+    def actualizar_carga(self, progreso: int, completado: bool):
+        """Recibe el progreso real del cargador de arranque."""
+        self.progress = progreso
+        self.mostrar_progreso(completado)
+        if completado and not self.carga_completa:
+            self.carga_completa = True
+            # Mostrar y animar el mensaje de tap
+            if 'loading_tap' in self.ids:
+                self.ids['loading_tap'].opacity = 1
+                self.animar_tap()
+
+    def mostrar_progreso(self, completado: bool = False):
         if 'loading_bar' in self.ids and 'loading_percent' in self.ids:
             self.ids['loading_bar'].value = self.progress
             # Animar el glow de la barra
@@ -647,27 +637,19 @@ class LoadingScreen(MDScreen):
             # Asegurarse de que el texto no sea vertical
             if '\n' in actual:
                 actual = actual.replace('\n', '')
+            actual = actual.replace('%', '')
             if actual.isdigit():
-                actual = int(actual.replace('%',''))
+                actual = int(actual)
             else:
                 actual = 100
             if actual < self.progress:
                 Animation.cancel_all(self.ids['loading_percent'])
                 anim = Animation(text_color=(1,1,1,1), duration=0.05) + Animation(text_color=(0.2,0.7,1,1), duration=0.15)
                 anim.start(self.ids['loading_percent'])
-            if self.progress < 100:
+            if not completado:
                 self.ids['loading_percent'].text = f"{self.progress}%"
             else:
                 self.ids['loading_percent'].text = '¡Listo!'
-        if self.progress < 100:
-            self.progress += 1
-            Clock.schedule_once(lambda dt: self.simular_carga(), 0.015)
-        else:
-            self.carga_completa = True
-            # Mostrar y animar el mensaje de tap
-            if 'loading_tap' in self.ids:
-                self.ids['loading_tap'].opacity = 1
-                self.animar_tap()
 
     def animar_tap(self):
         if 'loading_tap' in self.ids:
@@ -703,12 +685,18 @@ class SplashScreen(MDScreen):
 class BingoApp(MDApp):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        # Reglas de la ronda (cartones, pool, temporizador, IAs); la app solo
+        # avanza su reloj y refleja sus eventos en la interfaz
+        self.motor = RoundEngine()
+        # El registro se conecta antes que la interfaz para tener el fin de partida al guardarlo
+        self.registro_partida = EventLog()
+        self.registro_partida.conectar(self.motor)
+        self.motor.suscribir(self.on_evento_ronda)
+        self.reloj_motor = None
         self.cartones: Dict[str, List[Dict[str, Any]]] = {}
-        self.cartones_jugador: List[Dict[str, Any]] = []
-        self.cartones_ia: List[Dict[str, Any]] = []
         self.num_ai_players: int = 1
-        self.preguntas_disponibles: List[Dict[str, Any]] = []
-        self.preguntas_ya_usadas: List[Dict[str, Any]] = []
+        # Semilla de la partida para el orden de las opciones
+        self.semilla_partida: int = 0
         self.categoria_actual: Optional[str] = None
         # self.db: Optional[Database] = None  # Eliminado para modo offline
         self.sounds: Dict[str, Any] = {}
@@ -716,17 +704,14 @@ class BingoApp(MDApp):
             'animales', 'deportes', 'geografia', 'historia', 'literatura', 'medicina', 'mujeres',
             'frases_celebres', 'inventos', 'transporte', 'arte', 'monumentos', 'matematicas', 'teologia', 'ciencia'
         ]
-        self.game_in_progress = False
         self.player_name: str = "Jugador 1"
         self.ai_difficulty: str = "Moderado"
-        self.ai_probabilities = {
-            "Facil": 0.6,
-            "Moderado": 0.75,
-            "Dificil": 0.9
-        }
+        self.ai_probabilities = dict(PROBABILIDADES_IA)
+        # Escala de tiempo de las rondas: "1x", "4x" o "instantanea" (demos y pruebas)
+        self.velocidad_juego: str = "1x"
         self.sm = None  # ScreenManager
-        self.player_timer = None
-        self.pregunta_actual_multijugador: Optional[Dict[str, Any]] = None # Para almacenar la pregunta actual del host
+        self.startup_loader: Optional[StartupLoader] = None
+        self.pregunta_actual_multijugador: Optional[RegistroPregunta] = None # Para almacenar la pregunta actual del host
         print("BingoApp: Inicialización completada")
 
     def configurar_pantalla(self) -> None:
@@ -750,21 +735,48 @@ class BingoApp(MDApp):
             Window.minimum_width = 320
             Window.minimum_height = 480
 
+    # Número de IAs a partir del cual responden en lote
+    IAS_EN_LOTE = 50
+
+    SONIDOS = {
+        'click': 'sounds/click.wav',
+        'correct': 'sounds/correct.wav',
+        'wrong': 'sounds/wrong.wav',
+        'bingo': 'sounds/bingo.wav'
+    }
+
     def cargar_sonidos(self) -> None:
         # Crear directorio de sonidos si no existe
         if not os.path.exists('sounds'):
             os.makedirs('sounds')
             
         # Sonidos básicos
-        self.sounds['click'] = SoundLoader.load('sounds/click.wav')
-        self.sounds['correct'] = SoundLoader.load('sounds/correct.wav')
-        self.sounds['wrong'] = SoundLoader.load('sounds/wrong.wav')
-        self.sounds['bingo'] = SoundLoader.load('sounds/bingo.wav')
-        
-        # Ajustar volumen
-        for sound in self.sounds.values():
-            if sound:
-                sound.volume = 0.5
+        for nombre, ruta in self.SONIDOS.items():
+            self.registrar_sonido(nombre, SoundLoader.load(ruta))
+
+    def registrar_sonido(self, nombre: str, sound: Any) -> None:
+        """Guarda un sonido cargado y ajusta su volumen."""
+        self.sounds[nombre] = sound
+        if sound:
+            sound.volume = 0.5
+
+    def precargar_preguntas(self) -> int:
+        """Compila o lee el banco y materializa las categorías del juego."""
+        disponibles = question_bank.categorias()
+        return len(question_bank.registros(c for c in self.categorias if c in disponibles))
+
+    def crear_cargador_inicio(self) -> StartupLoader:
+        """Prepara las tareas de arranque que se ejecutan durante el splash."""
+        loader = StartupLoader()
+        loader.agregar_tarea('preguntas', self.precargar_preguntas, peso=3)
+        for nombre, ruta in self.SONIDOS.items():
+            loader.agregar_tarea(f'sonido {nombre}', partial(SoundLoader.load, ruta),
+                                 al_terminar=partial(self.registrar_sonido, nombre))
+        for ruta in (ImageFiles.BACKGROUND_MAIN, ImageFiles.BACKGROUND_WOOD, ImageFiles.LOGO):
+            if os.path.exists(ruta):
+                loader.agregar_tarea(f'imagen {ruta}', partial(decodificar_imagen, ruta),
+                                     al_terminar=partial(registrar_textura, ruta))
+        return loader
 
     # def conectar_mongodb(self) -> None:  # Eliminado para modo offline
     #     try:
@@ -806,8 +818,10 @@ class BingoApp(MDApp):
         from screens.game_screen import GameScreen
         self.sm.add_widget(GameScreen(name='game'))
         
-        # Cargar sonidos y conectar a MongoDB
-        self.cargar_sonidos()
+        # Cargar preguntas, sonidos e imágenes en segundo plano mientras
+        # se muestran el splash y la pantalla de carga
+        self.startup_loader = self.crear_cargador_inicio()
+        self.startup_loader.iniciar()
         # self.conectar_mongodb()
         
         print("BingoApp: Build completado")
@@ -827,48 +841,21 @@ class BingoApp(MDApp):
 
     def cargar_juego_data(self) -> bool:
         """Carga todos los cartones y prepara las preguntas para el juego desde archivos JSON locales."""
-        import os
-        import json
-        import random
-        all_questions = []
-        base_dir = 'cartones'
         try:
-            # Recorrer cada categoría (carpeta)
+            # Consultar el banco compilado en lugar de recorrer los JSON
+            categorias_banco = question_bank.categorias()
             for categoria in self.categorias:
-                categoria_dir = os.path.join(base_dir, categoria)
-                if not os.path.isdir(categoria_dir):
+                if categoria not in categorias_banco:
                     print(f"[ADVERTENCIA] No existe la carpeta de categoría: {categoria} (se ignora)")
-                    continue
-                for archivo in os.listdir(categoria_dir):
-                    if archivo.endswith('.json'):
-                        ruta_archivo = os.path.join(categoria_dir, archivo)
-                        try:
-                            with open(ruta_archivo, 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-                                preguntas = data.get('preguntas', [])
-                                for i, pregunta in enumerate(preguntas):
-                                    pregunta = pregunta.copy()
-                                    pregunta['categoria'] = categoria
-                                    pregunta['id'] = f"{categoria}_{archivo}_{i}"
-                                    pregunta['respondida'] = False
-                                    pregunta['correcta'] = False
-                                    if 'opciones' in pregunta and isinstance(pregunta['opciones'], list):
-                                        respuesta_correcta = pregunta.get('respuesta_correcta')
-                                        opciones = pregunta['opciones'].copy()
-                                        random.shuffle(opciones)
-                                        pregunta['opciones'] = opciones
-                                        if respuesta_correcta in opciones:
-                                            pregunta['respuesta_correcta'] = respuesta_correcta
-                                            pregunta['indice_correcto'] = opciones.index(respuesta_correcta)
-                                    all_questions.append(pregunta)
-                        except Exception as e:
-                            print(f"Error procesando {ruta_archivo}: {e}")
-
-            if not all_questions:
-                print("No se encontraron preguntas en los archivos locales.")
+            registros = question_bank.registros(self.categorias)
+
+            try:
+                generador = CardGenerator(registro.id for registro in registros)
+            except ValueError as e:
+                print(f"No hay suficientes preguntas en los archivos locales: {e}")
                 dialog = MDDialog(
                     title="Error",
-                    text="No se encontraron preguntas en los archivos locales. Por favor, contacta al administrador.",
+                    text="No se encontraron suficientes preguntas en los archivos locales. Por favor, contacta al administrador.",
                     buttons=[
                         MDRaisedButton(
                             text="OK",
@@ -879,53 +866,16 @@ class BingoApp(MDApp):
                 dialog.open()
                 return False
 
-            # Crear cartones mixtos
-            cartones_mixtos = []
+            # Crear cartones mixtos (8 preguntas de cualquier categoría por cartón)
             required_cartones = 1 + self.num_ai_players  # 1 para jugador + IAs
-            for _ in range(required_cartones):
-                preguntas_seleccionadas = []
-                categorias_usadas = set()
-                # Seleccionar 8 preguntas aleatorias (de cualquier categoría)
-                while len(preguntas_seleccionadas) < 8:
-                    pregunta = random.choice(all_questions)
-                    if pregunta not in preguntas_seleccionadas:
-                        preguntas_seleccionadas.append(pregunta)
-                        categorias_usadas.add(pregunta['categoria'])
-                random.shuffle(preguntas_seleccionadas)
-                carton = {
-                    'preguntas': preguntas_seleccionadas,
-                    'categorias': list(categorias_usadas),
-                    'id': f"carton_{random.randint(100000, 999999)}",
-                    'estructura': {
-                        'filas': 2,
-                        'columnas': 4
-                    }
-                }
-                cartones_mixtos.append(carton)
-
-            # Asignar cartones
-            self.cartones_jugador = [cartones_mixtos[0]]
-            self.cartones_ia = cartones_mixtos[1:]
-
-            # Inicializar estado de preguntas para el jugador y las IAs
-            all_players_cartones = self.cartones_jugador + self.cartones_ia
-            for carton in all_players_cartones:
-                if isinstance(carton, dict):
-                    for pregunta in carton.get('preguntas', []) or []:
-                        if isinstance(pregunta, dict):
-                            pregunta['respondida'] = False
-                            pregunta['correcta'] = False
-                            if 'id' not in pregunta:
-                                pregunta['id'] = f"{carton['id']}_{random.randint(100000, 999999)}"
-
-            # Preparar lista de preguntas disponibles para el juego automático
-            all_game_questions = []
-            for carton in cartones_mixtos:
-                if isinstance(carton, dict):
-                    all_game_questions.extend(carton.get('preguntas', []) or [])
-            self.preguntas_disponibles = list({pregunta['id']: pregunta for pregunta in all_game_questions if isinstance(pregunta, dict) and 'id' in pregunta}.values())
-            random.shuffle(self.preguntas_disponibles)
-            self.preguntas_ya_usadas = []
+            cartones_mixtos = generador.generar_lote(required_cartones)
+
+            # Asignar cartones y preparar las preguntas disponibles para el juego automático
+            self.motor.probabilidad_ia = self.ai_probabilities.get(self.ai_difficulty, 0.75)
+            # Con muchas IAs (bots de relleno de una clase) responden todas en lote
+            self.motor.ia_en_lote = mass_ai.np is not None and self.num_ai_players >= self.IAS_EN_LOTE
+            self.semilla_partida = random.getrandbits(32)
+            self.repartir_cartones(cartones_mixtos[0], cartones_mixtos[1:], preguntas_de_cartones(cartones_mixtos))
 
             return True
         except Exception as e:
@@ -949,41 +899,120 @@ class BingoApp(MDApp):
         # Verifica si los cartones ya fueron asignados.
         return len(self.cartones_jugador) > 0 and len(self.cartones_ia) == self.num_ai_players
 
-    def obtener_pregunta_por_id(self, carton_id: str, pregunta_id: str) -> Optional[Dict[str, Any]]:
+    def repartir_cartones(self, carton_jugador: CartonJuego, cartones_ia: List[CartonJuego],
+                          preguntas: List[int]) -> None:
+        """Entrega al motor los cartones y el orden de preguntas de la partida"""
+        self.detener_reloj_motor()
+        self.motor.repartir(carton_jugador, cartones_ia, preguntas, self.semilla_partida)
+        self._game_finished_dialog_shown = False
+
+    # Estado de la partida: vive en el motor de rondas
+    @property
+    def cartones_jugador(self) -> List[CartonJuego]:
+        carton = self.motor.carton_jugador
+        return [carton] if carton is not None else []
+
+    @property
+    def cartones_ia(self) -> List[CartonJuego]:
+        return self.motor.cartones_ia
+
+    @property
+    def indice_preguntas(self) -> IndicePreguntas:
+        return self.motor.indice
+
+    @property
+    def preguntas_disponibles(self) -> QuestionPool:
+        return self.motor.pool
+
+    @property
+    def preguntas_ya_usadas(self) -> List[int]:
+        return self.motor.preguntas_ya_usadas
+
+    @property
+    def game_in_progress(self) -> bool:
+        return self.motor.en_curso
+
+    @game_in_progress.setter
+    def game_in_progress(self, valor: bool) -> None:
+        if valor:
+            self.motor.en_curso = True
+        else:
+            # Salir de la pantalla de juego: descartar lo que estuviera programado
+            self.motor.detener()
+            self.detener_reloj_motor()
+
+    def categorias_partida(self) -> List[str]:
+        """Categorías elegidas que existen en el banco, en el orden de la selección"""
+        disponibles = question_bank.categorias()
+        return [categoria for categoria in self.categorias if categoria in disponibles]
+
+    def preparar_partida_sembrada(self, partida: Dict[str, Any]) -> bool:
+        """
+        Prepara una partida multijugador a partir de los datos del host
+        ({'banco', 'semilla', 'jugadores', 'categorias', 'asiento'}): genera los
+        cartones de todos los asientos con las categorías que eligió el host y
+        se queda con el propio. Devuelve False si el banco local no coincide
+        con el del host o no alcanza para los cartones.
+        """
+        version = question_bank.version_contenido()
+        if partida['banco'] != version:
+            print(f"[ERROR] El banco de preguntas local ({version}) no coincide con el del host ({partida['banco']})")
+            return False
+        # Un host sin 'categorias' usaba el banco completo
+        categorias = partida.get('categorias', question_bank.categorias())
+        faltantes = [c for c in categorias if c not in question_bank.categorias()]
+        if faltantes:
+            print(f"[ERROR] El banco local no tiene las categorías del host: {', '.join(faltantes)}")
+            return False
+        try:
+            ids = [registro.id for registro in question_bank.registros(categorias)]
+            cartones, orden = generar_partida(ids, version, partida['semilla'], partida['jugadores'])
+        except ValueError as e:
+            print(f"[ERROR] No se pudo generar la partida: {e}")
+            return False
+        if not 0 <= partida['asiento'] < len(cartones):
+            print(f"[ERROR] Asiento {partida['asiento']} fuera de rango para {len(cartones)} jugadores")
+            return False
+        self.semilla_partida = partida['semilla']
+        self.repartir_cartones(cartones[partida['asiento']], [], orden)
+        self.game_in_progress = True
+        return True
+
+    def obtener_pregunta_por_id(self, carton_id: str, pregunta_id: int) -> Optional[RegistroPregunta]:
         # Esta función puede seguir siendo útil si necesitas encontrar una pregunta específica
         # Buscar en los cartones asignados (jugador e IAs)
-        all_assigned_cartones = self.cartones_jugador + self.cartones_ia
-        for carton in all_assigned_cartones:
-            if isinstance(carton, Dict) and str(carton.get('_id')) == carton_id:
-                for pregunta in carton.get('preguntas', []) or []:
-                    if isinstance(pregunta, Dict) and pregunta.get('id') == pregunta_id:
-                        return pregunta
+        numero = self.indice_preguntas.numero(carton_id)
+        if numero >= 0 and self.indice_preguntas.cartones[numero].tiene(pregunta_id):
+            return question_bank.registro(pregunta_id)
         return None
 
-    def verificar_bingo(self, carton: Dict[str, Any]) -> bool:
-        """Verifica si un cartón tiene bingo (todas las preguntas respondidas correctamente)."""
-        if not isinstance(carton, Dict):
-            print("Error: Cartón no es un diccionario válido")
+    def verificar_bingo(self, carton: CartonJuego) -> bool:
+        """Verifica si un cartón completó un patrón de victoria (por defecto, el cartón lleno)."""
+        if not isinstance(carton, CartonJuego):
+            print("Error: Cartón no es un cartón válido")
             return False
             
-        preguntas = carton.get('preguntas', []) or []
-        if not preguntas:
+        if not len(carton):
             print("Error: Cartón no tiene preguntas")
             return False
-            
-        # Contar preguntas respondidas correctamente
-        preguntas_correctas = sum(1 for p in preguntas if isinstance(p, Dict) and p.get('respondida', False) and p.get('correcta', False))
-        total_preguntas = len(preguntas)
         
-        print(f"Verificando bingo - Preguntas correctas: {preguntas_correctas}/{total_preguntas}")
+        # El patrón ganador se actualiza al marcar cada casilla; aquí solo se consulta
+        patron = carton.bingo()
         
-        # Verificar si todas las preguntas están respondidas correctamente
-        tiene_bingo = preguntas_correctas == total_preguntas
-        
-        if tiene_bingo:
-            print(f"¡Bingo detectado! Cartón: {carton.get('id', 'N/A')}")
+        if patron is not None:
+            print(f"¡Bingo detectado! Cartón: {carton.id} ({patron.nombre})")
             
-        return tiene_bingo
+        return patron is not None
+
+    def cantar_bingo(self) -> bool:
+        """El jugador canta bingo; el motor lo comprueba y termina la partida si es válido"""
+        if self.motor.en_curso:
+            return self.motor.cantar_bingo()
+        # Partida ya detenida: solo se vuelve a mostrar el resultado
+        if self.cartones_jugador and self.verificar_bingo(self.cartones_jugador[0]):
+            self.terminar_juego(winner="player")
+            return True
+        return False
 
     def iniciar_juego_automatico(self):
         """Inicia el flujo de preguntas automáticas"""
@@ -999,8 +1028,6 @@ class BingoApp(MDApp):
                   game_screen.mostrar_dialogo("Error de Inicio", "No se pudieron cargar los datos del juego. Inténtalo de nuevo.")
              return
 
-        self.game_in_progress = True
-        
         # Asegurarse de que la pantalla de juego muestre el cartón inicial
         game_screen = None
         if self.sm:
@@ -1008,285 +1035,164 @@ class BingoApp(MDApp):
              if game_screen:
                   print("DEBUG: Mostrando cartón inicial")
                   game_screen.mostrar_cartones() # Mostrar el cartón del jugador
-                  # Esperar un momento antes de mostrar la primera pregunta
-                  Clock.schedule_once(lambda dt: self.mostrar_siguiente_pregunta(), 1)
-
-    def mostrar_siguiente_pregunta(self):
-        """Selecciona y muestra la siguiente pregunta aleatoria (una ronda)."""
-        if not self.game_in_progress or not self.preguntas_disponibles:
-            print("No quedan preguntas disponibles o juego no en progreso. Terminando juego.")
-            self.terminar_juego() 
-            return
-
-        # Seleccionar una pregunta aleatoria del pool
-        pregunta_actual_data = random.choice(self.preguntas_disponibles)
-        print(f"DEBUG (main.py): Sacando pregunta (Ronda): {pregunta_actual_data.get('pregunta', '')}")
 
-        # Verificar si esta pregunta está en algún cartón
-        all_players_cartones = self.cartones_jugador + self.cartones_ia
-        
-        # Encontrar todos los cartones que tienen esta pregunta
-        cartones_con_pregunta = []
-        for carton in all_players_cartones:
-            if isinstance(carton, Dict):
-                pregunta_en_carton = next((p for p in carton.get('preguntas', []) or [] if isinstance(p, Dict) and p.get('id') == pregunta_actual_data.get('id')), None)
-                if pregunta_en_carton:
-                    cartones_con_pregunta.append((carton, pregunta_en_carton))
-
-        # Si la pregunta no está en ningún cartón, pasar a la siguiente
-        if not cartones_con_pregunta:
-            print("Pregunta no encontrada en ningún cartón. Pasando a la siguiente.")
-            game_screen = None
-            if self.sm:
-                game_screen = self.sm.get_screen('game')
-                if game_screen and hasattr(game_screen, 'clear_question_area'):
-                    game_screen.clear_question_area()
-                    if hasattr(game_screen.ids, 'game_messages'):
-                        game_screen.ids.game_messages.text = "Nadie tiene esta pregunta. Pasando a la siguiente..."
-                        Clock.schedule_once(lambda dt: setattr(game_screen.ids.game_messages, 'text', ''), 2)
-
-            # Programar la siguiente pregunta después de un breve retraso
-            Clock.schedule_once(lambda dt: self.mostrar_siguiente_pregunta(), 1)
+        # El motor espera un momento antes de mostrar la primera pregunta; en
+        # modo instantáneo juega la partida entera aquí mismo
+        self.motor.velocidad = VELOCIDADES.get(self.velocidad_juego, VELOCIDADES["1x"])
+        if not self.motor.instantanea:
+            self.iniciar_reloj_motor()
+        self.motor.iniciar()
+
+    def establecer_velocidad(self, velocidad: str) -> None:
+        """Cambia la escala de tiempo; en una partida en curso se aplica al momento"""
+        if velocidad not in VELOCIDADES:
+            print(f"[WARNING] Velocidad desconocida: {velocidad}")
             return
-
-        # Verificar si la pregunta está en el cartón del jugador
-        pregunta_en_carton_jugador = next((p for p in self.cartones_jugador[0].get('preguntas', []) or [] if isinstance(p, Dict) and p.get('id') == pregunta_actual_data.get('id')), None)
-        
-        # Encontrar las preguntas en los cartones de las IAs que no han respondido
-        preguntas_en_cartones_ia = [(carton, p_ia) for carton, p_ia in cartones_con_pregunta if carton in self.cartones_ia and not p_ia.get('respondida', False)]
-
-        game_screen = None
-        if self.sm:
-            game_screen = self.sm.get_screen('game')
-            
-        # Mostrar la pregunta en la pantalla del juego
-        if game_screen and hasattr(game_screen, 'mostrar_pregunta_en_ui'):
-            game_screen.mostrar_pregunta_en_ui(pregunta_actual_data)
-            
-        # Lógica de notificación si la pregunta está en múltiples cartones
-        if len(cartones_con_pregunta) > 1:
-            if game_screen and hasattr(game_screen.ids, 'game_messages'):
-                if pregunta_en_carton_jugador:
-                    game_screen.ids.game_messages.text = f"¡Esta pregunta está en {len(cartones_con_pregunta)} cartones! ¡Todos pueden responder!"
+        self.velocidad_juego = velocidad
+        if self.motor.en_curso:
+            self.motor.velocidad = VELOCIDADES[velocidad]
+            if self.motor.instantanea:
+                self.detener_reloj_motor()
+                self.motor.ejecutar_hasta_fin()
+            elif self.reloj_motor is None:
+                self.iniciar_reloj_motor()
+
+    def iniciar_reloj_motor(self) -> None:
+        """Avanza el reloj del motor con el de Kivy mientras dura la partida"""
+        self.detener_reloj_motor()
+        self.reloj_motor = Clock.schedule_interval(lambda dt: self.motor.tick(dt), 1 / 30)
+
+    def detener_reloj_motor(self) -> None:
+        if self.reloj_motor is not None:
+            self.reloj_motor.cancel()
+            self.reloj_motor = None
+
+    def obtener_game_screen(self):
+        return self.sm.get_screen('game') if self.sm else None
+
+    def on_evento_ronda(self, tipo: str, datos: Dict[str, Any]) -> None:
+        """Refleja en la interfaz los eventos del motor de rondas"""
+        game_screen = self.obtener_game_screen()
+
+        if tipo == EVENTO_PREGUNTA:
+            pregunta_actual_data = question_bank.registro(datos['pregunta_id'])
+            print(f"DEBUG (main.py): Sacando pregunta (Ronda): {pregunta_actual_data.pregunta}")
+            # Mostrar la pregunta en la pantalla del juego
+            if game_screen and hasattr(game_screen, 'mostrar_pregunta_en_ui'):
+                game_screen.mostrar_pregunta_en_ui(pregunta_actual_data)
+            # Notificación si la pregunta está en múltiples cartones
+            cartones_con_pregunta = len(datos['ubicaciones'])
+            if cartones_con_pregunta > 1 and game_screen and hasattr(game_screen.ids, 'game_messages'):
+                if datos['jugador_tiene']:
+                    game_screen.ids.game_messages.text = f"¡Esta pregunta está en {cartones_con_pregunta} cartones! ¡Todos pueden responder!"
                 else:
                     game_screen.ids.game_messages.text = f"Esta pregunta no está en tu cartón. Las IAs están respondiendo..."
                     Clock.schedule_once(lambda dt: setattr(game_screen.ids.game_messages, 'text', ''), 3)
 
-        # Lógica de respuesta y avance del juego
-        if pregunta_en_carton_jugador and not pregunta_en_carton_jugador.get('respondida', False):
-            print("Jugador tiene la pregunta. Iniciando temporizador de respuesta del jugador (15 segundos).")
-            if self.game_in_progress:
-                self.start_player_timer()
-                # No programar respuestas de IA hasta que el jugador responda o se agote el tiempo
-                return
-        else:
-            # Si el jugador no tiene la pregunta, programar respuestas de IA y avanzar
-            if self.game_in_progress:
-                # Programar respuestas de las IAs que tienen la pregunta y no han respondido
-                for ia_carton, pregunta_ia in preguntas_en_cartones_ia:
-                    # Reducir el tiempo de respuesta de la IA
-                    ia_delay = random.uniform(1, 3)  # Reducido de 3-10 a 1-3 segundos
-                    print(f"IA tiene la pregunta. Programando respuesta de IA ({ia_carton.get('categoria', 'N/A')}) en {ia_delay:.2f} segundos.")
-                    Clock.schedule_once(lambda dt, ia_carton=ia_carton, p_ia=pregunta_ia: self.ia_responder(ia_carton, p_ia), ia_delay)
-                
-                # Programar la siguiente pregunta después de que todas las IAs hayan respondido
-                max_delay = max([random.uniform(1, 3) for _ in preguntas_en_cartones_ia]) if preguntas_en_cartones_ia else 1
-                Clock.schedule_once(lambda dt: self.mostrar_siguiente_pregunta(), max_delay + 1)  # Reducido a 1 segundo extra
-
-    def process_player_answer(self, pregunta: Dict[str, Any], selected_option_index: int):
-        """Procesa la respuesta del jugador humano."""
-        # Cancelar el temporizador del jugador ya que ha respondido
-        self.cancel_player_timer()
-
-        print("Después de cancelar temporizador.")
+        elif tipo == EVENTO_SIN_CARTON:
+            print("Pregunta no encontrada en ningún cartón. Pasando a la siguiente.")
+            if game_screen and hasattr(game_screen, 'clear_question_area'):
+                game_screen.clear_question_area()
+                if hasattr(game_screen.ids, 'game_messages'):
+                    game_screen.ids.game_messages.text = "Nadie tiene esta pregunta. Pasando a la siguiente..."
+                    Clock.schedule_once(lambda dt: setattr(game_screen.ids.game_messages, 'text', ''), 2)
+
+        elif tipo == EVENTO_TURNO_JUGADOR:
+            print(f"Jugador tiene la pregunta. Iniciando temporizador de respuesta del jugador ({datos['segundos']} segundos).")
+
+        elif tipo == EVENTO_RELOJ:
+            if game_screen and hasattr(game_screen, 'update_timer_label'):
+                game_screen.update_timer_label(datos['segundos'])
+
+        elif tipo == EVENTO_RESPUESTA:
+            quien = "Jugador" if datos['carton'] == 0 and self.cartones_jugador else f"Cartón {datos['carton']}"
+            print(f"{quien} respondió la pregunta {datos['pregunta_id']}. Correcta: {datos['correcta']}")
+            # Actualizar la interfaz de los cartones
+            if game_screen and hasattr(game_screen, 'mostrar_cartones'):
+                game_screen.mostrar_cartones()
+            # Feedback al jugador (sonido)
+            if datos['carton'] == 0 and self.cartones_jugador:
+                sonido = self.sounds.get('correct' if datos['correcta'] else 'wrong')
+                if sonido:
+                    sonido.play()
+
+        elif tipo == EVENTO_RESPUESTAS_IA:
+            # Un solo resumen por ronda en lugar de una actualización por IA
+            aciertos = sum(datos['correctas'])
+            print(f"{len(datos['cartones'])} IAs respondieron la pregunta {datos['pregunta_id']}: {aciertos} aciertos")
+            if game_screen and hasattr(game_screen, 'mostrar_cartones'):
+                game_screen.mostrar_cartones()
 
-        # Asegurarse de que el juego sigue en progreso y hay cartones de jugador
-        if not self.game_in_progress or not self.cartones_jugador:
-            print("Juego no en progreso o cartones del jugador vacíos. Saliendo de process_player_answer.")
-            return
-        
-        player_carton = self.cartones_jugador[0]
-        
-        # Encontrar la pregunta en el cartón del jugador por ID
-        pregunta_en_carton = next((p for p in player_carton.get('preguntas', []) or [] if isinstance(p, Dict) and p.get('id') == pregunta.get('id')), None)
-
-        if not pregunta_en_carton:
-            print("Error: Pregunta del jugador no encontrada en el cartón al procesar respuesta.")
-            # Avanzar a la siguiente ronda
-            if self.game_in_progress:
-                Clock.schedule_once(lambda dt: self.mostrar_siguiente_pregunta(), 1)
-            return
+        elif tipo == EVENTO_TIEMPO_AGOTADO:
+            print("Tiempo del jugador agotado.")
+            if game_screen and hasattr(game_screen, 'mostrar_cartones'):
+                game_screen.mostrar_cartones()
+            # Limpiar el área de pregunta actual en la UI
+            if game_screen and hasattr(game_screen, 'clear_question_area'):
+                game_screen.clear_question_area()
+            # El motor pasa a la siguiente pregunta en un segundo; el diálogo se cierra a la vez
+            if game_screen and hasattr(game_screen, 'mostrar_dialogo'):
+                game_screen.mostrar_dialogo("Se acabó el tiempo", "No respondiste a tiempo. Pasando a la siguiente pregunta.")
+
+                def cerrar_dialogo(dt):
+                    if hasattr(game_screen, 'dialog') and game_screen.dialog:
+                        game_screen.dialog.dismiss()
+                Clock.schedule_once(cerrar_dialogo, 1)
+
+        elif tipo == EVENTO_FIN:
+            self.detener_reloj_motor()
+            self.guardar_registro_partida()
+            if datos['patron'] is not None:
+                print(f"¡Bingo de {datos['ganador']}! ({datos['patron'].nombre})")
+            self._mostrar_fin_juego(datos['ganador'])
+
+    def guardar_registro_partida(self) -> Optional[str]:
+        """Guarda el registro binario de la partida (para revisar reclamos)"""
+        if not self.registro_partida.datos:
+            return None
+        try:
+            carpeta = os.path.join(self.user_data_dir, 'partidas')
+            os.makedirs(carpeta, exist_ok=True)
+            ruta = os.path.join(carpeta, f"partida_{self.semilla_partida}.bgl")
+            self.registro_partida.guardar(ruta)
+            print(f"[DEBUG] Registro de la partida guardado en {ruta}")
+            return ruta
+        except OSError as e:
+            print(f"[WARNING] No se pudo guardar el registro de la partida: {e}")
+            return None
 
-        # Verificar si la respuesta es correcta usando el índice correcto
-        is_correct = selected_option_index == pregunta.get('indice_correcto', -1)
+    def mostrar_siguiente_pregunta(self):
+        """Selecciona y muestra la siguiente pregunta aleatoria (una ronda)."""
+        self.motor.sortear()
 
-        # Actualizar el estado de la pregunta en el cartón
-        pregunta_en_carton['respondida'] = True
-        pregunta_en_carton['correcta'] = is_correct
-        
-        print(f"Pregunta marcada en cartón jugador: {pregunta.get('pregunta', '')}, Correcta: {is_correct}")
-
-        # Manejar el estado de la pregunta en el pool
-        if is_correct:
-            # Si la respuesta es correcta, remover la pregunta del pool
-            self.preguntas_disponibles = [p for p in self.preguntas_disponibles if p.get('id') != pregunta.get('id')]
-            # Agregar la pregunta a preguntas_ya_usadas si no está
-            if not any(p.get('id') == pregunta.get('id') for p in self.preguntas_ya_usadas):
-                self.preguntas_ya_usadas.append(pregunta)
-            print("Respuesta correcta. Pregunta removida del pool.")
-        else:
-            # Si la respuesta es incorrecta, asegurarse de que la pregunta esté en el pool
-            if not any(p.get('id') == pregunta.get('id') for p in self.preguntas_disponibles):
-                # Crear una copia de la pregunta para el pool
-                pregunta_pool = pregunta.copy()
-                pregunta_pool['respondida'] = False  # Resetear el estado
-                pregunta_pool['correcta'] = False    # Resetear el estado
-                self.preguntas_disponibles.append(pregunta_pool)
-                print("Respuesta incorrecta. Pregunta agregada al pool con estado reseteado.")
-            # También resetear el estado en el cartón del jugador para que pueda volver a responderse
-            if pregunta_en_carton:
-                pregunta_en_carton['respondida'] = False
-                pregunta_en_carton['correcta'] = False
-
-        # Actualizar la interfaz del cartón del jugador
-        if self.sm:
-            game_screen = self.sm.get_screen('game')
-            if game_screen and hasattr(game_screen, 'mostrar_cartones'):
-                game_screen.mostrar_cartones() # Refresh player's card display
-                print("Cartón del jugador actualizado en la UI.")
-
-        # Mostrar feedback al jugador (sonido)
-        if is_correct:
-            if self.sounds.get('correct'):
-                self.sounds['correct'].play()
-                print("Sonido de respuesta correcta.")
-        else:
-            if self.sounds.get('wrong'):
-                self.sounds['wrong'].play()
-                print("Sonido de respuesta incorrecta.")
-
-        # Verificar si alguna IA ha ganado
-        # for i, carton_ia in enumerate(self.cartones_ia, 1):
-        #     if self.verificar_bingo(carton_ia):
-        #         print(f"¡Bingo de la IA {i}!")
-        #         self.terminar_juego(winner=f"IA_{i}")
-        #         return
-        
-        # Si no hay bingo, avanzar a la siguiente ronda
-        print("Verificando si el juego está en progreso para programar la siguiente pregunta después de respuesta del jugador...")
-        if self.game_in_progress:
-            print("Programando siguiente pregunta después de respuesta del jugador...")
-            # Pequeño retraso antes de la siguiente pregunta para dar tiempo a ver el feedback
-            Clock.schedule_once(lambda dt: self.mostrar_siguiente_pregunta(), 1)
-        else:
-            print("Juego no está en progreso, no se programa la siguiente pregunta después de respuesta del jugador.")
+    def process_player_answer(self, pregunta: RegistroPregunta, selected_option_index: int):
+        """Procesa la respuesta del jugador humano."""
+        if self.motor.responder(pregunta.id, selected_option_index) is None:
+            print("Juego no en progreso o pregunta fuera del cartón del jugador.")
 
     def handle_player_timeout(self):
         """Maneja el caso en que el jugador no responde a tiempo."""
-        print("Tiempo del jugador agotado.")
-        if not self.game_in_progress or not self.cartones_jugador or not self.preguntas_ya_usadas: # Asegurarse de que hay una pregunta actual
-             return
-        # Marcar la última pregunta mostrada al jugador como no respondida/incorrecta en su cartón
-        pregunta_actual_data = self.preguntas_ya_usadas[-1] if self.preguntas_ya_usadas else None
-        player_carton = self.cartones_jugador[0]
-        pregunta_en_carton = None
-        if pregunta_actual_data:
-            pregunta_en_carton = next((p for p in player_carton.get('preguntas', []) or [] if isinstance(p, Dict) and p.get('id') == pregunta_actual_data.get('id')), None)
-        if pregunta_en_carton and not pregunta_en_carton.get('respondida', False): # Solo si no estaba respondida ya
-            pregunta_en_carton['respondida'] = True # Marcar como respondida (por timeout)
-            pregunta_en_carton['correcta'] = False # Considerar incorrecta o no respondida
-            if pregunta_actual_data:
-                print(f"Pregunta '{pregunta_actual_data.get('pregunta', '')}' marcada como incorrecta por timeout del jugador.")
-            # Actualizar UI del cartón del jugador para reflejar el estado incorrecto
-            if self.sm:
-                game_screen = self.sm.get_screen('game')
-                if game_screen and hasattr(game_screen, 'mostrar_cartones'):
-                     game_screen.mostrar_cartones() # Refresh player's card display
-                     print("Cartón del jugador actualizado en la UI después de timeout.")
-        # Limpiar el área de pregunta actual en la UI
-        game_screen = None
-        if self.sm:
-             game_screen = self.sm.get_screen('game')
-             if game_screen and hasattr(game_screen, 'clear_question_area'):
-                  game_screen.clear_question_area()
-        # Mostrar un mensaje indicando que el tiempo se agotó y continuar automáticamente
-        if game_screen and hasattr(game_screen, 'mostrar_dialogo'):
-            # Mostrar el diálogo
-            game_screen.mostrar_dialogo("Se acabó el tiempo", "No respondiste a tiempo. Pasando a la siguiente pregunta.")
-            # Cerrar el diálogo y continuar después de 1 segundo
-            def cerrar_y_continuar(dt):
-                if hasattr(game_screen, 'dialog') and game_screen.dialog:
-                    game_screen.dialog.dismiss()
-                # Avanzar a la siguiente pregunta SIEMPRE
-                if self.game_in_progress:
-                    self.mostrar_siguiente_pregunta()
-            Clock.schedule_once(cerrar_y_continuar, 1)
-        else:
-            # Si no se puede mostrar diálogo, pasar directamente a la siguiente pregunta
-            if self.game_in_progress:
-                self.mostrar_siguiente_pregunta()
-
-    def start_player_timer(self):
-        """Inicia el temporizador para la respuesta del jugador y actualiza el contador visual cada segundo."""
-        # Cancelar cualquier temporizador existente para evitar múltiples temporizadores corriendo
-        if hasattr(self, 'player_timer') and self.player_timer:
-            self.player_timer.cancel()
-        if hasattr(self, 'player_timer_event') and self.player_timer_event:
-            self.player_timer_event.cancel()
-
-        self.player_time_left = 15
-        game_screen = None
-        if self.sm:
-            game_screen = self.sm.get_screen('game')
-        if game_screen and hasattr(game_screen, 'update_timer_label'):
-            game_screen.update_timer_label(self.player_time_left)
-
-        def update_timer(dt):
-            self.player_time_left -= 1
-            if self.player_time_left > 0:
-                if game_screen and hasattr(game_screen, 'update_timer_label'):
-                    game_screen.update_timer_label(self.player_time_left)
-            else:
-                if game_screen and hasattr(game_screen, 'update_timer_label'):
-                    game_screen.update_timer_label(0)
-                if hasattr(self, 'player_timer_event') and self.player_timer_event:
-                    self.player_timer_event.cancel()
-
-        # Programar el temporizador visual cada segundo
-        self.player_timer_event = Clock.schedule_interval(update_timer, 1)
-        # Programar el timeout real
-        self.player_timer = Clock.schedule_once(lambda dt: self.handle_player_timeout(), self.player_time_left)
-        print("Temporizador del jugador iniciado (15 segundos y contador visual).")
-
-    def cancel_player_timer(self):
-        """Cancela el temporizador de respuesta del jugador y oculta el contador visual."""
-        if hasattr(self, 'player_timer') and self.player_timer:
-            self.player_timer.cancel()
-            print("Temporizador del jugador cancelado.")
-        if hasattr(self, 'player_timer_event') and self.player_timer_event:
-            self.player_timer_event.cancel()
-        game_screen = None
-        if self.sm:
-            game_screen = self.sm.get_screen('game')
-        if game_screen and hasattr(game_screen, 'update_timer_label'):
-            game_screen.update_timer_label(0)
+        self.motor.tiempo_agotado()
 
-    def calcular_estadisticas(self, carton: Dict[str, Any]) -> Dict[str, int]:
+    def calcular_estadisticas(self, carton: CartonJuego) -> Dict[str, int]:
         """Calcula las estadísticas de un cartón (aciertos y desaciertos)."""
-        if not isinstance(carton, Dict):
+        if not isinstance(carton, CartonJuego):
             return {'aciertos': 0, 'desaciertos': 0}
-            
-        preguntas = carton.get('preguntas', []) or []
-        aciertos = sum(1 for p in preguntas if isinstance(p, Dict) and p.get('respondida', False) and p.get('correcta', False))
-        desaciertos = sum(1 for p in preguntas if isinstance(p, Dict) and p.get('respondida', False) and not p.get('correcta', False))
         
         return {
-            'aciertos': aciertos,
-            'desaciertos': desaciertos
+            'aciertos': carton.aciertos(),
+            'desaciertos': carton.desaciertos()
         }
 
     def terminar_juego(self, winner: Optional[str] = None):
         """Termina el juego y muestra el resultado con estadísticas"""
+        if self.motor.en_curso:
+            # El motor emite el fin de partida y on_evento_ronda muestra el resultado
+            self.motor.terminar(winner)
+        else:
+            self._mostrar_fin_juego(winner)
+
+    def _mostrar_fin_juego(self, winner: Optional[str]):
         # Si el juego ya no está en progreso, salir para evitar duplicados
         if not self.game_in_progress and hasattr(self, '_game_finished_dialog_shown') and self._game_finished_dialog_shown:
             print("DEBUG: terminar_juego llamado pero juego ya terminado y diálogo mostrado.")
@@ -1329,14 +1235,9 @@ class BingoApp(MDApp):
             win_message = "El juego ha terminado."
         
         # Limpiar datos del juego
-        self.preguntas_disponibles = []
-        self.preguntas_ya_usadas = []
-        self.cartones_jugador = []
-        self.cartones_ia = []
+        self.motor.limpiar()
 
-        game_screen = None
-        if self.sm:
-            game_screen = self.sm.get_screen('game')
+        game_screen = self.obtener_game_screen()
 
         if game_screen and hasattr(game_screen, 'clear_question_area'):
             game_screen.clear_question_area()
@@ -1445,66 +1346,9 @@ class BingoApp(MDApp):
             dialog.dismiss()
         self.cambiar_pantalla('main', 'right')
 
-    def ia_responder(self, ia_carton: Dict[str, Any], pregunta_actual_data: Dict[str, Any]):
+    def ia_responder(self, ia_carton: CartonJuego, pregunta_actual_data: RegistroPregunta):
         """Simula la respuesta de una IA específica a una pregunta específica."""
-        # Asegurarse de que el juego sigue en progreso y los datos son válidos
-        if not self.game_in_progress or not isinstance(ia_carton, Dict) or not isinstance(pregunta_actual_data, Dict):
-            return
-            
-        print(f"IA está respondiendo a la pregunta: {pregunta_actual_data.get('pregunta', '')}")
-
-        # Encontrar la pregunta en el cartón de la IA
-        pregunta_en_carton_ia = next((p for p in ia_carton.get('preguntas', []) or [] 
-                                    if isinstance(p, Dict) and p.get('id') == pregunta_actual_data.get('id')), None)
-
-        if not pregunta_en_carton_ia or pregunta_en_carton_ia.get('respondida', False):
-            print(f"IA no tiene o ya respondió la pregunta '{pregunta_actual_data.get('pregunta', '')}' en su cartón.")
-            return
-
-        # Lógica de respuesta de la IA basada en la dificultad
-        correct_probability = self.ai_probabilities.get(self.ai_difficulty, 0.75)
-        is_correct_ia = random.random() < correct_probability
-
-        # Actualizar el estado de la pregunta en el cartón de la IA
-        pregunta_en_carton_ia['respondida'] = True
-        pregunta_en_carton_ia['correcta'] = is_correct_ia
-
-        # Si la respuesta es correcta, remover la pregunta del pool
-        if is_correct_ia:
-            self.preguntas_disponibles = [p for p in self.preguntas_disponibles if p.get('id') != pregunta_actual_data.get('id')]
-            print(f"IA ({ia_carton.get('categoria', 'N/A')}) respondió correctamente la pregunta.")
-        else:
-            # Si la respuesta es incorrecta, asegurarse de que la pregunta esté en el pool
-            if not any(p.get('id') == pregunta_actual_data.get('id') for p in self.preguntas_disponibles):
-                pregunta_pool = pregunta_actual_data.copy()
-                pregunta_pool['respondida'] = False
-                pregunta_pool['correcta'] = False
-                self.preguntas_disponibles.append(pregunta_pool)
-            print(f"IA ({ia_carton.get('categoria', 'N/A')}) respondió incorrectamente la pregunta.")
-
-        # Verificar si hay bingo para la IA
-        if self.verificar_bingo(ia_carton):
-            print(f"¡Bingo de la IA! Cartón: {ia_carton.get('id', 'N/A')}")
-            self.terminar_juego(winner=f"IA_{ia_carton.get('id', 'N/A')}")
-            return
-
-        # Actualizar la UI del cartón del jugador para reflejar los cambios
-        if self.sm:
-            game_screen = self.sm.get_screen('game')
-            if game_screen and hasattr(game_screen, 'mostrar_cartones'):
-                game_screen.mostrar_cartones()
-
-        # Llamar a la función para que la IA cante bingo si corresponde
-        for i, carton in enumerate(self.cartones_ia):
-            if carton is ia_carton:
-                self.ia_cantar_bingo(i, carton)
-                break
-
-    def ia_cantar_bingo(self, ia_index, carton_ia):
-        """Permite que la IA cante bingo si tiene el cartón completo."""
-        if self.verificar_bingo(carton_ia):
-            print(f"¡Bingo de la IA {ia_index+1}!")
-            self.terminar_juego(winner=f"IA_{ia_index+1}")
+        self.motor.responder_ia(self.indice_preguntas.numero(ia_carton.id), pregunta_actual_data.id)
 
     def cambiar_pantalla(self, nombre_pantalla: str, direccion: str = 'left'):
         """Cambia a una pantalla con una animación de transición."""
@@ -1535,14 +1379,15 @@ class BingoApp(MDApp):
             print("No quedan preguntas disponibles. Terminando juego.")
             self.terminar_juego_multijugador()
             return
-        # Seleccionar la siguiente pregunta (puedes usar pop(0) para avanzar secuencialmente)
-        pregunta_actual = app.preguntas_disponibles.pop(0)
-        app.preguntas_ya_usadas.append(pregunta_actual)
-        # Enviar la pregunta a todos los clientes
+        # Seleccionar la siguiente pregunta de la lista global, en orden
+        pregunta_id = app.preguntas_disponibles.siguiente()
+        app.preguntas_ya_usadas.append(pregunta_id)
+        pregunta_actual = question_bank.registro(pregunta_id)
+        # Enviar la clave de la pregunta a todos los clientes
         import json
         for client, addr in self.connected_players:
             try:
-                data = {'tipo': 'pregunta_turno', 'pregunta': pregunta_actual}
+                data = {'tipo': 'pregunta_turno', 'pregunta': pregunta_actual.clave}
                 client.send(json.dumps(data).encode('utf-8'))
                 print(f"[DEBUG] Pregunta de turno enviada a {addr}")
             except Exception as e:
@@ -1569,17 +1414,14 @@ class BingoApp(MDApp):
                 print(f"[DEBUG] Datos recibidos del host: {info.keys()}")
                 app = MDApp.get_running_app()
                 if isinstance(app, BingoApp):
-                    if 'carton' in info and 'preguntas_globales' in info:
-                        # Asignar el cartón y la lista global de preguntas al cliente (inicio de partida)
-                        app.cartones_jugador = [info['carton']]
-                        app.preguntas_disponibles = info['preguntas_globales']
-                        app.preguntas_ya_usadas = []
-                        app.game_in_progress = True
-                        print("[DEBUG] Cartón y preguntas globales asignados al cliente.")
-                        app.cambiar_pantalla('game', 'up')
-                        # Iniciar el flujo de preguntas de manera autónoma
-                        if hasattr(app, 'iniciar_juego_automatico'):
-                            app.iniciar_juego_automatico()
+                    if 'semilla' in info and 'asiento' in info:
+                        # El cliente reconstruye su cartón y el orden de preguntas con la semilla del host
+                        if app.preparar_partida_sembrada(info):
+                            print("[DEBUG] Cartón y preguntas globales reconstruidos en el cliente.")
+                            app.cambiar_pantalla('game', 'up')
+                            # Iniciar el flujo de preguntas de manera autónoma
+                            if hasattr(app, 'iniciar_juego_automatico'):
+                                app.iniciar_juego_automatico()
         except Exception as e:
             print(f"[ERROR] Al recibir datos del host: {e}")
 
@@ -3,9 +3,10 @@ from kivy.uix.image import Image
 from kivy.uix.label import Label
 from kivy.properties import NumericProperty, ListProperty
 from kivy.graphics import Color, Rectangle
-import random
 import os
 
+from .card_model import CASILLAS, LADO, BingoCardModel
+
 class BingoCard(BoxLayout):
     card_number = NumericProperty(0)  # Número del cartón
     numbers = ListProperty([])  # Lista de números del cartón
@@ -17,20 +18,16 @@ class BingoCard(BoxLayout):
         self.orientation = 'vertical'
         self.spacing = 5
         self.padding = 10
+        # Etiqueta de cada casilla (por filas), para marcar sin recorrer el árbol de widgets
+        self.number_labels = [None] * CASILLAS
         self.generate_numbers()
         self.create_card()
         
     def generate_numbers(self):
         """Genera los números aleatorios para el cartón"""
-        # Generar 5 columnas (B, I, N, G, O)
-        b_numbers = random.sample(range(1, 16), 5)
-        i_numbers = random.sample(range(16, 31), 5)
-        n_numbers = random.sample(range(31, 46), 5)
-        g_numbers = random.sample(range(46, 61), 5)
-        o_numbers = random.sample(range(61, 76), 5)
-        
-        # Combinar todos los números
-        self.numbers = b_numbers + i_numbers + n_numbers + g_numbers + o_numbers
+        # 5 columnas (B, I, N, G, O); el modelo guarda las marcas y detecta el bingo
+        self.model = BingoCardModel.generate()
+        self.numbers = list(self.model.numbers)
         
     def create_card(self):
         """Crea la interfaz visual del cartón"""
@@ -67,39 +64,29 @@ class BingoCard(BoxLayout):
                     background_color=(1, 1, 1, 0.7)  # Color blanco semi-transparente
                 )
                 row_layout.add_widget(number_label)
+                self.number_labels[row * LADO + col] = number_label
             container.add_widget(row_layout)
             
         self.add_widget(container)
             
     def mark_number(self, number):
         """Marca un número en el cartón"""
-        if number in self.numbers and number not in self.marked_numbers:
+        if self.model.mark(number):
             self.marked_numbers.append(number)
             # Actualizar la visualización del número marcado
-            index = self.numbers.index(number)
-            row = index % 5
-            col = index // 5
-            number_widget = self.children[0].children[1:][row].children[4-col]
-            number_widget.color = (1, 0, 0, 1)  # Color rojo para números marcados
-            
+            number_widget = self.number_labels[self.model.cell_of(number)]
+            if number_widget is not None:
+                number_widget.color = (1, 0, 0, 1)  # Color rojo para números marcados
+
+    def reset_marks(self):
+        """Quita todas las marcas del cartón"""
+        self.model.reset()
+        self.marked_numbers = []
+        for number_label in self.number_labels:
+            if number_label is not None:
+                number_label.color = (0, 0, 0, 1)  # Color negro para números no marcados
+
     def check_bingo(self):
-        """Verifica si hay bingo"""
-        # Verificar líneas horizontales
-        for row in range(5):
-            if all(self.numbers[row + col * 5] in self.marked_numbers for col in range(5)):
-                return True
-                
-        # Verificar líneas verticales
-        for col in range(5):
-            if all(self.numbers[row + col * 5] in self.marked_numbers for row in range(5)):
-                return True
-                
-        # Verificar diagonal principal
-        if all(self.numbers[i * 6] in self.marked_numbers for i in range(5)):
-            return True
-            
-        # Verificar diagonal secundaria
-        if all(self.numbers[i * 4 + 4] in self.marked_numbers for i in range(5)):
-            return True
-            
-        return False 
\ No newline at end of file
+        """Verifica si hay bingo (fila, columna o diagonal completa)"""
+        # El modelo actualiza el patrón ganador al marcar: aquí solo se consulta
+        return self.model.check_bingo() 
\ No newline at end of file
@@ -4,7 +4,7 @@ from kivymd.uix.button import MDRaisedButton
 from kivy.uix.label import Label
 from kivy.clock import Clock
 from .bingo_card import BingoCard
-import random
+from .caller import BingoCaller, NumberIndex
 
 class BingoGame(BoxLayout):
     def __init__(self, **kwargs):
@@ -15,7 +15,9 @@ class BingoGame(BoxLayout):
         
         # Configuración del juego
         self.cards = []
-        self.called_numbers = []
+        # Bombo barajado y cartones por número: cada bola solo toca los cartones que la tienen
+        self.caller = BingoCaller()
+        self.card_index: NumberIndex[BingoCard] = NumberIndex()
         self.game_active = False
         self.current_number = None
         
@@ -59,6 +61,7 @@ class BingoGame(BoxLayout):
         if len(self.cards) < 4:  # Límite de 4 cartones
             card = BingoCard(card_number=len(self.cards) + 1)
             self.cards.append(card)
+            self.card_index.add(card.numbers, card)
             self.cards_container.add_widget(card)
             return card
         return None
@@ -69,7 +72,7 @@ class BingoGame(BoxLayout):
             self.add_card()  # Agregar al menos un cartón
             
         self.game_active = True
-        self.called_numbers = []
+        self.caller.reset()
         self.current_number = None
         self.start_button.disabled = True
         self.call_number_button.disabled = False
@@ -77,34 +80,34 @@ class BingoGame(BoxLayout):
         
         # Reiniciar cartones
         for card in self.cards:
-            card.marked_numbers = []
-            for child in card.children[1:]:  # Excluir el encabezado
-                for number_label in child.children:
-                    number_label.color = (0, 0, 0, 1)  # Color negro para números no marcados
+            card.reset_marks()
                     
     def call_number(self, instance):
         """Llama un nuevo número"""
         if not self.game_active:
             return
-            
-        # Generar número que no haya sido llamado
-        available_numbers = [n for n in range(1, 76) if n not in self.called_numbers]
-        if not available_numbers:
+
+        # Sacar la siguiente bola del bombo barajado
+        self.current_number = self.caller.call()
+        if self.current_number is None:
             self.end_game()
             return
-            
-        self.current_number = random.choice(available_numbers)
-        self.called_numbers.append(self.current_number)
         
         # Actualizar interfaz
         self.called_numbers_label.text = f"Números llamados: {', '.join(map(str, self.called_numbers))}"
         
-        # Marcar número en los cartones
-        for card in self.cards:
+        # Marcar número solo en los cartones que lo tienen
+        for card in self.card_index.cards_with(self.current_number):
             card.mark_number(self.current_number)
             if card.check_bingo():
                 self.end_game(winner=card)
+                return
                 
+    @property
+    def called_numbers(self):
+        """Números llamados en orden"""
+        return self.caller.called_numbers
+
     def end_game(self, winner=None):
         """Termina el juego"""
         self.game_active = False
@@ -0,0 +1,66 @@
+"""
+Sorteo de bolas y cartones por número para el bingo de 75 bolas, sin Kivy
+El bombo es un mazo barajado al empezar (sacar una bola es un pop) y el
+índice número -> cartones hace que cada bola toque solo los cartones que
+la tienen
+"""
+
+from typing import Generic, Iterable, List, Optional, Sequence, TypeVar
+import random
+
+from .card_model import TOTAL_NUMEROS
+
+
+T = TypeVar('T')
+
+
+class BingoCaller:
+    """Bombo de 75 bolas barajado de una vez"""
+    __slots__ = ('rng', '_deck', 'called_numbers')
+
+    def __init__(self, rng: Optional[random.Random] = None):
+        self.rng = rng or random.Random()
+        self._deck: List[int] = []
+        self.called_numbers: List[int] = []
+        self.reset()
+
+    def reset(self) -> None:
+        self._deck = list(range(1, TOTAL_NUMEROS + 1))
+        self.rng.shuffle(self._deck)
+        self.called_numbers = []
+
+    def call(self) -> Optional[int]:
+        """Saca la siguiente bola, o None si ya salieron todas"""
+        if not self._deck:
+            return None
+        number = self._deck.pop()
+        self.called_numbers.append(number)
+        return number
+
+    def __len__(self) -> int:
+        """Bolas que quedan en el bombo"""
+        return len(self._deck)
+
+
+class NumberIndex(Generic[T]):
+    """Cartones (o lo que los represente) que contienen cada número"""
+    __slots__ = ('_por_numero',)
+
+    def __init__(self):
+        self._por_numero: List[List[T]] = [[] for _ in range(TOTAL_NUMEROS + 1)]
+
+    def add(self, numbers: Iterable[int], card: T) -> None:
+        for number in numbers:
+            self._por_numero[number].append(card)
+
+    def remove(self, numbers: Iterable[int], card: T) -> None:
+        for number in numbers:
+            if card in self._por_numero[number]:
+                self._por_numero[number].remove(card)
+
+    def cards_with(self, number: int) -> Sequence[T]:
+        return self._por_numero[number] if 0 < number <= TOTAL_NUMEROS else ()
+
+    def clear(self) -> None:
+        for cards in self._por_numero:
+            cards.clear()
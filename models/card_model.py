@@ -0,0 +1,110 @@
+"""
+Modelo del cartón de bingo clásico de 75 bolas, sin Kivy
+Una tabla número -> casilla y las casillas marcadas como máscara de 25 bits:
+marcar un número y saber si hay bingo son operaciones de enteros de costo
+constante
+"""
+
+from typing import List, Optional, Sequence, Tuple
+import random
+
+from core.bingo_patterns import MarcadorBingo, PatronBingo, compilar_patrones
+
+
+# Bolas del bingo clásico y tamaño del cartón (B, I, N, G, O)
+TOTAL_NUMEROS = 75
+LADO = 5
+CASILLAS = LADO * LADO
+NUMEROS_POR_COLUMNA = TOTAL_NUMEROS // LADO
+LETRAS = 'BINGO'
+
+# Casilla i -> bit i, por filas (fila * 5 + columna): 5 filas, 5 columnas y 2 diagonales
+PATRONES_75 = compilar_patrones(LADO, LADO, ('fila', 'columna', 'diagonal'))
+
+# Sin número en esa casilla de la tabla
+_FUERA = -1
+
+
+def casilla_de_indice(indice: int) -> int:
+    """
+    Casilla (por filas) de una posición de `numbers`, que guarda el cartón
+    por columnas: primero los 5 números de la B, luego los de la I...
+    """
+    return (indice % LADO) * LADO + indice // LADO
+
+
+def numeros_aleatorios(rng: Optional[random.Random] = None) -> List[int]:
+    """25 números por columnas: 5 de 1-15 (B), 5 de 16-30 (I)... como el cartón en papel"""
+    rng = rng or random
+    numeros: List[int] = []
+    for columna in range(LADO):
+        inicio = columna * NUMEROS_POR_COLUMNA + 1
+        numeros.extend(rng.sample(range(inicio, inicio + NUMEROS_POR_COLUMNA), LADO))
+    return numeros
+
+
+class BingoCardModel:
+    """
+    Números y marcas de un cartón de 75 bolas.
+
+    `numbers` sigue el orden del widget BingoCard (por columnas); las
+    casillas y las máscaras van por filas, como en core.bingo_patterns.
+    """
+    __slots__ = ('numbers', 'marcador', '_casillas')
+
+    def __init__(self, numbers: Sequence[int], patrones: Sequence[PatronBingo] = PATRONES_75):
+        if len(numbers) != CASILLAS:
+            raise ValueError(f"Un cartón de 75 bolas tiene {CASILLAS} números, no {len(numbers)}")
+        self.numbers: Tuple[int, ...] = tuple(numbers)
+        # Tabla número -> casilla (índice 0 sin uso)
+        self._casillas = [_FUERA] * (TOTAL_NUMEROS + 1)
+        for indice, numero in enumerate(self.numbers):
+            if not 1 <= numero <= TOTAL_NUMEROS:
+                raise ValueError(f"Número fuera de rango en el cartón: {numero}")
+            if self._casillas[numero] != _FUERA:
+                raise ValueError(f"Número repetido en el cartón: {numero}")
+            self._casillas[numero] = casilla_de_indice(indice)
+        self.marcador = MarcadorBingo(patrones)
+
+    @classmethod
+    def generate(cls, rng: Optional[random.Random] = None) -> 'BingoCardModel':
+        return cls(numeros_aleatorios(rng))
+
+    def cell_of(self, number: int) -> int:
+        """Casilla del número, o -1 si no está en el cartón"""
+        return self._casillas[number] if 0 < number <= TOTAL_NUMEROS else _FUERA
+
+    def has_number(self, number: int) -> bool:
+        return self.cell_of(number) != _FUERA
+
+    def mark(self, number: int) -> bool:
+        """Marca el número; devuelve False si no está en el cartón o ya estaba marcado"""
+        casilla = self.cell_of(number)
+        if casilla == _FUERA or self.marcador.marcada(casilla):
+            return False
+        self.marcador.marcar(casilla)
+        return True
+
+    def is_marked(self, number: int) -> bool:
+        casilla = self.cell_of(number)
+        return casilla != _FUERA and self.marcador.marcada(casilla)
+
+    @property
+    def mask(self) -> int:
+        """Casillas marcadas (bit = fila * 5 + columna)"""
+        return self.marcador.marcadas
+
+    @property
+    def winning_pattern(self) -> Optional[PatronBingo]:
+        """Patrón completado, o None"""
+        return self.marcador.ganador
+
+    def check_bingo(self) -> bool:
+        return self.marcador.ganador is not None
+
+    def marked_numbers(self) -> List[int]:
+        """Números marcados, en el orden del cartón"""
+        return [numero for numero in self.numbers if self.is_marked(numero)]
+
+    def reset(self) -> None:
+        self.marcador.reiniciar()
@@ -8,6 +8,8 @@ from kivy.uix.label import Label
 from kivy.clock import Clock
 from kivy.properties import NumericProperty, ListProperty
 
+from core.question_pool import QuestionPool
+
 @dataclass
 class Question:
     id: str
@@ -130,6 +132,8 @@ class Game:
         }
         self.players = {}
         self.current_questions = []
+        # Posiciones en self.categories[cat] de las preguntas aún no sorteadas
+        self.pools: Dict[str, QuestionPool] = {cat: QuestionPool() for cat in self.categories}
         self.is_online = False
         self.game_id = None
         self.host = None
@@ -138,6 +142,7 @@ class Game:
     def add_question(self, question: Question) -> bool:
         if question.category in self.categories:
             self.categories[question.category].append(question)
+            self.pools[question.category].agregar(len(self.categories[question.category]) - 1)
             return True
         return False
 
@@ -157,22 +162,30 @@ class Game:
 
     def get_random_question(self, category: Optional[str] = None) -> Optional[Question]:
         if category:
-            if category not in self.categories or not self.categories[category]:
+            if category not in self.categories or not self.pools[category]:
                 return None
-            questions = self.categories[category]
         else:
-            questions = [q for cat in self.categories.values() for q in cat]
-            if not questions:
+            # Elegir la categoría con peso igual a sus preguntas disponibles
+            # para que todas las preguntas tengan la misma probabilidad
+            restantes = random.randrange(sum(len(pool) for pool in self.pools.values()) or 1)
+            for cat, pool in self.pools.items():
+                if restantes < len(pool):
+                    category = cat
+                    break
+                restantes -= len(pool)
+            else:
                 return None
         
-        available_questions = [q for q in questions if q not in self.current_questions]
-        if not available_questions:
-            return None
-        
-        question = random.choice(available_questions)
+        question = self.categories[category][self.pools[category].sacar()]
         self.current_questions.append(question)
         return question
 
+    def _rebuild_pools(self) -> None:
+        """Recalcula los pools a partir de categories y current_questions"""
+        drawn = {(q.category, q.id) for q in self.current_questions}
+        self.pools = {cat: QuestionPool(i for i, q in enumerate(questions) if (cat, q.id) not in drawn)
+                      for cat, questions in self.categories.items()}
+
     def check_answer(self, player_id: str, card_index: int, row: int, col: int, answer: int) -> bool:
         if player_id not in self.players or card_index >= len(self.players[player_id]):
             return False
@@ -221,6 +234,7 @@ class Game:
         game.players = {pid: [BingoCard.from_dict(card) for card in cards] 
                        for pid, cards in data['players'].items()}
         game.current_questions = [Question.from_dict(q) for q in data['current_questions']]
+        game._rebuild_pools()
         game.is_online = data['is_online']
         game.game_id = data['game_id']
         game.host = data['host']
@@ -11,15 +11,16 @@ from kivy.animation import Animation
 # from models.bingo_game import BingoGame # Uncomment if needed
 from models.game import Game # Keep if Game class is used elsewhere in this file
 from main import BingoApp # Keep if BingoApp class is used for type checking
+from core.question_record import CartonJuego, RegistroPregunta, CORRECTA, SIN_RESPONDER
 from typing import Dict, Any, Optional, List
 from kivy.metrics import sp, dp
 
 class GameScreen(MDScreen):
     dialog: Optional[MDDialog] = None
     app: Optional[BingoApp] = None
-    pregunta_actual: Optional[Dict[str, Any]] = None
+    pregunta_actual: Optional[RegistroPregunta] = None
     current_carton_id: Optional[str] = None
-    current_pregunta_id: Optional[str] = None
+    current_pregunta_id: Optional[int] = None
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -97,47 +98,42 @@ class GameScreen(MDScreen):
             # Mostrar cartón del jugador
             if self.app.cartones_jugador:
                 carton_jugador = self.app.cartones_jugador[0]
-                if isinstance(carton_jugador, Dict):
-                    preguntas_jugador = carton_jugador.get('preguntas', [])
-                    print(f"GameScreen: Poblando cartón del jugador con {len(preguntas_jugador)} preguntas")
-                    self._populate_card_grid(self.ids.player_card_grid, preguntas_jugador)
+                if isinstance(carton_jugador, CartonJuego):
+                    print(f"GameScreen: Poblando cartón del jugador con {len(carton_jugador)} preguntas")
+                    self._populate_card_grid(self.ids.player_card_grid, carton_jugador)
                 else:
-                    print("GameScreen: Cartón del jugador no es un diccionario válido")
+                    print("GameScreen: Cartón del jugador no es un cartón válido")
             else:
                 print("GameScreen: No hay cartones del jugador o no se encontró el grid")
 
-    def _populate_card_grid(self, grid_widget, preguntas: List[Dict[str, Any]], is_ia: bool = False):
+    def _populate_card_grid(self, grid_widget, carton: CartonJuego, is_ia: bool = False):
         """Ayuda a poblar una cuadrícula de cartón con botones de preguntas"""
-        if not grid_widget or not isinstance(preguntas, list):
+        if not grid_widget or not isinstance(carton, CartonJuego):
             return
 
-        # Asegurar que las preguntas estén ordenadas por su posición en el cartón si tienen un índice
-        # O simplemente usar el orden en que aparecen en la lista si no hay índice explícito
-        # Asumimos que la lista de preguntas ya está en el orden correcto (1 a 8)
-        
-        for i, pregunta in enumerate(preguntas):
-            if isinstance(pregunta, Dict):
-                # Usar el número de pregunta (i+1) como texto del botón
-                btn_text = str(i + 1)
-                bg_color = (0.2, 0.2, 0.2, 1) # Color por defecto (no respondida)
-                text_color = (1, 1, 1, 1)
+        # Las casillas siguen el orden de las preguntas en el cartón (1 a 8)
+        for i, estado in enumerate(carton.estado):
+            # Usar el número de pregunta (i+1) como texto del botón
+            btn_text = str(i + 1)
+            bg_color = (0.2, 0.2, 0.2, 1) # Color por defecto (no respondida)
+            text_color = (1, 1, 1, 1)
 
-                if pregunta.get('respondida'):
-                    if pregunta.get('correcta'):
-                        bg_color = (0.2, 0.8, 0.2, 1) # Verde para correcta
-                    else:
-                        bg_color = (0.8, 0.2, 0.2, 1) # Rojo para incorrecta
+            if estado != SIN_RESPONDER:
+                if estado == CORRECTA:
+                    bg_color = (0.2, 0.8, 0.2, 1) # Verde para correcta
+                else:
+                    bg_color = (0.8, 0.2, 0.2, 1) # Rojo para incorrecta
 
-                btn = MDRaisedButton(
-                    text=btn_text,
-                    md_bg_color=bg_color,
-                    theme_text_color="Custom",
-                    text_color=text_color,
-                    size_hint=(1, 1),
-                    font_size='22sp',
-                    font_style='Button'
-                )
-                grid_widget.add_widget(btn)
+            btn = MDRaisedButton(
+                text=btn_text,
+                md_bg_color=bg_color,
+                theme_text_color="Custom",
+                text_color=text_color,
+                size_hint=(1, 1),
+                font_size='22sp',
+                font_style='Button'
+            )
+            grid_widget.add_widget(btn)
 
     def set_pregunta(self, texto):
         label = self.ids.question_text
@@ -159,9 +155,8 @@ class GameScreen(MDScreen):
         
         print(f"GameScreen: Pregunta configurada - Longitud: {length}, Font: {label.font_size}")
 
-    def mostrar_pregunta_en_ui(self, pregunta_data: Dict[str, Any]):
+    def mostrar_pregunta_en_ui(self, pregunta_data: RegistroPregunta):
         """Muestra una pregunta en la interfaz (categoría, pregunta, opciones) si está en el cartón del jugador."""
-        print(f"GameScreen: Mostrando pregunta: {pregunta_data.get('pregunta', '')}")
         
         # Verificar que tenemos una referencia válida a la app
         if not self.app:
@@ -170,22 +165,24 @@ class GameScreen(MDScreen):
                 print("ERROR: No se pudo obtener una referencia válida a BingoApp")
                 return
 
-        if not isinstance(pregunta_data, Dict) or not hasattr(self, 'ids'):
+        if not isinstance(pregunta_data, RegistroPregunta) or not hasattr(self, 'ids'):
             print("GameScreen: Datos de pregunta inválidos o ids faltan.")
             return
+        print(f"GameScreen: Mostrando pregunta: {pregunta_data.pregunta}")
+        self.pregunta_actual = pregunta_data
+        self.current_pregunta_id = pregunta_data.id
 
         # Actualizar el texto de la pregunta con ajuste de tamaño
         if hasattr(self.ids, 'question_text'):
-            self.set_pregunta(pregunta_data.get('pregunta', ''))
+            self.set_pregunta(pregunta_data.pregunta)
             print("GameScreen: Texto de la pregunta actualizado y font_size ajustado")
 
         # Verificar si la pregunta está en el cartón del jugador
-        pregunta_en_carton_jugador = None
+        pregunta_en_carton_jugador = False
         if self.app.cartones_jugador:
             player_carton = self.app.cartones_jugador[0]
-            if isinstance(player_carton, Dict):
-                pregunta_en_carton_jugador = next((p for p in player_carton.get('preguntas', []) or [] 
-                                                 if isinstance(p, Dict) and p.get('id') == pregunta_data.get('id')), None)
+            if isinstance(player_carton, CartonJuego):
+                pregunta_en_carton_jugador = player_carton.tiene(pregunta_data.id)
 
         # Limpiar opciones anteriores
         if hasattr(self.ids, 'options_container'):
@@ -194,22 +191,24 @@ class GameScreen(MDScreen):
             
             # Solo mostrar opciones si la pregunta está en el cartón del jugador
             if pregunta_en_carton_jugador:
-                opciones = pregunta_data.get('opciones', [])
-                if isinstance(opciones, list):
-                    print(f"GameScreen: Agregando {len(opciones)} opciones")
-                    for i, opcion in enumerate(opciones):
-                        btn = MDRaisedButton(
-                            text=opcion,
-                            size_hint_x=1,
-                            size_hint_y=None,
-                            height='40dp',
-                            md_bg_color=(0.3, 0.3, 0.3, 1),
-                            text_color=(1, 1, 1, 1),
-                            font_style='Button',
-                            on_release=lambda x, idx=i: self.app.process_player_answer(pregunta_data, idx) if self.app else None
-                        )
-                        self.ids.options_container.add_widget(btn)
-                        print(f"GameScreen: Opción {i+1} agregada: {opcion}")
+                # El orden de las opciones sale de la semilla de la partida;
+                # cada botón responde con el índice original de su opción
+                orden = pregunta_data.orden_opciones(self.app.semilla_partida)
+                print(f"GameScreen: Agregando {len(orden)} opciones")
+                for i, idx_opcion in enumerate(orden):
+                    opcion = pregunta_data.opciones[idx_opcion]
+                    btn = MDRaisedButton(
+                        text=opcion,
+                        size_hint_x=1,
+                        size_hint_y=None,
+                        height='40dp',
+                        md_bg_color=(0.3, 0.3, 0.3, 1),
+                        text_color=(1, 1, 1, 1),
+                        font_style='Button',
+                        on_release=lambda x, idx=idx_opcion: self.app.process_player_answer(pregunta_data, idx) if self.app else None
+                    )
+                    self.ids.options_container.add_widget(btn)
+                    print(f"GameScreen: Opción {i+1} agregada: {opcion}")
             else:
                 print("GameScreen: La pregunta no está en el cartón del jugador")
                 if hasattr(self.ids, 'game_messages'):
@@ -246,7 +245,7 @@ class GameScreen(MDScreen):
         if self.dialog:
             self.dialog.open()
 
-    def animar_bingo(self, carton: Dict[str, Any]) -> None:
+    def animar_bingo(self, carton: CartonJuego) -> None:
         """Anima el cartón cuando hay bingo"""
         # Create individual animations
         flash_in = Animation(md_bg_color=(0, 1, 0, 0.5), duration=0.5)
@@ -261,9 +260,9 @@ class GameScreen(MDScreen):
         if hasattr(self.ids, 'player_card_grid'):
             anim.start(self.ids.player_card_grid)
 
-    def mostrar_carton_ia_bingo(self, ia_carton: Dict[str, Any]):
+    def mostrar_carton_ia_bingo(self, ia_carton: CartonJuego):
         """Muestra el cartón de una IA en la interfaz cuando hace bingo."""
-        if not isinstance(ia_carton, Dict) or not hasattr(self.ids, 'ai_cards_container'):
+        if not isinstance(ia_carton, CartonJuego) or not hasattr(self.ids, 'ai_cards_container'):
             print("Error: Datos de cartón de IA inválidos o contenedor no encontrado.")
             return
 
@@ -278,7 +277,7 @@ class GameScreen(MDScreen):
         )
 
         # Añadir un label para identificar a la IA (ej. por categoría o número)
-        ia_name = ia_carton.get('categoria', f'IA {len(self.ids.ai_cards_container.children) + 1}').capitalize()
+        ia_name = f'IA {len(self.ids.ai_cards_container.children) + 1}'.capitalize()
         ai_card_label = MDLabel(
             text=f"Cartón de la {ia_name}",
             halign='center',
@@ -296,9 +295,7 @@ class GameScreen(MDScreen):
         ai_card.add_widget(ai_card_grid)
 
         # Poblar la cuadrícula con los números de la IA (marcados si están correctos)
-        preguntas_ia = ia_carton.get('preguntas', [])
-        if isinstance(preguntas_ia, list):
-            self._populate_card_grid(ai_card_grid, preguntas_ia, is_ia=True)
+        self._populate_card_grid(ai_card_grid, ia_carton, is_ia=True)
 
         # Añadir el cartón de la IA al contenedor en la UI
         self.ids.ai_cards_container.add_widget(ai_card)
@@ -311,11 +308,8 @@ class GameScreen(MDScreen):
         if not self.app or not self.app.cartones_jugador:
             self.mostrar_dialogo("Error", "No se encontró el cartón del jugador.")
             return
-        carton_jugador = self.app.cartones_jugador[0]
-        if self.app.verificar_bingo(carton_jugador):
-            # Terminar el juego y mostrar estadísticas con opciones
-            self.app.terminar_juego(winner="player")
-        else:
+        # El motor comprueba el cartón y, si hay bingo, termina la partida y muestra las estadísticas
+        if not self.app.cantar_bingo():
             self.mostrar_dialogo("No hay Bingo", "Aún no has completado todas las preguntas correctamente.")
 
     def update_timer_label(self, seconds_left: int):
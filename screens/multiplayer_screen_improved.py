@@ -19,6 +19,7 @@ import random
 import os
 
 from utils.multiplayer_utils import ConnectionManager, MultiplayerUtils
+from core.question_bank import question_bank
 from kivymd.app import MDApp
 
 # Importar la aplicación principal
@@ -167,7 +168,7 @@ class MultiplayerScreenImproved(MDScreen):
                     self.handle_player_answer(data, addr)
             
             # Datos de inicio de juego (compatibilidad)
-            elif 'carton' in data and 'preguntas_globales' in data:
+            elif 'semilla' in data and 'asiento' in data:
                 self.handle_game_data(data)
                 
         except Exception as e:
@@ -181,11 +182,9 @@ class MultiplayerScreenImproved(MDScreen):
                 print("ERROR: La aplicación no es una instancia de BingoApp")
                 return
             
-            # Asignar cartón y preguntas
-            app.cartones_jugador = [data['carton']]
-            app.preguntas_disponibles = data['preguntas_globales']
-            app.preguntas_ya_usadas = []
-            app.game_in_progress = True
+            # Reconstruir cartón y preguntas con la semilla del host
+            if not app.preparar_partida_sembrada(data):
+                return
             
             print("[DEBUG] Datos de juego recibidos")
             
@@ -203,11 +202,10 @@ class MultiplayerScreenImproved(MDScreen):
                 print("ERROR: La aplicación no es una instancia de BingoApp")
                 return
             
-            # Configurar juego
-            app.cartones_jugador = [data['carton']]
-            app.preguntas_disponibles = data['questions']
-            app.preguntas_ya_usadas = []
-            app.game_in_progress = True
+            # Configurar juego: el cartón se reconstruye localmente
+            if not app.preparar_partida_sembrada(data):
+                self.show_error("El banco de preguntas no coincide con el del anfitrión")
+                return
             
             # Cambiar a pantalla de juego
             app.cambiar_pantalla('game', 'up')
@@ -227,7 +225,7 @@ class MultiplayerScreenImproved(MDScreen):
             if app.sm and app.sm.current == 'game':
                 game_screen = app.sm.get_screen('game')
                 if hasattr(game_screen, 'mostrar_pregunta_en_ui'):
-                    game_screen.mostrar_pregunta_en_ui(data['question'])
+                    game_screen.mostrar_pregunta_en_ui(question_bank.registro_por_clave(data['question']))
             
         except Exception as e:
             print(f"[ERROR] Error al procesar pregunta: {e}")
@@ -358,25 +356,21 @@ class MultiplayerScreenImproved(MDScreen):
                 self.show_error("No se pudieron generar los datos del juego")
                 return
             
-            # Enviar datos a todos los clientes
+            # Configurar juego para el host (asiento 0) antes de avisar a nadie
+            if not app.preparar_partida_sembrada(dict(game_data, asiento=0)):
+                self.show_error("No hay suficientes preguntas válidas para los cartones")
+                return
+            
+            # Enviar a cada cliente solo la semilla y su asiento; el cartón
+            # y el orden de preguntas se reconstruyen con su banco local
             for i, (client, addr) in enumerate(self.connection_manager.connected_players, 1):
                 try:
-                    data = {
-                        'type': 'game_start',
-                        'carton': game_data['cartones'][i],
-                        'questions': game_data['preguntas_globales']
-                    }
+                    data = dict(game_data, type='game_start', asiento=i)
                     if not MultiplayerUtils.send_data(client, data):
                         print(f"[WARNING] No se pudo enviar datos a {addr}")
                 except Exception as e:
                     print(f"[ERROR] Error al enviar datos a {addr}: {e}")
             
-            # Configurar juego para el host
-            app.cartones_jugador = [game_data['cartones'][0]]
-            app.preguntas_disponibles = game_data['preguntas_globales'].copy()
-            app.preguntas_ya_usadas = []
-            app.game_in_progress = True
-            
             # Marcar juego como iniciado
             self.game_started = True
             
@@ -392,85 +386,20 @@ class MultiplayerScreenImproved(MDScreen):
     def generate_multiplayer_game(self) -> Optional[Dict[str, Any]]:
         """Genera los datos del juego para multijugador"""
         try:
-            # Cargar todas las preguntas
-            all_questions = []
-            base_dir = 'cartones'
-            
-            if not os.path.exists(base_dir):
+            # Cargar todas las preguntas desde el banco compilado
+            if not os.path.exists(question_bank.base_dir):
                 self.show_error("No se encontró el directorio de cartones")
                 return None
             
-            categorias_encontradas = [d for d in os.listdir(base_dir) if os.path.isdir(os.path.join(base_dir, d))]
-            
-            for categoria in categorias_encontradas:
-                categoria_dir = os.path.join(base_dir, categoria)
-                for archivo in os.listdir(categoria_dir):
-                    if archivo.endswith('.json'):
-                        ruta_archivo = os.path.join(categoria_dir, archivo)
-                        try:
-                            with open(ruta_archivo, 'r', encoding='utf-8') as f:
-                                data = json.load(f)
-                                preguntas = data.get('preguntas', [])
-                                for i, pregunta in enumerate(preguntas):
-                                    pregunta = pregunta.copy()
-                                    pregunta['categoria'] = categoria
-                                    pregunta['id'] = f"{categoria}_{archivo}_{i}"
-                                    pregunta['respondida'] = False
-                                    pregunta['correcta'] = False
-                                    if 'opciones' in pregunta and isinstance(pregunta['opciones'], list):
-                                        respuesta_correcta = pregunta.get('respuesta_correcta')
-                                        opciones = pregunta['opciones'].copy()
-                                        random.shuffle(opciones)
-                                        pregunta['opciones'] = opciones
-                                        if respuesta_correcta in opciones:
-                                            pregunta['respuesta_correcta'] = respuesta_correcta
-                                            pregunta['indice_correcto'] = opciones.index(respuesta_correcta)
-                                    all_questions.append(pregunta)
-                        except Exception as e:
-                            print(f"Error procesando {ruta_archivo}: {e}")
-            
-            if not all_questions:
-                self.show_error("No se encontraron preguntas válidas")
-                return None
-            
-            # Generar cartones únicos
-            num_jugadores = self.connection_manager.get_player_count()
-            cartones = []
-            
-            for _ in range(num_jugadores):
-                preguntas_seleccionadas = []
-                categorias_usadas = set()
-                
-                while len(preguntas_seleccionadas) < 8:
-                    pregunta = random.choice(all_questions)
-                    if pregunta not in preguntas_seleccionadas:
-                        preguntas_seleccionadas.append(pregunta)
-                        categorias_usadas.add(pregunta['categoria'])
-                
-                random.shuffle(preguntas_seleccionadas)
-                carton = {
-                    'preguntas': preguntas_seleccionadas,
-                    'categorias': list(categorias_usadas),
-                    'id': f"carton_{random.randint(100000, 999999)}",
-                    'estructura': {
-                        'filas': 2,
-                        'columnas': 4
-                    }
-                }
-                cartones.append(carton)
-            
-            # Generar lista global de preguntas
-            preguntas_globales = []
-            for carton in cartones:
-                preguntas_globales.extend(carton['preguntas'])
-            
-            preguntas_globales = list({p['id']: p for p in preguntas_globales}.values())
-            random.shuffle(preguntas_globales)
-            
-            return {
-                'cartones': cartones,
-                'preguntas_globales': preguntas_globales
+            # La partida es función de (versión del banco, semilla, jugadores, categorías)
+            app = MDApp.get_running_app()
+            partida = {
+                'banco': question_bank.version_contenido(),
+                'semilla': random.getrandbits(32),
+                'jugadores': self.connection_manager.get_player_count(),
+                'categorias': app.categorias_partida()
             }
+            return partida
             
         except Exception as e:
             print(f"[ERROR] Error al generar juego: {e}")
@@ -524,18 +524,15 @@ class NetworkScreen(Screen):
         if hasattr(self.ids, 'players_count_label'):
             self.ids.players_count_label.text = f"Jugadores conectados: {len(nombres)}/10" 
 
-    def asignar_cartones_y_enviar_wifi(self, cartones, preguntas_globales):
-        """Asigna el cartón correcto a cada jugador por nombre y lo envía por su socket."""
-        # El host es el primer cartón
+    def asignar_cartones_y_enviar_wifi(self, partida):
+        """Envía a cada jugador los datos de la partida y su asiento para que reconstruya su cartón."""
+        # El host ocupa el asiento 0
         if not hasattr(self, 'connected_players'):
             print("No hay jugadores conectados para asignar cartones.")
             return
         for idx, (client, nombre) in enumerate(self.connected_players, 1):
             try:
-                data = {
-                    'carton': cartones[idx],
-                    'preguntas_globales': preguntas_globales
-                }
+                data = dict(partida, asiento=idx)
                 client.send(json.dumps(data).encode('utf-8'))
                 print(f"[DEBUG] Cartón enviado a {nombre}")
             except Exception as e:
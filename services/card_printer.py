@@ -0,0 +1,373 @@
+"""
+Servicio de impresión de cartones para Bingo Educativo
+Renderiza cartones en papel (números de pregunta, lista de preguntas,
+insignias de categoría y fondo de assets/cartones/<categoria>/carton_*.jpg)
+como páginas PNG o como un PDF de varias páginas, repartiendo las páginas
+entre varios procesos
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import glob
+import hashlib
+import io
+import os
+import zlib
+
+from PIL import Image, ImageDraw, ImageFont
+
+from core.question_record import CartonJuego
+
+
+# Directorio con los fondos de cartón por categoría
+FONDOS_DIR = os.path.join('assets', 'cartones')
+
+# Caché en disco de fondos ya escalados, indexada por huella del archivo
+CACHE_FONDOS_DIR = os.path.join('cache', 'fondos_impresion')
+
+# Página A4 a 150 ppp, con dos cartones por página
+PPP = 150
+TAMANO_PAGINA = (1240, 1754)
+CARTONES_POR_PAGINA = 2
+MARGEN = 40
+
+# Disposición de los números de pregunta en el cartón (2 filas x 4 columnas)
+COLUMNAS = 4
+
+CALIDAD_JPEG = 85
+
+# Colores de las insignias de categoría (se elige por huella del nombre)
+COLORES_INSIGNIA = [
+    (33, 150, 243), (229, 57, 53), (67, 160, 71), (251, 140, 0),
+    (142, 36, 170), (0, 137, 123), (216, 27, 96), (84, 110, 122)
+]
+
+# Casilla impresa: (número de pregunta, texto, categoría)
+Casilla = Tuple[int, str, str]
+# Cartón listo para imprimir: (id del cartón, casillas, fondo (huella, ruta) o None)
+FichaCarton = Tuple[str, List[Casilla], Optional[Tuple[str, str]]]
+
+# Máscaras de texto guardadas por proceso; al llenarse se vacía la caché
+MAX_TEXTOS_CACHE = 4096
+
+# Cachés por proceso de trabajo: cada proceso escala cada fondo una sola vez
+# y rasteriza cada texto (números, preguntas, insignias) una sola vez
+_fondos: Dict[Tuple[str, int, int], Image.Image] = {}
+_fuentes: Dict[int, Any] = {}
+_textos: Dict[Tuple[str, int, int], Tuple[Image.Image, int, int]] = {}
+
+
+def huella_archivo(ruta: str) -> str:
+    """Huella del contenido de un archivo (no de su nombre ni fecha)"""
+    resumen = hashlib.blake2b(digest_size=12)
+    with open(ruta, 'rb') as f:
+        for bloque in iter(lambda: f.read(1024 * 1024), b''):
+            resumen.update(bloque)
+    return resumen.hexdigest()
+
+
+def _fuente(tamano: int) -> Any:
+    fuente = _fuentes.get(tamano)
+    if fuente is None:
+        try:
+            fuente = ImageFont.truetype('DejaVuSans.ttf', tamano)
+        except OSError:
+            try:
+                fuente = ImageFont.load_default(tamano)
+            except TypeError:
+                # Pillow < 10.1 no admite tamaño en la fuente por defecto
+                fuente = ImageFont.load_default()
+        _fuentes[tamano] = fuente
+    return fuente
+
+
+def _fondo(huella: str, ruta: str, tamano: Tuple[int, int], cache_dir: str) -> Image.Image:
+    """
+    Fondo escalado y aclarado para que el texto se lea al imprimirlo.
+    Se busca primero en la caché del proceso, luego en la de disco y solo
+    si no está se procesa la imagen original.
+    """
+    clave = (huella, tamano[0], tamano[1])
+    fondo = _fondos.get(clave)
+    if fondo is not None:
+        return fondo
+
+    ruta_cache = os.path.join(cache_dir, f"{huella}_{tamano[0]}x{tamano[1]}.png")
+    try:
+        with Image.open(ruta_cache) as imagen:
+            fondo = imagen.convert('RGB')
+    except (OSError, ValueError):
+        with Image.open(ruta) as imagen:
+            original = imagen.convert('RGB')
+        # Recortar al centro con la proporción del cartón y escalar
+        escala = max(tamano[0] / original.width, tamano[1] / original.height)
+        ancho, alto = round(original.width * escala), round(original.height * escala)
+        original = original.resize((ancho, alto), Image.LANCZOS)
+        x, y = (ancho - tamano[0]) // 2, (alto - tamano[1]) // 2
+        fondo = Image.blend(original.crop((x, y, x + tamano[0], y + tamano[1])),
+                            Image.new('RGB', tamano, (255, 255, 255)), 0.65)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Varios procesos pueden escribir el mismo fondo: escritura atómica
+            temporal = f"{ruta_cache}.{os.getpid()}.tmp"
+            fondo.save(temporal, 'PNG')
+            os.replace(temporal, ruta_cache)
+        except OSError as e:
+            print(f"[WARNING] No se pudo guardar el fondo en caché: {e}")
+
+    _fondos[clave] = fondo
+    return fondo
+
+
+def _recortar(fuente: Any, texto: str, ancho: int) -> str:
+    """Acorta el texto con '…' para que quepa en el ancho dado"""
+    if fuente.getlength(texto) <= ancho:
+        return texto
+    while texto and fuente.getlength(texto + '…') > ancho:
+        texto = texto[:-1]
+    return texto + '…'
+
+
+def _mascara_texto(texto: str, tamano: int, ancho_maximo: int = 0) -> Tuple[Image.Image, int, int]:
+    """
+    Texto rasterizado como máscara 'L' y su desplazamiento. Rasterizar es lo
+    más caro de una página y los cartones repiten preguntas y números, así
+    que cada texto se dibuja una vez por proceso.
+    """
+    clave = (texto, tamano, ancho_maximo)
+    mascara = _textos.get(clave)
+    if mascara is None:
+        fuente = _fuente(tamano)
+        if ancho_maximo:
+            texto = _recortar(fuente, texto, ancho_maximo)
+        izquierda, arriba, derecha, abajo = fuente.getbbox(texto)
+        imagen = Image.new('L', (max(1, derecha - izquierda), max(1, abajo - arriba)), 0)
+        ImageDraw.Draw(imagen).text((-izquierda, -arriba), texto, fill=255, font=fuente)
+        if len(_textos) >= MAX_TEXTOS_CACHE:
+            _textos.clear()
+        mascara = _textos[clave] = (imagen, izquierda, arriba)
+    return mascara
+
+
+def _texto(pagina: Image.Image, posicion: Tuple[float, float], texto: str, tamano: int,
+           color: Tuple[int, int, int], ancho_maximo: int = 0) -> int:
+    """Pega un texto cacheado en la página; devuelve su ancho"""
+    imagen, izquierda, arriba = _mascara_texto(texto, tamano, ancho_maximo)
+    x, y = int(posicion[0]) + izquierda, int(posicion[1]) + arriba
+    pagina.paste(color, (x, y, x + imagen.width, y + imagen.height), imagen)
+    return izquierda + imagen.width
+
+
+def _dibujar_carton(pagina: Image.Image, caja: Tuple[int, int, int, int],
+                    ficha: FichaCarton, cache_dir: str) -> None:
+    x0, y0, x1, y1 = caja
+    ancho, alto = x1 - x0, y1 - y0
+    carton_id, casillas, fondo = ficha
+    if fondo is not None:
+        pagina.paste(_fondo(fondo[0], fondo[1], (ancho, alto), cache_dir), (x0, y0))
+    dibujo = ImageDraw.Draw(pagina)
+    dibujo.rectangle(caja, outline=(40, 40, 40), width=3)
+
+    # Cabecera: id del cartón e insignias de las categorías presentes
+    relleno = 20
+    _texto(pagina, (x0 + relleno, y0 + relleno), f"Cartón {carton_id}", 34, (20, 20, 20))
+    x = x0 + relleno
+    y = y0 + relleno + 48
+    for categoria in dict.fromkeys(casilla[2] for casilla in casillas):
+        etiqueta = categoria.replace('_', ' ').upper()
+        largo = _mascara_texto(etiqueta, 20)[0].width + 24
+        color = COLORES_INSIGNIA[zlib.crc32(categoria.encode('utf-8')) % len(COLORES_INSIGNIA)]
+        dibujo.rounded_rectangle((x, y, x + largo, y + 32), radius=16, fill=color)
+        _texto(pagina, (x + 12, y + 5), etiqueta, 20, (255, 255, 255))
+        x += largo + 10
+
+    # Cuadrícula con los números de pregunta
+    filas = -(-len(casillas) // COLUMNAS)
+    y_grilla = y + 50
+    alto_celda = 90
+    ancho_celda = (ancho - 2 * relleno) // COLUMNAS
+    for i, (numero, _, _) in enumerate(casillas):
+        cx = x0 + relleno + (i % COLUMNAS) * ancho_celda
+        cy = y_grilla + (i // COLUMNAS) * alto_celda
+        dibujo.rectangle((cx, cy, cx + ancho_celda, cy + alto_celda), fill=(255, 255, 255), outline=(40, 40, 40), width=2)
+        imagen, izquierda, _ = _mascara_texto(str(numero), 48)
+        _texto(pagina, (cx + (ancho_celda - imagen.width) / 2 - izquierda, cy + 18), str(numero), 48, (20, 20, 20))
+
+    # Lista de preguntas con su número
+    y = y_grilla + filas * alto_celda + 20
+    for numero, texto, _ in casillas:
+        if y + 28 > y1 - relleno:
+            break
+        _texto(pagina, (x0 + relleno, y), f"{numero}. {texto}", 22, (20, 20, 20), ancho - 2 * relleno)
+        y += 30
+
+
+def renderizar_pagina(fichas: Sequence[FichaCarton], cache_dir: str = CACHE_FONDOS_DIR) -> Image.Image:
+    """Dibuja una página con hasta CARTONES_POR_PAGINA cartones apilados"""
+    pagina = Image.new('RGB', TAMANO_PAGINA, (255, 255, 255))
+    alto_carton = (TAMANO_PAGINA[1] - MARGEN * (CARTONES_POR_PAGINA + 1)) // CARTONES_POR_PAGINA
+    for i, ficha in enumerate(fichas):
+        y = MARGEN + i * (alto_carton + MARGEN)
+        _dibujar_carton(pagina, (MARGEN, y, TAMANO_PAGINA[0] - MARGEN, y + alto_carton), ficha, cache_dir)
+    return pagina
+
+
+def _trabajo_pagina(tarea: Tuple[int, Sequence[FichaCarton], str, str, str]) -> Any:
+    """
+    Tarea de un proceso de trabajo. Para PNG guarda la página y devuelve su
+    ruta; para PDF devuelve los bytes JPEG para no pasar píxeles entre procesos.
+    """
+    numero, fichas, formato, destino, cache_dir = tarea
+    pagina = renderizar_pagina(fichas, cache_dir)
+    if formato == 'png':
+        ruta = os.path.join(destino, f"pagina_{numero:04d}.png")
+        pagina.save(ruta, 'PNG', dpi=(PPP, PPP))
+        return ruta
+    salida = io.BytesIO()
+    pagina.save(salida, 'JPEG', quality=CALIDAD_JPEG)
+    return salida.getvalue()
+
+
+def escribir_pdf(ruta: str, paginas_jpeg: Iterable[bytes], tamano: Tuple[int, int] = TAMANO_PAGINA,
+                 ppp: int = PPP) -> int:
+    """
+    Escribe un PDF con una imagen JPEG por página, a medida que llegan.
+    Los JPEG se incrustan tal cual (DCTDecode), así que nunca hay más de una
+    página en memoria. Devuelve el número de páginas.
+    """
+    ancho_pt, alto_pt = tamano[0] * 72 / ppp, tamano[1] * 72 / ppp
+    offsets: List[int] = []
+    paginas: List[int] = []
+    with open(ruta, 'wb') as f:
+        def objeto(numero: int, contenido: bytes) -> None:
+            offsets.append(f.tell())
+            f.write(b'%d 0 obj\n' % numero + contenido + b'\nendobj\n')
+
+        f.write(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+        # Objetos 1 (catálogo) y 2 (árbol de páginas) se escriben al final
+        siguiente = 3
+        for jpeg in paginas_jpeg:
+            imagen, dibujo, pagina = siguiente, siguiente + 1, siguiente + 2
+            siguiente += 3
+            objeto(imagen, b'<< /Type /XObject /Subtype /Image /Width %d /Height %d /ColorSpace /DeviceRGB '
+                           b'/BitsPerComponent 8 /Filter /DCTDecode /Length %d >>\nstream\n'
+                   % (tamano[0], tamano[1], len(jpeg)) + jpeg + b'\nendstream')
+            operaciones = b'q %.2f 0 0 %.2f 0 0 cm /Im0 Do Q' % (ancho_pt, alto_pt)
+            objeto(dibujo, b'<< /Length %d >>\nstream\n' % len(operaciones) + operaciones + b'\nendstream')
+            objeto(pagina, b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %.2f %.2f] '
+                           b'/Resources << /XObject << /Im0 %d 0 R >> >> /Contents %d 0 R >>'
+                   % (ancho_pt, alto_pt, imagen, dibujo))
+            paginas.append(pagina)
+
+        objeto(1, b'<< /Type /Catalog /Pages 2 0 R >>')
+        hijos = b' '.join(b'%d 0 R' % pagina for pagina in paginas)
+        objeto(2, b'<< /Type /Pages /Kids [%s] /Count %d >>' % (hijos, len(paginas)))
+
+        # Tabla de referencias cruzadas ordenada por número de objeto
+        posiciones = dict(zip(list(range(3, siguiente)) + [1, 2], offsets))
+        inicio_xref = f.tell()
+        f.write(b'xref\n0 %d\n0000000000 65535 f \n' % siguiente)
+        for numero in range(1, siguiente):
+            f.write(b'%010d 00000 n \n' % posiciones[numero])
+        f.write(b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (siguiente, inicio_xref))
+    return len(paginas)
+
+
+class CardPrinter:
+    """
+    Exporta cartones para imprimir. Las páginas se reparten entre procesos
+    con ProcessPoolExecutor; cada proceso guarda los fondos ya escalados en
+    memoria y todos comparten la caché en disco indexada por huella.
+    """
+
+    def __init__(self, fondos_dir: str = FONDOS_DIR, cache_dir: str = CACHE_FONDOS_DIR):
+        self.fondos_dir = fondos_dir
+        self.cache_dir = cache_dir
+        self._huellas: Dict[str, str] = {}
+
+    def fondos_categoria(self, categoria: str) -> List[Tuple[str, str]]:
+        """Fondos disponibles de una categoría como (huella, ruta)"""
+        rutas = sorted(glob.glob(os.path.join(self.fondos_dir, categoria, 'carton_*.jpg')))
+        fondos = []
+        for ruta in rutas:
+            huella = self._huellas.get(ruta)
+            if huella is None:
+                huella = self._huellas[ruta] = huella_archivo(ruta)
+            fondos.append((huella, ruta))
+        return fondos
+
+    def fichas(self, cartones: Iterable[CartonJuego], banco: Any) -> List[FichaCarton]:
+        """
+        Prepara los datos que se imprimen de cada cartón. El fondo es de la
+        categoría con más preguntas en el cartón y se elige según su id, así
+        que reimprimir un cartón da el mismo resultado.
+        """
+        fondos: Dict[str, List[Tuple[str, str]]] = {}
+        fichas = []
+        for carton in cartones:
+            casillas: List[Casilla] = []
+            for pregunta_id in carton.preguntas:
+                registro = banco.registro(pregunta_id)
+                casillas.append((pregunta_id + 1, registro.pregunta, registro.categoria))
+            categorias = [casilla[2] for casilla in casillas]
+            fondo = None
+            if categorias:
+                principal = max(dict.fromkeys(categorias), key=categorias.count)
+                if principal not in fondos:
+                    fondos[principal] = self.fondos_categoria(principal)
+                if fondos[principal]:
+                    opciones = fondos[principal]
+                    fondo = opciones[zlib.crc32(carton.id.encode('utf-8')) % len(opciones)]
+            fichas.append((carton.id, casillas, fondo))
+        return fichas
+
+    def _paginas(self, fichas: Sequence[FichaCarton], formato: str, destino: str,
+                 procesos: Optional[int]) -> Iterator[Any]:
+        tareas = [(numero, fichas[inicio:inicio + CARTONES_POR_PAGINA], formato, destino, self.cache_dir)
+                  for numero, inicio in enumerate(range(0, len(fichas), CARTONES_POR_PAGINA), 1)]
+        if procesos == 1 or len(tareas) <= 1:
+            yield from map(_trabajo_pagina, tareas)
+            return
+        try:
+            ejecutor = ProcessPoolExecutor(max_workers=procesos)
+        except (OSError, NotImplementedError, ImportError) as e:
+            # Algunas plataformas (p. ej. Android) no permiten crear procesos
+            print(f"[WARNING] Sin procesos de trabajo ({e}); se renderiza en serie")
+            yield from map(_trabajo_pagina, tareas)
+            return
+        with ejecutor:
+            trabajadores = procesos or os.cpu_count() or 1
+            # Lotes grandes reducen el ir y venir entre procesos
+            yield from ejecutor.map(_trabajo_pagina, tareas,
+                                    chunksize=max(1, len(tareas) // (trabajadores * 4)))
+
+    def exportar(self, cartones: Iterable[CartonJuego], banco: Any, destino: str,
+                 formato: str = 'pdf', procesos: Optional[int] = None) -> List[str]:
+        """
+        Exporta los cartones como páginas PNG (destino es un directorio) o
+        como un PDF de varias páginas (destino es el archivo).
+
+        Args:
+            procesos: Procesos de trabajo; None usa todos los núcleos y 1 renderiza en serie
+
+        Returns:
+            Rutas de los archivos generados
+        """
+        if formato not in ('png', 'pdf'):
+            raise ValueError(f"Formato de impresión no soportado: {formato}")
+        fichas = self.fichas(cartones, banco)
+        if formato == 'png':
+            os.makedirs(destino, exist_ok=True)
+            rutas = list(self._paginas(fichas, formato, destino, procesos))
+        else:
+            directorio = os.path.dirname(destino)
+            if directorio:
+                os.makedirs(directorio, exist_ok=True)
+            escribir_pdf(destino, self._paginas(fichas, formato, destino, procesos))
+            rutas = [destino]
+        print(f"[DEBUG] {len(fichas)} cartones exportados en {formato.upper()} ({destino})")
+        return rutas
+
+
+# Instancia global del servicio
+card_printer = CardPrinter()
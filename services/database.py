@@ -1,14 +1,20 @@
 from typing import Optional, Dict, List, Any, Union, cast, TypeVar, Tuple, NoReturn, Type
 import sqlite3
 import os
+import ast
+import json
 from datetime import datetime
 # from pymongo import MongoClient  # Comentado para compatibilidad con APK
 # from dotenv import load_dotenv    # Comentado para compatibilidad con APK
 import random
 # from models.question import Question  # Comentado temporalmente
+from core.question_bank import QuestionBank, question_bank
 
 T = TypeVar('T')
 
+# Columnas de la tabla de preguntas en el orden que espera _row_to_question
+QUESTION_COLUMNS = "id, question, answer, category, options, correct_answer"
+
 class Database:
     def __init__(self, db_path: str = "bingo_quiz.db"):
         self.db_path = db_path
@@ -62,12 +68,64 @@ class Database:
                 answer TEXT,
                 category TEXT,
                 options TEXT,
-                correct_answer INTEGER
+                correct_answer INTEGER,
+                category_pos INTEGER
+            )
+        """)
+        
+        # Número de preguntas por categoría; permite elegir una posición
+        # aleatoria sin contar filas
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS question_counts (
+                category TEXT PRIMARY KEY,
+                total INTEGER NOT NULL
             )
         """)
         
+        self._migrate_questions_table()
+        
+        self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_questions_category ON questions (category)")
+        self.cursor.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_questions_category_pos
+            ON questions (category, category_pos)
+        """)
+        
         self.conn.commit()
         
+    def _migrate_questions_table(self) -> None:
+        """Adapta bases antiguas: opciones en JSON y posición densa por categoría"""
+        if not self.cursor:
+            return
+            
+        self.cursor.execute("PRAGMA table_info(questions)")
+        columns = [row[1] for row in self.cursor.fetchall()]
+        if 'category_pos' in columns:
+            return
+            
+        self.cursor.execute("ALTER TABLE questions ADD COLUMN category_pos INTEGER")
+        self.cursor.execute("SELECT id, category, options FROM questions ORDER BY category, id")
+        rows = self.cursor.fetchall()
+        
+        updates = []
+        positions: Dict[str, int] = {}
+        for question_id, category, options in rows:
+            try:
+                # Formato anterior: str(list) leído con eval
+                options = json.dumps(ast.literal_eval(options) if options else [])
+            except (ValueError, SyntaxError):
+                options = json.dumps([])
+            pos = positions.get(category, 0)
+            positions[category] = pos + 1
+            updates.append((options, pos, question_id))
+            
+        self.cursor.executemany(
+            "UPDATE questions SET options = ?, category_pos = ? WHERE id = ?", updates
+        )
+        self.cursor.execute("DELETE FROM question_counts")
+        self.cursor.executemany(
+            "INSERT INTO question_counts (category, total) VALUES (?, ?)", positions.items()
+        )
+        
     def save_game(self, game_data: Dict[str, Any]) -> str:
         """Guarda un juego en la base de datos"""
         if not self.cursor or not self.conn:
@@ -117,21 +175,124 @@ class Database:
         if not question_id:
             question_id = f"q_{datetime.now().strftime('%Y%m%d%H%M%S')}"
             
+        with self.conn:
+            # Reemplazar una pregunta existente libera su posición en la categoría
+            self._remove_question_row(question_id)
+            category = question_data.get('category')
+            pos = self._get_count(category)
+            self.cursor.execute(f"""
+                INSERT INTO questions ({QUESTION_COLUMNS}, category_pos)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (
+                question_id,
+                question_data.get('question'),
+                question_data.get('answer'),
+                category,
+                json.dumps(question_data.get('options', []), ensure_ascii=False),
+                question_data.get('correct_answer'),
+                pos
+            ))
+            self._set_count(category, pos + 1)
+            
+        return question_id
+        
+    def import_from_cartones(self, base_dir: Optional[str] = None) -> int:
+        """
+        Importa en bloque las preguntas de cartones/<categoria>/*.json.
+        Reemplaza las categorías importadas en una sola transacción.
+        
+        Returns:
+            Número de preguntas importadas
+        """
+        if not self.cursor or not self.conn:
+            return 0
+            
+        bank = question_bank if base_dir is None else QuestionBank(base_dir=base_dir)
+        rows = []
+        totals: Dict[str, int] = {}
+        for category in bank.categorias():
+            for pregunta in bank.preguntas_categoria(category):
+                opciones = pregunta.get('opciones', [])
+                respuesta = pregunta.get('respuesta_correcta')
+                if respuesta not in opciones:
+                    print(f"[WARNING] Pregunta {pregunta.get('id')} sin respuesta válida, se omite")
+                    continue
+                pos = totals.get(category, 0)
+                totals[category] = pos + 1
+                rows.append((
+                    pregunta['id'],
+                    pregunta.get('pregunta'),
+                    respuesta,
+                    category,
+                    json.dumps(opciones, ensure_ascii=False),
+                    opciones.index(respuesta),
+                    pos
+                ))
+                
+        with self.conn:
+            self.cursor.executemany("DELETE FROM questions WHERE category = ?", [(c,) for c in totals])
+            self.cursor.executemany(f"""
+                INSERT OR REPLACE INTO questions ({QUESTION_COLUMNS}, category_pos)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            self.cursor.executemany("""
+                INSERT OR REPLACE INTO question_counts (category, total) VALUES (?, ?)
+            """, totals.items())
+            
+        print(f"[DB] Importadas {len(rows)} preguntas de {len(totals)} categorías")
+        return len(rows)
+        
+    def _row_to_question(self, row: Tuple) -> Dict[str, Any]:
+        """Convierte una fila de QUESTION_COLUMNS en diccionario"""
+        return {
+            'id': cast(str, row[0]),
+            'question': cast(str, row[1]),
+            'answer': cast(str, row[2]),
+            'category': cast(str, row[3]),
+            'options': json.loads(row[4]) if row[4] else [],
+            'correct_answer': cast(int, row[5])
+        }
+        
+    def _get_count(self, category: Optional[str]) -> int:
+        """Número de preguntas de una categoría (búsqueda por clave primaria)"""
+        if not self.cursor:
+            return 0
+        self.cursor.execute("SELECT total FROM question_counts WHERE category = ?", (category,))
+        row = self.cursor.fetchone()
+        return row[0] if row else 0
+        
+    def _set_count(self, category: Optional[str], total: int) -> None:
+        if not self.cursor:
+            return
         self.cursor.execute("""
-            INSERT OR REPLACE INTO questions 
-            (id, question, answer, category, options, correct_answer)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
-            question_id,
-            question_data.get('question'),
-            question_data.get('answer'),
-            question_data.get('category'),
-            str(question_data.get('options', [])),
-            question_data.get('correct_answer')
-        ))
+            INSERT OR REPLACE INTO question_counts (category, total) VALUES (?, ?)
+        """, (category, total))
         
-        self.conn.commit()
-        return question_id
+    def _remove_question_row(self, question_id: str) -> bool:
+        """
+        Elimina una pregunta manteniendo densas las posiciones de su categoría:
+        la última pregunta de la categoría ocupa el hueco.
+        Debe llamarse dentro de una transacción.
+        """
+        if not self.cursor:
+            return False
+        self.cursor.execute(
+            "SELECT category, category_pos FROM questions WHERE id = ?", (question_id,)
+        )
+        row = self.cursor.fetchone()
+        if not row:
+            return False
+            
+        category, pos = row
+        last_pos = self._get_count(category) - 1
+        self.cursor.execute("DELETE FROM questions WHERE id = ?", (question_id,))
+        if pos != last_pos:
+            self.cursor.execute("""
+                UPDATE questions SET category_pos = ?
+                WHERE category = ? AND category_pos = ?
+            """, (pos, category, last_pos))
+        self._set_count(category, max(last_pos, 0))
+        return True
         
     def get_questions(self, category: Optional[str] = None) -> List[Dict[str, Any]]:
         """Obtiene preguntas de la base de datos"""
@@ -139,22 +300,14 @@ class Database:
             return []
             
         if category:
-            self.cursor.execute("SELECT * FROM questions WHERE category = ?", (category,))
+            self.cursor.execute(
+                f"SELECT {QUESTION_COLUMNS} FROM questions WHERE category = ? ORDER BY category_pos",
+                (category,)
+            )
         else:
-            self.cursor.execute("SELECT * FROM questions")
-            
-        questions: List[Dict[str, Any]] = []
-        for row in self.cursor.fetchall():
-            questions.append({
-                'id': cast(str, row[0]),
-                'question': cast(str, row[1]),
-                'answer': cast(str, row[2]),
-                'category': cast(str, row[3]),
-                'options': eval(cast(str, row[4])),
-                'correct_answer': cast(int, row[5])
-            })
+            self.cursor.execute(f"SELECT {QUESTION_COLUMNS} FROM questions")
             
-        return questions
+        return [self._row_to_question(row) for row in self.cursor.fetchall()]
         
     def close(self) -> None:
         """Cierra la conexión con la base de datos"""
@@ -163,29 +316,93 @@ class Database:
         # self.client.close()  # Comentado para compatibilidad con APK
 
     def get_questions_by_category(self, category: str) -> List[Dict]:
-        """Obtener preguntas por categoría (SQLite solo)"""
-        # Función simplificada para compatibilidad con APK
-        return []
+        """Obtener preguntas por categoría (consulta por índice)"""
+        return self.get_questions(category)
+        
+    def get_question(self, question_id: str) -> Optional[Dict[str, Any]]:
+        """Obtener una pregunta por su id"""
+        if not self.cursor:
+            return None
+        self.cursor.execute(f"SELECT {QUESTION_COLUMNS} FROM questions WHERE id = ?", (question_id,))
+        row = self.cursor.fetchone()
+        return self._row_to_question(row) if row else None
+        
+    def get_categories(self) -> List[str]:
+        """Obtener las categorías con preguntas"""
+        if not self.cursor:
+            return []
+        self.cursor.execute("SELECT category FROM question_counts WHERE total > 0 ORDER BY category")
+        return [row[0] for row in self.cursor.fetchall()]
+        
+    def count_questions(self, category: Optional[str] = None) -> int:
+        """Contar preguntas, en total o de una categoría"""
+        if not self.cursor:
+            return 0
+        if category:
+            return self._get_count(category)
+        self.cursor.execute("SELECT COALESCE(SUM(total), 0) FROM question_counts")
+        return self.cursor.fetchone()[0]
         
     def add_question(self, question_data) -> str:
-        """Agregar una nueva pregunta (SQLite solo)"""
-        # Función simplificada para compatibilidad con APK
-        return ""
+        """Agregar una nueva pregunta"""
+        return self.save_question(question_data)
         
     def update_question(self, question_id: str, question_data: Dict) -> bool:
-        """Actualizar una pregunta existente (SQLite solo)"""
-        # Función simplificada para compatibilidad con APK
-        return False
+        """Actualizar una pregunta existente"""
+        current = self.get_question(question_id)
+        if not current:
+            return False
+        current.update(question_data)
+        current['id'] = question_id
+        self.save_question(current)
+        return True
         
     def delete_question(self, question_id: str) -> bool:
-        """Eliminar una pregunta (SQLite solo)"""
-        # Función simplificada para compatibilidad con APK
-        return False
+        """Eliminar una pregunta"""
+        if not self.cursor or not self.conn:
+            return False
+        with self.conn:
+            return self._remove_question_row(question_id)
         
     def get_random_question(self, category: Optional[str] = None) -> Dict[str, Any]:
-        """Obtener una pregunta aleatoria (SQLite solo)"""
-        # Función simplificada para compatibilidad con APK
-        return {}
+        """
+        Obtener una pregunta aleatoria sin recorrer la tabla: se elige una
+        posición al azar y se busca por el índice (category, category_pos).
+        """
+        questions = self.get_random_questions(1, category)
+        return questions[0] if questions else {}
+        
+    def get_random_questions(self, count: int, category: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Obtener varias preguntas aleatorias distintas (búsquedas por índice)"""
+        if not self.cursor or count <= 0:
+            return []
+            
+        if category:
+            totals = {category: self._get_count(category)}
+        else:
+            self.cursor.execute("SELECT category, total FROM question_counts WHERE total > 0")
+            totals = dict(self.cursor.fetchall())
+            
+        # Posiciones globales -> (categoría, posición) usando los totales acumulados
+        total = sum(totals.values())
+        if total == 0:
+            return []
+        picks = random.sample(range(total), min(count, total))
+        
+        questions = []
+        for pick in picks:
+            for cat, cat_total in totals.items():
+                if pick < cat_total:
+                    self.cursor.execute(f"""
+                        SELECT {QUESTION_COLUMNS} FROM questions
+                        WHERE category = ? AND category_pos = ?
+                    """, (cat, pick))
+                    row = self.cursor.fetchone()
+                    if row:
+                        questions.append(self._row_to_question(row))
+                    break
+                pick -= cat_total
+        return questions
 
     def update_game(self, game_id, game_data):
         """Actualizar juego (SQLite solo)"""
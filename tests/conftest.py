@@ -0,0 +1,50 @@
+"""
+Utilidades comunes de las pruebas: un banco de preguntas pequeño escrito en
+un directorio temporal, con su propio snapshot
+"""
+
+import json
+import os
+from typing import Any, Dict, List
+
+import pytest
+
+from core.question_bank import QuestionBank
+
+
+CATEGORIAS = ('arte', 'ciencia', 'historia')
+PREGUNTAS_POR_CATEGORIA = 30
+
+
+def pregunta(texto: str, correcta: int = 0) -> Dict[str, Any]:
+    opciones = [f"{texto} - opción {i}" for i in range(4)]
+    return {'pregunta': texto, 'opciones': opciones, 'respuesta_correcta': opciones[correcta]}
+
+
+def escribir_categoria(base_dir: str, categoria: str, preguntas: List[Dict[str, Any]],
+                       archivo: str = 'ejemplo.json') -> str:
+    carpeta = os.path.join(base_dir, categoria)
+    os.makedirs(carpeta, exist_ok=True)
+    ruta = os.path.join(carpeta, archivo)
+    with open(ruta, 'w', encoding='utf-8') as f:
+        if archivo.endswith('.jsonl'):
+            f.writelines(json.dumps(p, ensure_ascii=False) + '\n' for p in preguntas)
+        else:
+            json.dump({'categoria': categoria, 'preguntas': preguntas}, f, ensure_ascii=False)
+    return ruta
+
+
+@pytest.fixture
+def cartones_dir(tmp_path) -> str:
+    base_dir = str(tmp_path / 'cartones')
+    for categoria in CATEGORIAS:
+        escribir_categoria(base_dir, categoria, [pregunta(f"{categoria} {i}", i % 4)
+                                                 for i in range(PREGUNTAS_POR_CATEGORIA)])
+    return base_dir
+
+
+@pytest.fixture
+def banco(cartones_dir, tmp_path) -> QuestionBank:
+    banco = QuestionBank(cartones_dir, str(tmp_path / 'question_bank.cache'))
+    banco.cargar()
+    return banco
@@ -0,0 +1,74 @@
+import itertools
+import random
+
+import pytest
+
+from core.card_generator import PREGUNTAS_POR_CARTON, CardGenerator, generar_partida, preguntas_de_cartones
+
+
+def solapamiento_maximo(cartones) -> int:
+    return max(len(set(a.preguntas) & set(b.preguntas)) for a, b in itertools.combinations(cartones, 2))
+
+
+def test_lote_sin_preguntas_repetidas_en_un_carton():
+    cartones = CardGenerator(range(40), rng=random.Random(1)).generar_lote(25)
+    assert len({carton.id for carton in cartones}) == 25
+    for carton in cartones:
+        assert len(carton) == PREGUNTAS_POR_CARTON
+        assert len(set(carton.preguntas)) == PREGUNTAS_POR_CARTON
+
+
+@pytest.mark.parametrize('max_solapamiento', [1, 2, 4])
+def test_conjunto_respeta_el_solapamiento(max_solapamiento):
+    for semilla in range(10):
+        generador = CardGenerator(range(60), rng=random.Random(semilla))
+        cartones = generador.generar_conjunto(10, max_solapamiento=max_solapamiento)
+        assert len(cartones) == 10
+        assert solapamiento_maximo(cartones) <= max_solapamiento
+
+
+def test_conjunto_imposible_falla():
+    # 8 preguntas: dos cartones comparten siempre las 8
+    with pytest.raises(ValueError, match="No se pudieron generar"):
+        CardGenerator(range(PREGUNTAS_POR_CARTON), rng=random.Random(0)).generar_conjunto(2, max_solapamiento=4)
+
+
+def test_pool_insuficiente_falla_al_construir():
+    with pytest.raises(ValueError):
+        CardGenerator(range(PREGUNTAS_POR_CARTON - 1))
+
+
+def test_preguntas_de_cartones_sin_repetir():
+    cartones = CardGenerator(range(20), rng=random.Random(3)).generar_lote(6)
+    ids = preguntas_de_cartones(cartones, random.Random(3))
+    assert len(ids) == len(set(ids))
+    assert set(ids) == {pregunta_id for carton in cartones for pregunta_id in carton.preguntas}
+
+
+def resumen(partida):
+    cartones, orden = partida
+    return [carton.preguntas for carton in cartones], [carton.id for carton in cartones], orden
+
+
+def test_generar_partida_es_determinista():
+    # Lo que calcula el host y lo que reconstruye cada cliente por separado
+    host = generar_partida(range(80), 'v1', 1234, 5)
+    cliente = generar_partida(list(range(80)), 'v1', 1234, 5)
+    assert resumen(host) == resumen(cliente)
+    assert len(host[0]) == 5
+    assert set(host[1]) == {pregunta_id for carton in host[0] for pregunta_id in carton.preguntas}
+
+
+@pytest.mark.parametrize('cambio', [
+    dict(version_banco='v2'), dict(semilla=1235), dict(jugadores=6), dict(ids=range(1, 81)),
+])
+def test_generar_partida_depende_de_todos_sus_datos(cambio):
+    datos = dict(ids=range(80), version_banco='v1', semilla=1234, jugadores=5)
+    assert resumen(generar_partida(**datos)) != resumen(generar_partida(**dict(datos, **cambio)))
+
+
+def test_generar_partida_con_las_categorias_del_host(banco):
+    categorias = ['arte', 'historia']
+    ids = [registro.id for registro in banco.registros(categorias)]
+    cartones, orden = generar_partida(ids, banco.version_contenido(), 7, 3)
+    assert {banco.registro(pregunta_id).categoria for pregunta_id in orden} <= set(categorias)
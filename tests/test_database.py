@@ -0,0 +1,85 @@
+import sqlite3
+
+from services.database import Database
+
+
+def crear_base_antigua(ruta: str, filas) -> None:
+    """Esquema y formato de opciones (str(list)) anteriores a la migración"""
+    conn = sqlite3.connect(ruta)
+    conn.execute("""
+        CREATE TABLE questions (
+            id TEXT PRIMARY KEY,
+            question TEXT,
+            answer TEXT,
+            category TEXT,
+            options TEXT,
+            correct_answer INTEGER
+        )
+    """)
+    conn.executemany("INSERT INTO questions VALUES (?, ?, ?, ?, ?, ?)",
+                     [(id_, texto, respuesta, categoria, str(opciones), correcta)
+                      for id_, texto, respuesta, categoria, opciones, correcta in filas])
+    conn.commit()
+    conn.close()
+
+
+FILAS = [
+    ('q1', '¿Capital de Francia?', 'París', 'geografia', ['París', 'Roma', "L'Aquila"], 0),
+    ('q2', '¿2 + 2?', '4', 'matematicas', ['3', '4'], 1),
+    ('q3', '¿3 x 3?', '9', 'matematicas', ['9', '6', 'nueve "en letras"'], 0),
+]
+
+
+def test_migra_opciones_str_list_a_json(tmp_path):
+    ruta = str(tmp_path / 'antigua.db')
+    crear_base_antigua(ruta, FILAS)
+
+    db = Database(ruta)
+    try:
+        for id_, _, _, categoria, opciones, correcta in FILAS:
+            pregunta = db.get_question(id_)
+            assert pregunta['options'] == opciones
+            assert pregunta['category'] == categoria
+            assert pregunta['correct_answer'] == correcta
+        assert db.count_questions('matematicas') == 2
+        assert db.count_questions() == 3
+        assert db.get_categories() == ['geografia', 'matematicas']
+        assert {p['id'] for p in db.get_random_questions(3)} == {'q1', 'q2', 'q3'}
+    finally:
+        db.close()
+
+    # Abrir de nuevo una base ya migrada no cambia nada
+    db = Database(ruta)
+    try:
+        assert db.get_question('q1')['options'] == ['París', 'Roma', "L'Aquila"]
+        assert db.count_questions() == 3
+    finally:
+        db.close()
+
+
+def test_opciones_ilegibles_quedan_vacias(tmp_path):
+    ruta = str(tmp_path / 'antigua.db')
+    crear_base_antigua(ruta, [])
+    conn = sqlite3.connect(ruta)
+    conn.execute("INSERT INTO questions VALUES ('q1', '¿?', 'x', 'varios', '[sin comillas', 0)")
+    conn.commit()
+    conn.close()
+
+    db = Database(ruta)
+    try:
+        assert db.get_question('q1')['options'] == []
+        assert db.count_questions('varios') == 1
+    finally:
+        db.close()
+
+
+def test_guardar_pregunta_usa_json(tmp_path):
+    db = Database(str(tmp_path / 'nueva.db'))
+    try:
+        db.save_question({'id': 'q1', 'question': '¿?', 'answer': 'a', 'category': 'varios',
+                          'options': ['a', "b'c"], 'correct_answer': 0})
+        db.cursor.execute("SELECT options FROM questions WHERE id = 'q1'")
+        assert db.cursor.fetchone()[0] == '["a", "b\'c"]'
+        assert db.get_question('q1')['options'] == ['a', "b'c"]
+    finally:
+        db.close()
@@ -0,0 +1,40 @@
+from core.question_bank import huella_pregunta, indexar_huellas
+
+from conftest import escribir_categoria, pregunta
+
+
+ORIGINAL = {'pregunta': '¿Quién pintó la Mona Lisa?',
+            'opciones': ['Leonardo da Vinci', 'Picasso', 'Monet'],
+            'respuesta_correcta': 'Leonardo da Vinci'}
+# Misma pregunta con mayúsculas, acentos, espacios y orden de opciones distintos
+COPIA = {'pregunta': '  ¿quien PINTO la   Mona Lisa? ',
+         'opciones': ['monet', 'Leonardo  da Vinci', 'Picassó'],
+         'respuesta_correcta': 'monet'}
+
+
+def test_huella_ignora_formato_y_orden_de_opciones():
+    assert huella_pregunta(ORIGINAL) == huella_pregunta(COPIA)
+    assert huella_pregunta(ORIGINAL) != huella_pregunta(dict(ORIGINAL, opciones=['Leonardo da Vinci', 'Dalí', 'Monet']))
+
+
+def test_indexar_huellas_conserva_la_primera_aparicion():
+    duplicados = indexar_huellas({
+        'arte': [('a0', 'h1'), ('a1', 'h2'), ('a2', 'h1')],
+        'ciencia': [('c0', 'h2'), ('c1', 'h3')],
+    })
+    assert duplicados == {'a2': 'a0', 'c0': 'a1'}
+
+
+def test_el_banco_omite_las_copias_entre_categorias(banco):
+    escribir_categoria(banco.base_dir, 'arte', [ORIGINAL, pregunta("arte única")], archivo='extra.json')
+    escribir_categoria(banco.base_dir, 'ciencia', [COPIA, ORIGINAL], archivo='extra.json')
+    total = banco.total_preguntas()
+    banco.cargar(forzar=True)
+
+    assert banco.total_preguntas() == total + 2
+    assert banco.duplicados() == {'ciencia_extra.json_0': 'arte_extra.json_0',
+                                  'ciencia_extra.json_1': 'arte_extra.json_0'}
+    textos = [registro.pregunta for registro in banco.registros(['ciencia'])]
+    assert ORIGINAL['pregunta'] not in textos and COPIA['pregunta'] not in textos
+    # Las claves de las copias que llegan por la red se resuelven al canónico
+    assert banco.ids_por_claves(['ciencia_extra.json_0']) == banco.ids_por_claves(['arte_extra.json_0'])
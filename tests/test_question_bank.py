@@ -0,0 +1,47 @@
+import os
+
+from core.question_bank import QuestionBank
+
+from conftest import CATEGORIAS, PREGUNTAS_POR_CATEGORIA, escribir_categoria, pregunta
+
+
+def test_compila_todas_las_categorias(banco):
+    assert banco.categorias() == list(CATEGORIAS)
+    assert banco.conteos() == {categoria: PREGUNTAS_POR_CATEGORIA for categoria in CATEGORIAS}
+    registros = banco.registros()
+    # Ids enteros densos en orden de categoría
+    assert [registro.id for registro in registros] == list(range(len(registros)))
+    assert banco.registro(PREGUNTAS_POR_CATEGORIA).categoria == 'ciencia'
+
+
+def test_reutiliza_el_snapshot_sin_leer_las_fuentes(banco, monkeypatch):
+    otro = QuestionBank(banco.base_dir, banco.snapshot_path)
+
+    def no_parsear(*args, **kwargs):
+        raise AssertionError("el snapshot vigente no debería recompilarse")
+
+    monkeypatch.setattr(otro, '_parsear_categoria', no_parsear)
+    assert otro.version_contenido() == banco.version_contenido()
+    assert otro.registro(5).pregunta == banco.registro(5).pregunta == "arte 5"
+
+
+def test_cambiar_un_archivo_recompila_solo_su_categoria(banco, capsys):
+    version = banco.version_contenido()
+    preguntas = [pregunta(f"ciencia {i}", i % 4) for i in range(PREGUNTAS_POR_CATEGORIA + 5)]
+    ruta = escribir_categoria(banco.base_dir, 'ciencia', preguntas)
+    # Garantiza un mtime distinto aunque el sistema de archivos tenga poca resolución
+    stat = os.stat(ruta)
+    os.utime(ruta, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    capsys.readouterr()
+
+    banco.cargar(forzar=True)
+    assert "Compiladas 1 de 3 categorías" in capsys.readouterr().out
+    assert banco.conteos()['ciencia'] == PREGUNTAS_POR_CATEGORIA + 5
+    assert banco.version_contenido() != version
+
+
+def test_invalidar_revalida_el_disco(banco):
+    escribir_categoria(banco.base_dir, 'geografia', [pregunta("geografia 0")])
+    banco.invalidar()
+    assert 'geografia' in banco.categorias()
+    assert banco.conteos()['geografia'] == 1
@@ -0,0 +1,57 @@
+import io
+import json
+
+import pytest
+
+from core import question_stream
+from core.question_stream import iterar_preguntas, iterar_preguntas_json, iterar_preguntas_jsonl
+
+from conftest import escribir_categoria, pregunta
+
+
+def test_json_entrega_las_preguntas_en_orden():
+    preguntas = [pregunta(f"p {i}") for i in range(5)]
+    texto = json.dumps({'categoria': 'arte', 'meta': {'v': [1, 2]}, 'preguntas': preguntas})
+    assert list(iterar_preguntas_json(io.StringIO(texto))) == preguntas
+
+
+def test_json_con_bloques_pequenos(monkeypatch):
+    # Valores partidos entre bloques, incluido un número al final de uno
+    monkeypatch.setattr(question_stream, 'TAMANO_BLOQUE', 7)
+    preguntas = [dict(pregunta(f"p {i}"), dificultad=12345) for i in range(20)]
+    texto = json.dumps({'preguntas': preguntas, 'total': 20}, indent=2)
+    assert list(iterar_preguntas_json(io.StringIO(texto))) == preguntas
+
+
+def test_json_sin_preguntas():
+    assert list(iterar_preguntas_json(io.StringIO('{}'))) == []
+    assert list(iterar_preguntas_json(io.StringIO('{"preguntas": []}'))) == []
+
+
+def test_json_mal_formado():
+    with pytest.raises(ValueError):
+        list(iterar_preguntas_json(io.StringIO('{"preguntas": [{"pregunta": "a"} {"pregunta": "b"}]}')))
+
+
+def test_jsonl_omite_lineas_vacias_y_cabeceras():
+    lineas = [json.dumps({'categoria': 'arte'}), '', json.dumps(pregunta("a")), '   ', json.dumps(pregunta("b"))]
+    preguntas = list(iterar_preguntas_jsonl(io.StringIO('\n'.join(lineas))))
+    assert [p['pregunta'] for p in preguntas] == ["a", "b"]
+
+
+def test_jsonl_indica_la_linea_erronea():
+    with pytest.raises(ValueError, match="Línea 2"):
+        list(iterar_preguntas_jsonl(io.StringIO(json.dumps(pregunta("a")) + '\n{roto\n')))
+
+
+def test_elige_el_formato_por_extension(tmp_path):
+    preguntas = [pregunta(f"p {i}") for i in range(3)]
+    ruta_json = escribir_categoria(str(tmp_path), 'arte', preguntas)
+    ruta_jsonl = escribir_categoria(str(tmp_path), 'arte', preguntas, archivo='extra.jsonl')
+    assert list(iterar_preguntas(ruta_json)) == list(iterar_preguntas(ruta_jsonl)) == preguntas
+
+
+def test_el_banco_compila_archivos_jsonl(banco):
+    escribir_categoria(banco.base_dir, 'musica', [pregunta(f"musica {i}") for i in range(4)], archivo='musica.jsonl')
+    banco.cargar(forzar=True)
+    assert banco.conteos()['musica'] == 4
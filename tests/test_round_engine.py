@@ -0,0 +1,85 @@
+import random
+
+from core.card_generator import CardGenerator, preguntas_de_cartones
+from core.round_engine import EVENTO_FIN, EVENTO_RESPUESTA, VELOCIDADES, RoundEngine
+
+
+def preparar(banco, con_jugador=True, ias=3, probabilidad_ia=0.7, semilla=1, velocidad=VELOCIDADES["1x"]):
+    rng = random.Random(semilla)
+    cartones = CardGenerator((registro.id for registro in banco.registros()), rng=rng).generar_lote(ias + 1)
+    motor = RoundEngine(probabilidad_ia, rng=rng, banco=banco, velocidad=velocidad)
+    eventos = []
+    motor.suscribir(lambda tipo, datos: eventos.append((tipo, datos)))
+    jugador = cartones[0] if con_jugador else None
+    motor.repartir(jugador, cartones[1:], preguntas_de_cartones(cartones, rng), semilla)
+    return motor, eventos
+
+
+def esperar_turno(motor):
+    while motor.en_curso and motor._turno is None:
+        motor.tick(0.5)
+    return motor.pregunta_actual
+
+
+def test_partida_solo_ias_termina_con_ganador(banco):
+    for semilla in range(20):
+        motor, eventos = preparar(banco, con_jugador=False, semilla=semilla, velocidad=VELOCIDADES["instantanea"])
+        motor.iniciar()
+        assert not motor.en_curso
+        tipo, fin = eventos[-1]
+        assert tipo == EVENTO_FIN
+        numero = int(fin['ganador'].split('_')[1]) - 1
+        assert motor.cartones[numero].bingo() is fin['patron'] is not None
+
+
+def test_respuesta_solo_para_el_turno_abierto(banco):
+    motor, eventos = preparar(banco)
+    motor.iniciar(0)
+    pregunta_id = esperar_turno(motor)
+    correcta = banco.registro(pregunta_id).indice_correcto
+
+    assert motor.responder(pregunta_id, correcta) is True
+    # Doble toque: no vuelve a marcar ni programa otro sorteo
+    assert motor.responder(pregunta_id, correcta) is None
+    assert sum(1 for tipo, datos in eventos if tipo == EVENTO_RESPUESTA and datos['carton'] == 0) == 1
+    assert sum(1 for tarea in motor._tareas if tarea.activa and tarea.accion == motor.sortear) == 1
+
+
+def test_respuesta_tras_tiempo_agotado_se_ignora(banco):
+    motor, _ = preparar(banco)
+    motor.iniciar(0)
+    pregunta_id = esperar_turno(motor)
+    motor.tick(motor.tiempo_jugador)
+    carton = motor.carton_jugador
+    assert carton.respondida(pregunta_id) and carton.aciertos() == 0
+
+    assert motor.responder(pregunta_id, banco.registro(pregunta_id).indice_correcto) is None
+    assert carton.aciertos() == 0
+
+
+def test_cantar_bingo(banco):
+    motor, eventos = preparar(banco, probabilidad_ia=0.0)
+    motor.iniciar(0)
+    assert not motor.cantar_bingo()
+    while motor.carton_jugador.bingo() is None:
+        pregunta_id = esperar_turno(motor)
+        assert motor.en_curso
+        motor.responder(pregunta_id, banco.registro(pregunta_id).indice_correcto)
+
+    assert motor.cantar_bingo()
+    tipo, fin = eventos[-1]
+    assert tipo == EVENTO_FIN and fin['ganador'] == 'player'
+    assert not motor.en_curso
+
+
+def test_velocidad_acorta_la_partida(banco):
+    tiempos = {}
+    for velocidad in ("1x", "4x"):
+        motor, _ = preparar(banco, con_jugador=False, velocidad=VELOCIDADES[velocidad])
+        motor.iniciar()
+        pasos = 0
+        while motor.en_curso:
+            motor.tick(0.25)
+            pasos += 1
+        tiempos[velocidad] = pasos
+    assert tiempos["4x"] * 3 < tiempos["1x"]
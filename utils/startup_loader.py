@@ -0,0 +1,107 @@
+"""
+Cargador de arranque para Bingo Educativo
+Ejecuta en un hilo de fondo el trabajo real de inicio (banco de preguntas,
+sonidos e imágenes) y publica el progreso en el hilo principal
+"""
+import threading
+from functools import partial
+from typing import Any, Callable, List, Optional, Tuple
+from kivy.clock import Clock
+from kivy.core.image import ImageLoader
+
+from utils.performance_optimizer import optimizer
+
+# (nombre, función en segundo plano, peso, función en el hilo principal)
+Tarea = Tuple[str, Callable[[], Any], float, Optional[Callable[[Any], None]]]
+
+
+class StartupLoader:
+    """
+    Ejecuta las tareas de arranque en orden dentro de un hilo daemon.
+
+    Cada tarea puede tener un `al_terminar` que recibe el resultado en el hilo
+    principal, para lo que no se puede hacer fuera de él (crear texturas,
+    asignar propiedades de widgets). Los suscriptores reciben
+    (progreso 0-100, completado) siempre desde el hilo principal.
+    """
+
+    def __init__(self):
+        self._tareas: List[Tarea] = []
+        self._suscriptores: List[Callable[[int, bool], None]] = []
+        self._hilo: Optional[threading.Thread] = None
+        self.progreso = 0
+        self.completado = False
+        self.errores: List[str] = []
+
+    def agregar_tarea(self, nombre: str, funcion: Callable[[], Any], peso: float = 1.0,
+                      al_terminar: Optional[Callable[[Any], None]] = None) -> None:
+        """Registra una tarea; debe llamarse antes de iniciar()"""
+        self._tareas.append((nombre, funcion, peso, al_terminar))
+
+    def suscribir(self, callback: Callable[[int, bool], None]) -> None:
+        """Suscribe un callback de progreso y lo llama con el estado actual"""
+        if callback not in self._suscriptores:
+            self._suscriptores.append(callback)
+        callback(self.progreso, self.completado)
+
+    def desuscribir(self, callback: Callable[[int, bool], None]) -> None:
+        """Desuscribe un callback de progreso"""
+        if callback in self._suscriptores:
+            self._suscriptores.remove(callback)
+
+    def iniciar(self) -> None:
+        """Arranca el hilo de carga (solo la primera vez)"""
+        if self._hilo is not None:
+            return
+        self._hilo = threading.Thread(target=self._ejecutar, daemon=True)
+        self._hilo.start()
+
+    def _ejecutar(self) -> None:
+        """Cuerpo del hilo de carga"""
+        total = sum(peso for _, _, peso, _ in self._tareas) or 1
+        hecho = 0.0
+        for nombre, funcion, peso, al_terminar in self._tareas:
+            try:
+                resultado = funcion()
+            except Exception as e:
+                print(f"[ERROR] Falló la tarea de arranque '{nombre}': {e}")
+                self.errores.append(nombre)
+                resultado, al_terminar = None, None
+            hecho += peso
+            Clock.schedule_once(partial(self._avanzar, int(hecho * 100 / total), al_terminar, resultado))
+        Clock.schedule_once(self._finalizar)
+
+    def _avanzar(self, progreso: int, al_terminar: Optional[Callable[[Any], None]], resultado: Any, dt) -> None:
+        """Aplica el resultado de una tarea en el hilo principal"""
+        if al_terminar:
+            try:
+                al_terminar(resultado)
+            except Exception as e:
+                print(f"[ERROR] Error al aplicar resultado de arranque: {e}")
+        self.progreso = min(progreso, 99)
+        self._notificar()
+
+    def _finalizar(self, dt) -> None:
+        """Marca la carga como completa"""
+        self.progreso = 100
+        self.completado = True
+        print(f"[DEBUG] Carga de arranque completada ({len(self.errores)} errores)")
+        self._notificar()
+
+    def _notificar(self) -> None:
+        for callback in list(self._suscriptores):
+            try:
+                callback(self.progreso, self.completado)
+            except Exception as e:
+                print(f"[ERROR] Error en callback de progreso: {e}")
+
+
+def decodificar_imagen(ruta: str) -> Any:
+    """Decodifica una imagen sin tocar OpenGL (seguro fuera del hilo principal)"""
+    return ImageLoader.load(ruta, keep_data=True)
+
+
+def registrar_textura(ruta: str, imagen: Any) -> None:
+    """Sube a GPU una imagen decodificada y la guarda en el cache de texturas"""
+    if imagen is not None:
+        optimizer.texture_cache[ruta] = imagen.texture